@@ -1,11 +1,142 @@
-from flask import Flask, render_template, jsonify, request, session
+from flask import Flask, render_template, jsonify, request, session, url_for
+from functools import lru_cache
+from jinja2 import FileSystemBytecodeCache
 from game_logic.character import Character
 from game_logic.battle import Battle
+from game_logic.battle_state import CharacterState
+from game_logic.batch import MAX_BATCH_ACTIONS, create_battles, run_batch
+from game_logic.catalog import CATALOGS
 from game_logic.character_templates import CHARACTER_TEMPLATES
+from game_logic.items import usable_items
+from game_logic.messages import MESSAGE_TEMPLATES
+from game_logic.policies import DEFAULT_HEAL_THRESHOLD, auto_battle, make_policy
+from game_logic.session_state import encode_player, decode_player, encode_battle, decode_battle
+from game_logic.persistence import SQLiteBattleStore, SQLiteProgressStore, WriteBehindQueue
+from game_logic.pvp import PvPServer, validate_action
+from json_provider import FastJSONProvider
+from response_cache import PrecomputedResponse
+import atexit
+import hashlib
 import os
+import re
+import uuid
+from datetime import timedelta
+
+def _load_secret_key(instance_path):
+    """
+    Get the session signing key, stable across restarts.
+    SECRET_KEY from the environment wins; otherwise a key is generated once
+    and kept in SECRET_KEY_FILE (default: secret_key in the instance folder).
+    
+    Args:
+        instance_path (str): Flask instance folder
+        
+    Returns:
+        str: The signing key
+    """
+    key = os.environ.get('SECRET_KEY')
+    if key:
+        return key
+    path = os.environ.get('SECRET_KEY_FILE') or os.path.join(instance_path, 'secret_key')
+    try:
+        with open(path) as f:
+            return f.read().strip()
+    except FileNotFoundError:
+        pass
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    key = os.urandom(32).hex()
+    try:
+        # O_EXCL: if another worker created the file first, use its key
+        fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+    except FileExistsError:
+        with open(path) as f:
+            return f.read().strip()
+    with os.fdopen(fd, 'w') as f:
+        f.write(key)
+    return key
 
 app = Flask(__name__)
-app.secret_key = os.urandom(24)
+app.config['SECRET_KEY'] = _load_secret_key(app.instance_path)
+# Sessions carry the player id, so they outlive the browser session
+app.config['PERMANENT_SESSION_LIFETIME'] = timedelta(days=365)
+app.json = FastJSONProvider(app)
+# Static URLs carry a content fingerprint (see asset_url), so browsers may cache them for a year
+app.config['SEND_FILE_MAX_AGE_DEFAULT'] = 365 * 24 * 3600
+# Compiled templates are shared between worker processes through the filesystem
+app.jinja_env.bytecode_cache = FileSystemBytecodeCache(os.environ.get('TEMPLATE_CACHE_DIR'))
+
+# Character progression outlives the session; writes are batched off the request path
+progress = WriteBehindQueue(SQLiteProgressStore(os.environ.get('PROGRESS_DB', 'progress.db')))
+atexit.register(progress.close)
+
+# Server-side battles driven through the batch API
+battle_store = SQLiteBattleStore(os.environ.get('BATTLE_DB', 'battles.db'))
+atexit.register(battle_store.close)
+
+# Player-versus-player matches, resolved by sharded single-writer threads
+pvp_server = PvPServer()
+atexit.register(pvp_server.close)
+# Longest time a PvP poll waits for the next result, in seconds
+PVP_POLL_TIMEOUT = 25.0
+
+# Catalogs are static, so each is encoded, hashed and compressed once at startup
+CATALOG_RESPONSES = {
+    name: PrecomputedResponse(app.json.dumps_bytes(build()), 'application/json')
+    for name, build in CATALOGS.items()
+}
+# Template name -> page rendered on first request, then served from memory
+_pages = {}
+
+@lru_cache(maxsize=None)
+def _asset_fingerprint(filename):
+    """Hash a static file's content, once per process."""
+    with open(os.path.join(app.static_folder, filename), 'rb') as f:
+        return hashlib.sha256(f.read()).hexdigest()[:12]
+
+@app.template_global()
+def asset_url(filename):
+    """Get a static file URL fingerprinted with the file's content hash."""
+    return url_for('static', filename=filename, v=_asset_fingerprint(filename))
+
+def _cached_page(template, **context):
+    """
+    Serve a page that renders the same for every client.
+    
+    Args:
+        template (str): Template name
+        **context: Template context, only used for the first render
+        
+    Returns:
+        flask.Response: The page, or a 304 if the client's copy is current
+    """
+    page = _pages.get(template)
+    if page is None:
+        html = render_template(template, **context)
+        # Threads racing on the first render all serve the page that was stored first
+        page = _pages.setdefault(template, PrecomputedResponse(html.encode(), 'text/html', cache_control='no-cache'))
+    return page.respond(request, app.response_class)
+
+# Player ids are random 128-bit hex tokens
+PLAYER_ID_PATTERN = re.compile(r'[0-9a-f]{32}')
+
+def _player_id():
+    """
+    Get this client's player id, assigning one on first use.
+    The id is also returned by /select_character, so a client that lost its
+    cookie can restore its progress by sending it back.
+    """
+    if 'player_id' not in session:
+        session['player_id'] = uuid.uuid4().hex
+        session.permanent = True
+    return session['player_id']
+
+def _progress_key(character_type):
+    """Get the progression key for this client's character of a given type."""
+    return f"{_player_id()}:{character_type}"
+
+def _client_locale():
+    """Pick the battle log locale from the client's Accept-Language header."""
+    return request.accept_languages.best_match(MESSAGE_TEMPLATES.keys()) or 'en'
 
 @app.route('/')
 def index():
@@ -16,48 +147,113 @@ def index():
     # Clear any existing battle state when returning to character selection
     if 'battle_state' in session:
         del session['battle_state']
-    return render_template('index.html', characters=CHARACTER_TEMPLATES)
+    return _cached_page('index.html', characters=CHARACTER_TEMPLATES)
+
+@app.route('/api/catalog/<name>')
+def catalog(name):
+    """
+    Serve a read-only game catalog (templates, enemies, skills, spells or items).
+    Responses carry a strong ETag, so unchanged catalogs cost a 304.
+    
+    Returns:
+        json: The catalog, or a 404 error for unknown catalog names
+    """
+    cached = CATALOG_RESPONSES.get(name)
+    if cached is None:
+        return jsonify({'error': 'Unknown catalog'}), 404
+    return cached.respond(request, app.response_class)
 
 @app.route('/select_character', methods=['POST'])
 def select_character():
     """
     Handle character selection and create a new character instance.
     The selected character's stats are loaded from templates and stored in session.
+    An optional player_id field restores the progress saved under that id,
+    e.g. after the session cookie was lost.
     
     Returns:
-        redirect: Redirects to battle page after character creation
+        json: The character and the client's player id
     """
     character_type = request.form.get('character_type')
     if character_type not in CHARACTER_TEMPLATES:
         return jsonify({'error': 'Invalid character type'}), 400
+    claimed_id = request.form.get('player_id')
+    if claimed_id:
+        if not PLAYER_ID_PATTERN.fullmatch(claimed_id):
+            return jsonify({'error': 'Invalid player id'}), 400
+        session['player_id'] = claimed_id
+        session.permanent = True
     
-    char_data = CHARACTER_TEMPLATES[character_type]
-    player = Character(
-        char_data['name'],
-        char_data['hp'],
-        char_data['mp'],
-        char_data['strength'],
-        char_data['defense'],
-        char_data['magic'],
-        char_data['magic_defense'],
-        char_data['agility'],
-        char_data['luck']
-    )
-    
-    # Set abilities from template
-    player.abilities = char_data['abilities']
-    player.skills = char_data['skills']
-    player.black_magic = char_data['black_magic']
-    player.white_magic = char_data['white_magic']
-    
-    session['player'] = player.to_dict()
-    return jsonify({'success': True, 'character': player.to_dict()})
+    # Resume saved progression for this character type, fully rested
+    saved = progress.load(_progress_key(character_type))
+    if saved:
+        player = decode_player(saved)
+        player.current_hp = player.max_hp
+        player.current_mp = player.max_mp
+    else:
+        player = Character.from_template(character_type)
+    
+    session['player'] = encode_player(player)
+    return jsonify({'success': True, 'character': player.to_dict(), 'player_id': _player_id()})
 
 @app.route('/battle')
 def battle():
+    """
+    Serve the battle screen shell.
+    The page is the same for every player; battle.js fills it in from /battle/bootstrap.
+    """
+    if 'player' not in session:
+        return jsonify({'error': 'No character selected'}), 400
+    return _cached_page('battle.html')
+
+@app.route('/battle/bootstrap')
+def battle_bootstrap():
+    """
+    Get the data the battle screen needs before the battle starts.
+    
+    Returns:
+        json: The player's current state and the actions for each battle menu
+    """
+    if 'player' not in session:
+        return jsonify({'error': 'No character selected'}), 400
+    player = decode_player(session['player'])
+    return jsonify({
+        'player': CharacterState.from_character(player),
+        'actions': {
+            'abilities': player.abilities,
+            'skills': player.skills,
+            'black_magic': player.black_magic,
+            'white_magic': player.white_magic,
+            'items': usable_items(player)
+        }
+    })
+
+@app.route('/equip', methods=['POST'])
+def equip():
+    """
+    Equip an item from the player's inventory, or empty a slot.
+    Expects JSON {"item": str} or {"unequip": slot}; not allowed during a battle.
+    
+    Returns:
+        json: The updated character
+    """
     if 'player' not in session:
         return jsonify({'error': 'No character selected'}), 400
-    return render_template('battle.html', player=session['player'])
+    if 'battle_state' in session:
+        return jsonify({'error': 'Cannot change equipment during a battle'}), 400
+    
+    data = request.get_json(silent=True) or {}
+    player = decode_player(session['player'])
+    if 'unequip' in data:
+        changed = player.unequip(data['unequip'])
+    else:
+        changed = player.equip(data.get('item'))
+    if not changed:
+        return jsonify({'error': 'Cannot equip that item'}), 400
+    
+    session['player'] = encode_player(player)
+    progress.put(_progress_key(player.template_key), session['player'])
+    return jsonify({'success': True, 'character': CharacterState.from_character(player)})
 
 @app.route('/start_battle', methods=['POST'])
 def start_battle():
@@ -71,25 +267,42 @@ def start_battle():
     if 'player' not in session:
         return jsonify({'error': 'No character selected'}), 400
     
-    player = Character.from_dict(session['player'])
+    player = decode_player(session['player'])
     battle = Battle(player)
+    battle.locale = _client_locale()
     battle_state = battle.start_battle()
     
-    # Store both battle state and enemy state in session
-    session['battle_state'] = {
-        'turn': battle_state['turn'],
-        'battle_log': battle_state['battle_log'],
-        'enemy': battle_state['enemy']
-    }
+    # Store only enemy references and mutable values in the session
+    session['battle_state'] = encode_battle(battle)
     
     return jsonify(battle_state)
 
+def _save_battle(battle):
+    """
+    Store a battle's progress in the session and queue the player's progression.
+    A finished battle is dropped from the session so it cannot be resumed.
+    
+    Args:
+        battle (Battle): Battle after the request's turns
+    """
+    session['player'] = encode_player(battle.player)
+    if battle.battle_over:
+        del session['battle_state']
+    else:
+        session['battle_state'] = encode_battle(battle)
+    
+    # Queue progression; it is written at battle end or on the flush interval
+    progress.put(_progress_key(battle.player.template_key), session['player'])
+    if battle.battle_over:
+        progress.request_flush()
+
 @app.route('/battle_action', methods=['POST'])
 def battle_action():
     """
     Process a battle action from the player.
     Handles various action types (attack, defend, abilities, magic)
-    and updates the battle state accordingly.
+    and updates the battle state accordingly. Once the battle is over it
+    leaves the session, and further actions are rejected with 400.
     
     Returns:
         json: Updated battle state after the action is processed
@@ -102,33 +315,217 @@ def battle_action():
         return jsonify({'error': 'Invalid action data', 'battle_over': True}), 400
     
     try:
-        player = Character.from_dict(session['player'])
+        player = decode_player(session['player'])
         
-        # Recreate battle state from session
-        battle = Battle(player)
-        battle.turn = session['battle_state']['turn']
-        battle.battle_log = session['battle_state']['battle_log']
-        battle.enemy = Character.from_dict(session['battle_state']['enemy'])
+        # Recreate battle state from session; the log only holds this turn's entries
+        battle = decode_battle(session['battle_state'], player)
+        battle.locale = _client_locale()
         
         result = battle.process_turn(action)
-        
-        # Update session with new battle state
-        session['player'] = result['player']
-        session['battle_state'] = {
-            'turn': result['turn'],
-            'battle_log': result['battle_log'],
-            'enemy': result['enemy']
-        }
-        
+        _save_battle(battle)
         return jsonify(result)
-    except Exception as e:
-        # Log the error for debugging
-        print(f"Error in battle_action: {str(e)}")
+    except Exception:
+        app.logger.exception("Error in battle_action")
         # Return a JSON response even in case of error
         return jsonify({
             'error': 'An error occurred during battle',
             'battle_over': True
         }), 500
 
+@app.route('/auto_battle', methods=['POST'])
+def auto_battle_action():
+    """
+    Fast-forward the current battle with a policy until it ends.
+    Expects JSON {"policy": "attack" | "heal" | "strongest_spell",
+    "heal_threshold": float, "log": bool}; all fields are optional.
+    
+    A finished battle leaves the session, so it cannot be fast-forwarded again.
+    
+    Returns:
+        json: Battle state with a summary, and a condensed battle log when requested
+    """
+    if 'player' not in session or 'battle_state' not in session:
+        return jsonify({'error': 'No active battle', 'battle_over': True}), 400
+    
+    options = request.get_json(silent=True) or {}
+    try:
+        policy = make_policy(options.get('policy', 'attack'),
+                             float(options.get('heal_threshold', DEFAULT_HEAL_THRESHOLD)))
+    except (TypeError, ValueError) as e:
+        return jsonify({'error': str(e)}), 400
+    
+    try:
+        player = decode_player(session['player'])
+        battle = decode_battle(session['battle_state'], player)
+        summary = auto_battle(battle, policy)
+        _save_battle(battle)
+        
+        return jsonify({
+            'player': CharacterState.from_character(battle.player),
+            'enemy': CharacterState.from_character(battle.enemy),
+            'turn': battle.turn,
+            'battle_log': battle.battle_log.condensed(locale=_client_locale()) if options.get('log') else [],
+            'battle_over': battle.battle_over,
+            'victory': battle.victory,
+            'summary': summary
+        })
+    except Exception:
+        app.logger.exception("Error in auto_battle")
+        # Return a JSON response even in case of error
+        return jsonify({
+            'error': 'An error occurred during battle',
+            'battle_over': True
+        }), 500
+
+@app.route('/api/battles', methods=['POST'])
+def create_battle_batch():
+    """
+    Start server-side battles for the batch API.
+    Expects JSON {"character_type": str, "count": int}.
+    
+    Returns:
+        json: {"battles": {battle_id: initial battle state}}
+    """
+    data = request.get_json(silent=True) or {}
+    character_type = data.get('character_type')
+    count = data.get('count', 1)
+    if character_type not in CHARACTER_TEMPLATES:
+        return jsonify({'error': 'Invalid character type'}), 400
+    if not isinstance(count, int) or not 1 <= count <= MAX_BATCH_ACTIONS:
+        return jsonify({'error': f'count must be between 1 and {MAX_BATCH_ACTIONS}'}), 400
+    
+    return jsonify({'battles': create_battles(battle_store, character_type, count, _client_locale())})
+
+@app.route('/api/battles/actions', methods=['POST'])
+def battle_action_batch():
+    """
+    Process many battle actions in one request and one store transaction.
+    Expects JSON {"actions": [[battle_id, action], ...]}, where action has
+    the same form as for /battle_action.
+    
+    Returns:
+        json: {"results": [...]} with one diff per action, in order
+    """
+    data = request.get_json(silent=True) or {}
+    actions = data.get('actions')
+    if (not isinstance(actions, list) or not actions
+            or not all(isinstance(pair, list) and len(pair) == 2 and isinstance(pair[0], str) and isinstance(pair[1], dict)
+                        for pair in actions)):
+        return jsonify({'error': 'actions must be a list of [battle_id, action] pairs'}), 400
+    if len(actions) > MAX_BATCH_ACTIONS:
+        return jsonify({'error': f'At most {MAX_BATCH_ACTIONS} actions per batch'}), 400
+    
+    return jsonify({'results': run_batch(battle_store, actions, _client_locale())})
+
+def _pvp_match():
+    """
+    Look up the PvP match of the request and this client's side in it.
+    
+    Returns:
+        tuple: (match, side), or (None, error response) if the match is unknown
+            or the client does not play in it
+    """
+    match = pvp_server.get_match(request.view_args['match_id'])
+    if match is None:
+        return None, (jsonify({'error': 'Unknown match'}), 404)
+    side = match.side_of(_player_id())
+    if side is None:
+        return None, (jsonify({'error': 'Not a participant of this match'}), 403)
+    return match, side
+
+@app.route('/api/pvp', methods=['POST'])
+def create_pvp_match():
+    """
+    Open a PvP match with the session's character.
+    Another client joins it through /api/pvp/<match_id>/join.
+    
+    Returns:
+        json: The match id and the host's side
+    """
+    if 'player' not in session:
+        return jsonify({'error': 'No character selected'}), 400
+    match = pvp_server.create_match(_player_id(), decode_player(session['player']), _client_locale())
+    return jsonify(match.view('player'))
+
+@app.route('/api/pvp/<match_id>/join', methods=['POST'])
+def join_pvp_match(match_id):
+    """
+    Join an open PvP match as the challenger with the session's character.
+    
+    Returns:
+        json: The challenger's view of the started match, or a 409 error if
+            someone else joined first
+    """
+    if 'player' not in session:
+        return jsonify({'error': 'No character selected'}), 400
+    match = pvp_server.get_match(match_id)
+    if match is None:
+        return jsonify({'error': 'Unknown match'}), 404
+    player_id = _player_id()
+    if match.participants['player'] == player_id:
+        return jsonify({'error': 'Cannot join your own match'}), 400
+    
+    pvp_server.join(match, player_id, decode_player(session['player']), _client_locale())
+    match.wait(0, PVP_POLL_TIMEOUT)
+    if match.side_of(player_id) != 'enemy':
+        return jsonify({'error': 'Match already started'}), 409
+    return jsonify(match.view('enemy'))
+
+@app.route('/api/pvp/<match_id>/action', methods=['POST'])
+def pvp_action(match_id):
+    """
+    Commit this client's action for the current round.
+    Expects the same action JSON as /battle_action. The round resolves once
+    both sides committed or its timeout runs out; poll /api/pvp/<match_id>
+    for the result. Actions the side's character cannot take (skills or
+    spells it does not know or cannot afford, items it does not hold) are
+    rejected with 400.
+    
+    Returns:
+        json: {"committed": true} once the action is queued
+    """
+    match, side = _pvp_match()
+    if match is None:
+        return side
+    latest = match.latest(side)
+    if latest is None:
+        return jsonify({'error': 'Match has not started'}), 409
+    action = request.get_json(silent=True)
+    error = validate_action(action, latest.player)
+    if error:
+        return jsonify({'error': error}), 400
+    pvp_server.commit(match, _player_id(), action)
+    return jsonify({'committed': True, 'version': match.version})
+
+@app.route('/api/pvp/<match_id>/forfeit', methods=['POST'])
+def pvp_forfeit(match_id):
+    """
+    Give up a PvP match.
+    
+    Returns:
+        json: {"forfeited": true} once the forfeit is queued
+    """
+    match, side = _pvp_match()
+    if match is None:
+        return side
+    pvp_server.forfeit(match, _player_id())
+    return jsonify({'forfeited': True})
+
+@app.route('/api/pvp/<match_id>')
+def pvp_poll(match_id):
+    """
+    Long-poll a PvP match for results newer than ?since=<version>.
+    Waits up to PVP_POLL_TIMEOUT seconds for the next round to resolve.
+    
+    Returns:
+        json: This client's view of the match with the log entries since that version
+    """
+    match, side = _pvp_match()
+    if match is None:
+        return side
+    since = request.args.get('since', 0, type=int)
+    match.wait(since, PVP_POLL_TIMEOUT)
+    return jsonify(match.view(side, since))
+
 if __name__ == '__main__':
     app.run(debug=True) 
\ No newline at end of file
@@ -0,0 +1,54 @@
+"""
+Benchmark elemental affinity resolution for batches of hits.
+
+Compares resolving each hit through the enemy database dicts with the
+compiled affinity matrix, per hit and through apply_affinities (which uses
+NumPy when it is installed).
+
+Usage:
+    python benchmarks/bench_affinities.py
+"""
+
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from game_logic.affinities import (
+    AFFINITY_MATRIX, AFFINITY_MULTIPLIERS, ELEMENTS, ELEMENT_COLUMNS, ENEMY_ROWS,
+    apply_affinities, numpy
+)
+from game_logic.enemy_database import ENEMY_DATABASE
+
+HITS = 1_000_000
+
+def dict_lookups(names, elements, damages):
+    return [
+        int(AFFINITY_MULTIPLIERS[ENEMY_DATABASE[name].get('affinities', {}).get(element, 'normal')] * damage)
+        for name, element, damage in zip(names, elements, damages)
+    ]
+
+def matrix_per_hit(rows, columns, damages):
+    width = len(ELEMENTS)
+    return [int(AFFINITY_MATRIX[row * width + column] * damage) for row, column, damage in zip(rows, columns, damages)]
+
+def bench(label, resolve, *args):
+    start = time.perf_counter()
+    resolve(*args)
+    elapsed = time.perf_counter() - start
+    print(f"{label:<24} {HITS / elapsed:>12,.0f} hits/s")
+
+if __name__ == '__main__':
+    rng = random.Random(0)
+    names = [rng.choice(list(ENEMY_DATABASE)) for _ in range(HITS)]
+    elements = [rng.choice(ELEMENTS) for _ in range(HITS)]
+    damages = [rng.randint(1, 999) for _ in range(HITS)]
+    rows = [ENEMY_ROWS[name] for name in names]
+    columns = [ELEMENT_COLUMNS[element] for element in elements]
+    bench("dict lookups", dict_lookups, names, elements, damages)
+    bench("matrix per hit", matrix_per_hit, rows, columns, damages)
+    if numpy is not None:
+        rows, columns, damages = numpy.array(rows), numpy.array(columns), numpy.array(damages)
+    bench(f"apply_affinities ({'numpy' if numpy is not None else 'python'})", apply_affinities, rows, columns, damages)
@@ -0,0 +1,53 @@
+"""
+Benchmark encounter draws per second.
+
+Compares the default encounter table with a synthetic table of hundreds of
+formations to show that alias-table sampling does not slow down as the
+table grows.
+
+Usage:
+    python benchmarks/bench_encounters.py
+"""
+
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from game_logic.encounters import DEFAULT_ENCOUNTERS, EncounterTable, RARITY_WEIGHTS
+from game_logic.enemy_database import ENEMY_DATABASE
+
+DRAWS = 500_000
+
+def synthetic_formations(count, rng):
+    """Build a large table of random formations over the enemy database."""
+    names = list(ENEMY_DATABASE)
+    rarities = list(RARITY_WEIGHTS)
+    formations = []
+    for _ in range(count):
+        low = rng.randint(1, 90)
+        formations.append({
+            'enemies': tuple(rng.choice(names) for _ in range(rng.randint(1, 4))),
+            'weight': rng.randint(1, 20),
+            'rarity': rng.choice(rarities),
+            'levels': (low, rng.randint(low, 99)),
+            'regions': ('field',)
+        })
+    return formations
+
+def bench(label, table, level):
+    rng = random.Random(0)
+    start = time.perf_counter()
+    for _ in range(DRAWS):
+        table.draw(level, 'field', rng)
+    elapsed = time.perf_counter() - start
+    print(f"{label:<32} {DRAWS / elapsed:>12,.0f} draws/s")
+
+if __name__ == '__main__':
+    bench("default table", DEFAULT_ENCOUNTERS, 5)
+    rng = random.Random(1)
+    for count in (100, 500, 2000):
+        table = EncounterTable(synthetic_formations(count, rng))
+        bench(f"synthetic, {count} formations", table, 50)
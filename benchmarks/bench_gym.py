@@ -0,0 +1,61 @@
+"""
+Benchmark the training environments' step throughput.
+
+Steps the single-battle environment, the in-process vector environment and
+the subprocess vector environment with random valid actions, reporting
+environment steps per second. Subprocesses only help with more than one
+core available.
+
+Usage:
+    python benchmarks/bench_gym.py
+"""
+
+import multiprocessing
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from game_logic.gym_env import BattleEnv, SubprocVecBattleEnv, VecBattleEnv
+
+STEPS = 50_000
+NUM_ENVS = 64
+CHARACTER_TYPE = 'mage'
+
+def random_actions(rng, infos):
+    return [rng.choice([index for index, valid in enumerate(info['action_mask']) if valid]) for info in infos]
+
+def bench_single():
+    env = BattleEnv(CHARACTER_TYPE, seed=1)
+    rng = random.Random(1)
+    _, info = env.reset()
+    start = time.perf_counter()
+    for _ in range(STEPS):
+        _, _, terminated, truncated, info = env.step(random_actions(rng, [info])[0])
+        if terminated or truncated:
+            _, info = env.reset()
+    elapsed = time.perf_counter() - start
+    print(f"{'BattleEnv':<28} {STEPS / elapsed:>12,.0f} steps/s")
+
+def bench_vec(label, env):
+    rng = random.Random(1)
+    _, infos = env.reset()
+    rounds = STEPS // env.num_envs
+    start = time.perf_counter()
+    for _ in range(rounds):
+        infos = env.step(random_actions(rng, infos))[4]
+    elapsed = time.perf_counter() - start
+    print(f"{label:<28} {rounds * env.num_envs / elapsed:>12,.0f} steps/s")
+
+if __name__ == '__main__':
+    print(f"{multiprocessing.cpu_count()} CPUs, {NUM_ENVS} environments")
+    bench_single()
+    bench_vec('VecBattleEnv', VecBattleEnv(NUM_ENVS, CHARACTER_TYPE, seed=1))
+    for num_workers in (1, 2, 4):
+        env = SubprocVecBattleEnv(NUM_ENVS, num_workers, CHARACTER_TYPE, seed=1)
+        try:
+            bench_vec(f"SubprocVecBattleEnv x{num_workers}", env)
+        finally:
+            env.close()
@@ -0,0 +1,72 @@
+"""
+Benchmark response encoding of battle states.
+
+Compares the old path (nested dicts from to_dict encoded with the standard
+library, as jsonify did) with FastJSONProvider encoding BattleState
+directly, reporting bytes/s and p99 encode time. The typical state carries
+one turn of log entries; the long one carries a full long battle's log.
+
+Usage:
+    python benchmarks/bench_json.py
+"""
+
+import dataclasses
+import json
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from flask import Flask
+from game_logic.battle import Battle
+from game_logic.character import Character
+from game_logic.journal import NullJournal
+from json_provider import FastJSONProvider, orjson
+
+ITERATIONS = 20_000
+
+def battle_state(turns):
+    """Play a battle for up to turns turns and return its latest state."""
+    player = Character.from_template('warrior')
+    player.level_up(30)
+    battle = Battle(player, journal=NullJournal(), seed=7)
+    battle.enemy.current_hp = battle.enemy.max_hp = 10 ** 6
+    battle.start_battle()
+    for _ in range(turns - 1):
+        battle.take_turn({'type': 'basic', 'name': 'attack'})
+    if turns > 1:
+        # Send the whole log, as a client reconnecting to the battle would get
+        battle._log_cursor = 0
+    return battle.process_turn({'type': 'basic', 'name': 'attack'})
+
+def as_dict(obj):
+    """Shallow field copy, like the to_dict calls the old state was built from."""
+    return {field.name: getattr(obj, field.name) for field in dataclasses.fields(obj)}
+
+def stdlib_encode(state):
+    """The previous jsonify path: nested dicts through the standard encoder."""
+    data = as_dict(state)
+    data['player'] = as_dict(state.player)
+    data['enemy'] = as_dict(state.enemy)
+    return json.dumps(data, separators=(',', ':')).encode()
+
+def bench(label, encode, state):
+    timings = []
+    size = 0
+    for _ in range(ITERATIONS):
+        start = time.perf_counter()
+        size = len(encode(state))
+        timings.append(time.perf_counter() - start)
+    timings.sort()
+    p99 = timings[int(len(timings) * 0.99)]
+    rate = size * len(timings) / sum(timings)
+    print(f"{label:<28} {size:>8} B {rate / 1e6:>10.1f} MB/s   p99 {p99 * 1e6:>8.1f} us")
+
+if __name__ == '__main__':
+    provider = FastJSONProvider(Flask(__name__))
+    print(f"orjson available: {orjson is not None}")
+    for name, turns in (('typical', 1), ('long battle', 200)):
+        state = battle_state(turns)
+        bench(f"{name}, stdlib dicts", stdlib_encode, state)
+        bench(f"{name}, fast provider", provider.dumps_bytes, state)
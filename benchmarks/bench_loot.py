@@ -0,0 +1,35 @@
+"""
+Benchmark loot resolution throughput.
+
+Compares rolling drops one battle outcome at a time with the batch
+tally_drops path used by economy simulations.
+
+Usage:
+    python benchmarks/bench_loot.py
+"""
+
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from game_logic.enemy_database import ENEMY_DATABASE
+from game_logic.loot import resolve_drops, tally_drops
+
+DEFEATS_PER_ENEMY = 400_000
+
+def bench(label, resolve):
+    rng = random.Random(0)
+    start = time.perf_counter()
+    resolve(rng)
+    elapsed = time.perf_counter() - start
+    draws = DEFEATS_PER_ENEMY * len(ENEMY_DATABASE)
+    print(f"{label:<24} {draws / elapsed:>12,.0f} draws/s")
+
+if __name__ == '__main__':
+    defeats = {enemy_name: DEFEATS_PER_ENEMY for enemy_name in ENEMY_DATABASE}
+    outcomes = [enemy_name for enemy_name in ENEMY_DATABASE for _ in range(DEFEATS_PER_ENEMY)]
+    bench("per-outcome rolls", lambda rng: resolve_drops(outcomes, rng))
+    bench("batch tally", lambda rng: tally_drops(defeats, rng))
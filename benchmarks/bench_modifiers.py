@@ -0,0 +1,49 @@
+"""
+Benchmark effective stat reads under stacked modifiers.
+
+Compares Character.stat, which reads the cached modifier totals, with
+folding every active modifier on each read, for growing stack sizes.
+
+Usage:
+    python benchmarks/bench_modifiers.py
+"""
+
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from game_logic.character import Character
+from game_logic.modifiers import ADD, MULTIPLY, StatModifier
+
+READS = 500_000
+
+def folded_stat(character, stat):
+    """Effective stat computed from scratch over every modifier."""
+    flat, scale = 0, 1.0
+    for modifier in character.modifiers:
+        if modifier.stat == stat:
+            if modifier.kind == MULTIPLY:
+                scale *= modifier.value
+            else:
+                flat += modifier.value
+    return int((getattr(character, stat) + character.equipment_bonus.get(stat, 0) + flat) * scale)
+
+def bench(label, read, character):
+    start = time.perf_counter()
+    for _ in range(READS):
+        read(character, 'strength')
+    elapsed = time.perf_counter() - start
+    print(f"{label:<24} {READS / elapsed:>12,.0f} reads/s")
+
+if __name__ == '__main__':
+    for stack_size in (0, 8, 32, 64):
+        character = Character.from_template('warrior')
+        for index in range(stack_size):
+            stat = ('strength', 'defense', 'magic', 'agility')[index % 4]
+            kind = MULTIPLY if index % 8 == 0 else ADD
+            character.modifiers.add(StatModifier(stat, kind, 1.05 if kind == MULTIPLY else 1, None, 'bench'))
+        print(f"{stack_size} modifiers")
+        bench("  folded per read", folded_stat, character)
+        bench("  cached totals", Character.stat, character)
@@ -0,0 +1,70 @@
+"""
+Benchmark concurrent PvP matches through the sharded resolvers.
+
+Client threads each drive a share of the matches: every round they commit
+both sides' actions, then wait for the published results. Reports resolved
+rounds per second for growing shard counts.
+
+Usage:
+    python benchmarks/bench_pvp.py
+"""
+
+import os
+import sys
+import threading
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from game_logic.character import Character
+from game_logic.pvp import PvPServer
+
+MATCHES = 2000
+CLIENT_THREADS = 8
+SHARD_COUNTS = (1, 2, 4, 8)
+ATTACK = {'type': 'basic', 'name': 'attack'}
+
+def drive(server, matches):
+    """Play matches to the end, one round of every match at a time."""
+    live = list(matches)
+    rounds = 0
+    while live:
+        versions = [match.version for match in live]
+        for match in live:
+            server.commit(match, 'host', ATTACK)
+            server.commit(match, 'challenger', ATTACK)
+        still_live = []
+        for match, version in zip(live, versions):
+            match.wait(version, 30)
+            rounds += 1
+            if not match.updates[-1]['player'].battle_over:
+                still_live.append(match)
+        live = still_live
+    return rounds
+
+def bench(num_shards):
+    server = PvPServer(num_shards)
+    matches = []
+    for index in range(MATCHES):
+        match = server.create_match('host', Character.from_template(('warrior', 'mage', 'rogue')[index % 3]), 'en')
+        server.join(match, 'challenger', Character.from_template(('rogue', 'warrior', 'mage')[index % 3]), 'en')
+        matches.append(match)
+    for match in matches:
+        match.wait(0, 30)
+
+    totals = [0] * CLIENT_THREADS
+    def client(worker):
+        totals[worker] = drive(server, matches[worker::CLIENT_THREADS])
+    threads = [threading.Thread(target=client, args=(worker,)) for worker in range(CLIENT_THREADS)]
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - start
+    server.close()
+    print(f"{num_shards} shards {sum(totals) / elapsed:>12,.0f} rounds/s ({MATCHES} matches)")
+
+if __name__ == '__main__':
+    for num_shards in SHARD_COUNTS:
+        bench(num_shards)
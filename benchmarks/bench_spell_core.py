@@ -0,0 +1,93 @@
+"""
+Benchmark the spell core's import time and effect allocations.
+
+Import time is measured in fresh interpreters. Allocations compare the
+frozen slotted SpellEffect/StatusEffect with the previous plain dataclass
+shape, which built a dict and a list for every effect.
+
+Usage:
+    python benchmarks/bench_spell_core.py
+"""
+
+import os
+import subprocess
+import sys
+import time
+import tracemalloc
+from dataclasses import dataclass
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from game_logic.spells.base import DamageType, SpellEffect, Status, StatusEffect
+
+EFFECTS = 100_000
+IMPORT_RUNS = 5
+
+@dataclass
+class LegacyStatusEffect:
+    status: Status
+    duration: int
+    potency: int
+    chance: float = 1.0
+
+@dataclass
+class LegacySpellEffect:
+    damage: int = 0
+    healing: int = 0
+    damage_type: DamageType = DamageType.NONE
+    stat_changes: dict = None
+    status_effects: list = None
+
+    def __post_init__(self):
+        if self.stat_changes is None:
+            self.stat_changes = {}
+        if self.status_effects is None:
+            self.status_effects = []
+
+def legacy_effect(damage):
+    effect = LegacySpellEffect(damage=damage, damage_type=DamageType.FIRE)
+    effect.status_effects.append(LegacyStatusEffect(Status.BURN, 3, 2, 0.2))
+    return effect
+
+def legacy_hit(damage):
+    return LegacySpellEffect(damage=damage, damage_type=DamageType.PHYSICAL)
+
+def core_hit(damage):
+    return SpellEffect(damage=damage, damage_type=DamageType.PHYSICAL)
+
+def core_effect(damage):
+    effect = SpellEffect(damage=damage, damage_type=DamageType.FIRE)
+    return effect.with_status(StatusEffect(Status.BURN, 3, 2, 0.2))
+
+def bench_import():
+    best = None
+    for _ in range(IMPORT_RUNS):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, '-c', 'import game_logic.spells'], cwd=ROOT, check=True)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    start = time.perf_counter()
+    subprocess.run([sys.executable, '-c', 'pass'], check=True)
+    baseline = time.perf_counter() - start
+    print(f"{'import game_logic.spells':<24} {(best - baseline) * 1000:>9.1f} ms over a bare interpreter")
+
+def bench_alloc(label, build):
+    start = time.perf_counter()
+    effects = [build(damage) for damage in range(EFFECTS)]
+    elapsed = time.perf_counter() - start
+    del effects
+    tracemalloc.start()
+    effects = [build(damage) for damage in range(EFFECTS)]
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"{label:<24} {size / len(effects):>9.0f} B/effect {EFFECTS / elapsed:>12,.0f} effects/s")
+
+if __name__ == '__main__':
+    bench_import()
+    print("plain hit (attacks, black magic)")
+    bench_alloc("  legacy dataclasses", legacy_hit)
+    bench_alloc("  frozen slotted core", core_hit)
+    print("hit with a status effect")
+    bench_alloc("  legacy dataclasses", legacy_effect)
+    bench_alloc("  frozen slotted core", core_effect)
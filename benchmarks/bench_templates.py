@@ -0,0 +1,68 @@
+"""
+Benchmark template compilation and battle page serving.
+
+Reports how long a fresh worker takes to load the page templates with and
+without the Jinja bytecode cache, and the per-request time of /battle when
+the page is rendered on every request versus served as the cached shell.
+
+Usage:
+    python benchmarks/bench_templates.py
+"""
+
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from jinja2 import Environment, FileSystemBytecodeCache, FileSystemLoader
+
+TEMPLATES = ('base.html', 'index.html', 'battle.html')
+WORKER_STARTS = 200
+REQUESTS = 5_000
+
+def load_templates(template_dir, bytecode_cache):
+    """Load every page template in a fresh environment, as a new worker would."""
+    env = Environment(loader=FileSystemLoader(template_dir), bytecode_cache=bytecode_cache)
+    for name in TEMPLATES:
+        env.get_template(name)
+
+def bench_startup(label, template_dir, bytecode_cache):
+    start = time.perf_counter()
+    for _ in range(WORKER_STARTS):
+        load_templates(template_dir, bytecode_cache)
+    elapsed = time.perf_counter() - start
+    print(f"{label:<36} {elapsed / WORKER_STARTS * 1e3:>8.2f} ms per worker start")
+
+def bench_requests(label, client, path, headers=None):
+    start = time.perf_counter()
+    for _ in range(REQUESTS):
+        client.get(path, headers=headers)
+    elapsed = time.perf_counter() - start
+    print(f"{label:<36} {elapsed / REQUESTS * 1e6:>8.1f} us per request")
+
+if __name__ == '__main__':
+    work_dir = tempfile.mkdtemp()
+    os.environ.setdefault('PROGRESS_DB', os.path.join(work_dir, 'progress.db'))
+    from flask import render_template
+    from app import app
+
+    template_dir = os.path.join(app.root_path, app.template_folder)
+    with tempfile.TemporaryDirectory() as cache_dir:
+        bench_startup("compile, no bytecode cache", template_dir, None)
+        cache = FileSystemBytecodeCache(cache_dir)
+        load_templates(template_dir, cache)  # Warm the cache like a previous worker would
+        bench_startup("compile, warm bytecode cache", template_dir, cache)
+
+    @app.route('/bench/battle_render')
+    def battle_render():
+        return render_template('battle.html')
+
+    client = app.test_client()
+    client.post('/select_character', data={'character_type': 'warrior'})
+    bench_requests("/battle rendered per request", client, '/bench/battle_render')
+    etag = client.get('/battle').headers['ETag']
+    bench_requests("/battle cached shell", client, '/battle')
+    bench_requests("/battle cached shell, 304", client, '/battle', {'If-None-Match': etag})
+    bench_requests("/battle/bootstrap", client, '/battle/bootstrap')
@@ -0,0 +1,49 @@
+"""
+Stress concurrent battles across threads and check they stay deterministic.
+
+Runs the same seeded battles on one thread and then spread over growing
+thread pools. Every battle must end exactly as it did on its own; any
+difference means state leaked between battles. Throughput only scales with
+threads on free-threaded CPython; with the GIL this checks correctness.
+
+Usage:
+    python benchmarks/bench_threads.py
+"""
+
+import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from game_logic.character_templates import CHARACTER_TEMPLATES
+from game_logic.policies import make_policy
+from game_logic.simulation import simulate_battle
+
+BATTLES = 3000
+THREAD_COUNTS = (1, 2, 4, 8, 16)
+CLASS_NAMES = tuple(CHARACTER_TEMPLATES)
+POLICY = make_policy('strongest_spell')
+
+def run_battle(seed):
+    """Run one seeded battle and return its outcome."""
+    character_type = CLASS_NAMES[seed % len(CLASS_NAMES)]
+    result = simulate_battle(character_type, level=1 + seed % 20, seed=seed, policy=POLICY)
+    return tuple(sorted(result.items()))
+
+def bench(threads, expected):
+    start = time.perf_counter()
+    with ThreadPoolExecutor(threads) as pool:
+        outcomes = list(pool.map(run_battle, range(BATTLES), chunksize=16))
+    elapsed = time.perf_counter() - start
+    mismatches = sum(1 for outcome, reference in zip(outcomes, expected) if outcome != reference)
+    print(f"{threads:>2} threads {BATTLES / elapsed:>12,.0f} battles/s  {mismatches} mismatched")
+    return mismatches
+
+if __name__ == '__main__':
+    gil = getattr(sys, '_is_gil_enabled', lambda: True)()
+    print(f"GIL {'enabled' if gil else 'disabled'}, {BATTLES} battles")
+    expected = [run_battle(seed) for seed in range(BATTLES)]
+    mismatches = sum(bench(threads, expected) for threads in THREAD_COUNTS)
+    sys.exit(1 if mismatches else 0)
@@ -0,0 +1,93 @@
+"""
+Elemental affinities of enemies.
+
+The per-enemy affinities in ENEMY_DATABASE are compiled once into a dense
+enemy x element matrix of damage multipliers, stored row-major in a flat
+array('d') and exposed as a read-only view like the other catalogs.
+Enemies keep the offset of their row, so resolving a hit in battle is a
+single indexed read and multiply. apply_affinities scales whole batches of
+hits at once for offline analysis, vectorized with NumPy when it is
+installed; battles and simulations resolve their hits one at a time.
+"""
+
+from array import array
+from .enemy_database import ENEMY_DATABASE
+from .shared import freeze
+
+try:
+    import numpy
+except ImportError:  # Optional dependency
+    numpy = None
+
+# Damage type values (see spells.base.DamageType) in matrix column order
+ELEMENTS = ('physical', 'fire', 'ice', 'thunder', 'water', 'none')
+ELEMENT_COLUMNS = {element: column for column, element in enumerate(ELEMENTS)}
+
+# Affinity -> damage multiplier; a negative multiplier heals the target
+AFFINITY_MULTIPLIERS = freeze({
+    'normal': 1.0,
+    'weak': 2.0,
+    'resist': 0.5,
+    'immune': 0.0,
+    'absorb': -1.0
+})
+
+def compile_affinity_matrix(enemy_database=ENEMY_DATABASE):
+    """
+    Compile enemy affinities into a flat multiplier matrix.
+
+    Args:
+        enemy_database (dict): Enemy name -> enemy data with optional 'affinities'
+
+    Returns:
+        tuple: (enemy name -> row index, array('d') of len(rows) * len(ELEMENTS) multipliers)
+
+    Raises:
+        KeyError: If an enemy uses an unknown element or affinity
+    """
+    rows = {}
+    matrix = array('d')
+    for row, (enemy_name, enemy_data) in enumerate(enemy_database.items()):
+        rows[enemy_name] = row
+        multipliers = [1.0] * len(ELEMENTS)
+        for element, affinity in enemy_data.get('affinities', {}).items():
+            multipliers[ELEMENT_COLUMNS[element]] = AFFINITY_MULTIPLIERS[affinity]
+        matrix.extend(multipliers)
+    return rows, matrix
+
+ENEMY_ROWS, _matrix = compile_affinity_matrix()
+AFFINITY_MATRIX = memoryview(_matrix).toreadonly()
+
+def affinity_offset(enemy_name):
+    """
+    Get the offset of an enemy's row in AFFINITY_MATRIX.
+
+    Args:
+        enemy_name (str): Name of the enemy
+
+    Returns:
+        int: Offset of the row's first element, or None for unknown enemies
+    """
+    row = ENEMY_ROWS.get(enemy_name)
+    return None if row is None else row * len(ELEMENTS)
+
+def apply_affinities(rows, columns, damages):
+    """
+    Scale a batch of hits by the affinity of each target to each element.
+    Scaled damage is truncated towards zero; negative values are absorbed.
+
+    Args:
+        rows (sequence): Enemy row index (see ENEMY_ROWS) per hit
+        columns (sequence): Element column (see ELEMENT_COLUMNS) per hit
+        damages (sequence): Raw damage per hit
+
+    Returns:
+        list or numpy.ndarray: Scaled damage per hit; an int64 array when NumPy is installed
+    """
+    width = len(ELEMENTS)
+    if numpy is not None:
+        matrix = numpy.frombuffer(AFFINITY_MATRIX, dtype=numpy.float64).reshape(-1, width)
+        scaled = matrix[numpy.asarray(rows), numpy.asarray(columns)] * numpy.asarray(damages)
+        return scaled.astype(numpy.int64)
+    matrix = AFFINITY_MATRIX
+    return [int(matrix[row * width + column] * damage) for row, column, damage in zip(rows, columns, damages)]
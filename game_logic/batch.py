@@ -0,0 +1,121 @@
+"""
+Batch processing of battle actions for bots and automated QA.
+
+Battles live in a SQLiteBattleStore as {'p': player, 'b': battle, 'over': bool}
+records using the compact session encodings. A batch of (battle id, action)
+pairs is resolved inside one store transaction, each battle decoded and
+encoded once however many actions it receives, and every action answers
+with a diff holding only what changed.
+"""
+
+import uuid
+from .battle import Battle
+from .battle_state import CharacterState
+from .character import Character
+from .journal import NullJournal
+from .session_state import encode_player, decode_player, encode_battle, decode_battle
+
+# Largest number of actions accepted in one batch
+MAX_BATCH_ACTIONS = 1000
+
+def character_diff(before, after):
+    """
+    Collect the fields of a character state that changed.
+
+    Args:
+        before (CharacterState): Earlier state
+        after (CharacterState): Later state
+
+    Returns:
+        dict: Field -> new value, for changed fields only
+    """
+    return {
+        name: getattr(after, name)
+        for name in after.__dataclass_fields__
+        if getattr(after, name) != getattr(before, name)
+    }
+
+def create_battles(store, character_type, count, locale):
+    """
+    Start several battles for fresh characters of one type.
+
+    Args:
+        store (SQLiteBattleStore): Store to create the battles in
+        character_type (str): Character template key
+        count (int): Number of battles
+        locale (str): Locale to render the opening log entries in
+
+    Returns:
+        dict: Battle id -> initial BattleState
+    """
+    records = {}
+    states = {}
+    for _ in range(count):
+        battle = Battle(Character.from_template(character_type), journal=NullJournal())
+        battle.locale = locale
+        battle_id = uuid.uuid4().hex
+        states[battle_id] = battle.start_battle()
+        records[battle_id] = {'p': encode_player(battle.player), 'b': encode_battle(battle), 'over': False}
+    store.create_many(records)
+    return states
+
+def run_batch(store, actions, locale):
+    """
+    Resolve a batch of battle actions in one store transaction.
+    Actions for the same battle are applied in the order given.
+
+    Args:
+        store (SQLiteBattleStore): Store holding the battles
+        actions (list): [battle id, action] pairs
+        locale (str): Locale to render log entries in
+
+    Returns:
+        list: One diff per action, in order. A diff has the battle id,
+            action_success, turn, the new log entries, battle_over, victory and
+            the changed player/enemy fields, or an error
+    """
+    results = []
+
+    def resolve(records):
+        battles = {}
+        previous = {}
+        for battle_id, action in actions:
+            record = records.get(battle_id)
+            if record is None:
+                results.append({'battle_id': battle_id, 'error': 'Unknown battle'})
+                continue
+            battle = battles.get(battle_id)
+            if battle is None:
+                battle = decode_battle(record['b'], decode_player(record['p']), journal=NullJournal())
+                battle.locale = locale
+                battle.battle_over = record['over']
+                battles[battle_id] = battle
+                previous[battle_id] = (
+                    CharacterState.from_character(battle.player),
+                    CharacterState.from_character(battle.enemy)
+                )
+            if battle.battle_over:
+                results.append({'battle_id': battle_id, 'error': 'Battle is over', 'battle_over': True})
+                continue
+
+            state = battle.process_turn(action)
+            player_before, enemy_before = previous[battle_id]
+            previous[battle_id] = (state.player, state.enemy)
+            results.append({
+                'battle_id': battle_id,
+                'action_success': state.action_success,
+                'turn': state.turn,
+                'battle_log': state.battle_log,
+                'battle_over': state.battle_over,
+                'victory': state.victory,
+                'player': character_diff(player_before, state.player),
+                'enemy': character_diff(enemy_before, state.enemy)
+            })
+
+        return {
+            battle_id: {'p': encode_player(battle.player), 'b': encode_battle(battle), 'over': battle.battle_over}
+            for battle_id, battle in battles.items()
+        }
+
+    store.update_many((battle_id for battle_id, _ in actions), resolve)
+    return results
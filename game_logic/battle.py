@@ -1,29 +1,86 @@
+import logging
 import random
+from dataclasses import replace
+from .battle_log import BattleLog
+from .battle_state import BattleState, CharacterState
 from .character import Character
 from .enemy_database import get_random_enemy
-from .skills import get_skill_cost, get_spell_power
-from .spells.base import SpellEffect, DamageType, Status
+from .items import get_item
+from .loot import roll_drop
+from .journal import BattleJournal, RecordingRandom
+from .session_state import encode_player, decode_player, encode_battle, decode_battle
+from .skills import get_skill_cost, get_skill_handler
+from .messages import DEFAULT_LOCALE
+from .modifiers import MULTIPLY, StatModifier
+from .spells.base import (
+    DISABLING_STATUSES, DamageType, Status, StatusEffect, damage_ops, run_effect
+)
+
+logger = logging.getLogger(__name__)
+
+# Defense scaling granted by defending, lasting until the end of the round
+DEFEND_MODIFIERS = (('defense', 2.0), ('magic_defense', 2.0))
 
 class Battle:
     """
     Manages the battle system between player and enemy characters.
     Implements a turn-based combat system inspired by Final Fantasy X,
     including action processing, damage calculation, and battle state management.
+    
+    Every state change goes through the battle's journal as an event, so a
+    battle can be persisted append-only and rebuilt from its latest snapshot.
     """
 
-    def __init__(self, player):
+    def __init__(self, player, enemy=None, journal=None, seed=None):
         """
         Initialize a new battle instance.
         
         Args:
             player (Character): The player character instance
+            enemy (Character, optional): Enemy to fight, generated if not given
+            journal (BattleJournal, optional): Event journal, in-memory if not given
+            seed (int, optional): Seed for the battle's random number generator,
+                drawn at random if not given so the battle can still be resumed
         """
         self.player = player
-        self.enemy = self._generate_enemy()
         self.turn = 1
-        self.battle_log = []
+        self.battle_log = BattleLog()
+        self.locale = DEFAULT_LOCALE
+        self._log_cursor = 0  # First log entry not yet sent to the client
         self.battle_over = False
         self.victory = False
+        self.journal = journal if journal is not None else BattleJournal()
+        self.seed = seed if seed is not None else random.getrandbits(64)
+        self.rng = RecordingRandom(self.journal, lambda: self.turn, self.seed)
+        self.enemy = enemy if enemy is not None else self._generate_enemy()
+        self._last_snapshot_turn = None
+        self._acted = set()  # Sides that already had their turn this round
+
+    @classmethod
+    def restore(cls, battle_id, store):
+        """
+        Rebuild a battle from its latest snapshot and the events recorded after it.
+        
+        Args:
+            battle_id (str): Battle identifier in the store
+            store (JournalStore): Store holding the battle's journal
+            
+        Returns:
+            Battle: Battle instance in the state of its last recorded event
+        """
+        snapshot, events = store.load(battle_id)
+        journal = BattleJournal(battle_id, store)
+        journal.seq = snapshot['seq']
+        
+        battle = decode_battle(snapshot['battle'], decode_player(snapshot['player']), journal=journal)
+        battle.battle_over = snapshot['battle_over']
+        battle.victory = snapshot['victory']
+        battle._last_snapshot_turn = battle.turn
+        
+        for event in events:
+            battle.apply_event(event)
+            journal.seq = event['seq']
+        return battle
 
     def _generate_enemy(self):
         """
@@ -33,37 +90,18 @@ class Battle:
         Returns:
             Character: A new enemy character instance
         """
-        enemy_data = get_random_enemy(self.player.level)
-        stats = enemy_data["stats"]
-        
-        enemy = Character(
-            enemy_data["name"],
-            stats["hp"],
-            stats["mp"],
-            stats["strength"],
-            stats["defense"],
-            stats["magic"],
-            stats["magic_defense"],
-            stats["agility"],
-            stats["luck"]
-        )
-        
-        # Store additional enemy-specific data
-        enemy.special_move = enemy_data["special_move"]
-        enemy.exp_value = enemy_data["exp_value"]
-        enemy.abilities = enemy_data["abilities"]
-        enemy.drops = enemy_data["drops"]
-        
-        return enemy
+        enemy_data = get_random_enemy(self.player.level, rng=self.rng)
+        return Character.from_enemy_data(enemy_data, self.player.level)
 
     def start_battle(self):
         """
         Initialize the battle state and return initial battle information.
         
         Returns:
-            dict: Initial battle state including enemy info and turn count
+            BattleState: Initial battle state including enemy info and turn count
         """
-        self.battle_log.append(f"A {self.enemy.name} appears!")
+        self.battle_log.add('enemy_appears', self.enemy.name)
+        self._commit(force_snapshot=True)
         return self._get_battle_state()
 
     def process_turn(self, action):
@@ -74,23 +112,65 @@ class Battle:
             action (dict): Player's chosen action and target
             
         Returns:
-            dict: Updated battle state after the turn is complete
+            BattleState: Updated battle state after the turn is complete
+        """
+        action_success = self.take_turn(action)
+        
+        # Include action success in battle state
+        battle_state = self._get_battle_state()
+        battle_state.action_success = action_success
+        return battle_state
+
+    def take_turn(self, action):
+        """
+        Resolve a single turn without building the battle state.
+        Simulations use this directly so log entries are never rendered.
+        
+        Args:
+            action (dict): Player's chosen action and target
+            
+        Returns:
+            bool: Whether the player's action was successfully executed
         """
-        # Process player's action
-        action_success = self._process_player_action(action)
+        # Process player's action, unless crowd control makes them lose the turn
+        if self.can_act(self.player):
+            action_success = self._process_player_action(action)
+        else:
+            action_success = self._skip_turn(self.player)
+        self._acted.add('player')
         
         # Only proceed with enemy turn if player's action was successful
         if action_success and self.enemy.is_alive() and not self.battle_over:
-            self._process_enemy_turn()
-            self.turn += 1
+            if self.can_act(self.enemy):
+                self._process_enemy_turn()
+            else:
+                self._skip_turn(self.enemy)
+            self._end_round()
         
         # Check battle end conditions
         self._check_battle_end()
+        self._commit()
+        return action_success
+
+    def can_act(self, character):
+        """
+        Check whether a character gets to act this round.
+        Disabling statuses keep disabled_until up to date when they are added
+        or removed, so this is a single comparison rather than a status scan.
         
-        # Include action success in battle state
-        battle_state = self._get_battle_state()
-        battle_state['action_success'] = action_success
-        return battle_state
+        Args:
+            character (Character): Character whose turn it is
+            
+        Returns:
+            bool: False while a disabling status (see DISABLING_STATUSES) is active
+        """
+        return self.turn >= character.disabled_until
+
+    def _skip_turn(self, character):
+        """Record and log a turn lost to crowd control."""
+        self._record('action', actor=self._side(character), action_type='disabled', name=None)
+        self.battle_log.add('cannot_act', character.name)
+        return True
 
     def _process_player_action(self, action):
         """
@@ -99,31 +179,49 @@ class Battle:
         Args:
             action (dict): Contains action type and name
             
+        Returns:
+            bool: Whether the action was successfully executed
+        """
+        return self._process_action(self.player, self.enemy, action)
+
+    def _process_action(self, actor, target, action):
+        """
+        Handle a chosen action of either side.
+        
+        Args:
+            actor (Character): Character taking the action
+            target (Character): Opponent of the actor
+            action (dict): Contains action type and name
+            
         Returns:
             bool: Whether the action was successfully executed
         """
         action_type = action.get('type', 'basic')
         action_name = action.get('name', 'attack')
+        self._record('action', actor=self._side(actor), action_type=action_type, name=action_name)
         
-        # Process different types of actions
-        if action_type == 'basic':
-            if action_name == 'attack':
-                self._handle_attack(self.player, self.enemy)
-                return True
-            elif action_name == 'defend':
-                self._handle_defend(self.player)
-                return True
-                
-        elif action_type == 'abilities':
-            return self._handle_ability(action_name)
-            
-        elif action_type == 'skills':
-            return self._handle_skill(action_name)
-            
-        elif action_type in ['black_magic', 'white_magic']:
-            return self._handle_magic(action_name, action_type)
+        handler = self._ACTION_HANDLERS.get(action_type)
+        if handler is None:
+            return True  # Default to true for unknown actions
+        return handler(self, actor, target, action_name)
+
+    def _handle_basic(self, actor, target, action_name):
+        """
+        Process a basic action (attack or defend).
+        
+        Args:
+            actor (Character): Character taking the action
+            target (Character): Opponent of the actor
+            action_name (str): 'attack' or 'defend'
             
-        return True  # Default to true for unknown actions
+        Returns:
+            bool: Always True, basic actions cannot fail
+        """
+        if action_name == 'attack':
+            self._handle_attack(actor, target)
+        elif action_name == 'defend':
+            self._handle_defend(actor)
+        return True
 
     def _process_enemy_turn(self):
         """
@@ -134,56 +232,35 @@ class Battle:
         # Enemy AI: More likely to use special moves when HP is low
         hp_percent = (self.enemy.current_hp / self.enemy.max_hp) * 100
         
-        if hp_percent < 30 and random.random() < 0.4 and self.enemy.special_move:
+        if hp_percent < 30 and self.rng.random() < 0.4 and self.enemy.special_move:
             # Use special move when low on HP
-            result = self.enemy.calculate_damage(self.player, is_special_move=True)
-            damage = self.player.take_damage(result['damage'])
-            self.battle_log.append(f"{self.enemy.name} uses {self.enemy.special_move} for {damage} damage!")
+            self._record('action', actor='enemy', action_type='special_move', name=self.enemy.special_move)
+            result = self.enemy.calculate_damage(self.player, is_special_move=True, rng=self.rng)
+            damage = self.deal_damage(self.player, result['damage'])
+            self.battle_log.add('special_move', self.enemy.name, self.enemy.special_move, damage)
             return
         
         # Default to basic attack
+        self._record('action', actor='enemy', action_type='basic', name='attack')
         self._handle_attack(self.enemy, self.player)
 
-    def _apply_damage(self, target, effect: SpellEffect) -> int:
+    def _apply_damage(self, target, ops, damage) -> int:
         """
-        Apply damage to target, checking for nullification effects.
+        Apply damage to target through the compiled effect pipeline, which
+        handles nullify, Shell and Protect checks.
         
         Args:
             target (Character): The target receiving damage
-            effect (SpellEffect): The spell effect containing damage and type
+            ops (tuple): Compiled operations of the hit, see damage_ops
+            damage (int): Damage before guards and affinities
             
         Returns:
             int: Actual damage dealt after nullification checks
         """
-        if effect.damage <= 0:
-            return 0
-
-        # Check for nullification if it's magical damage
-        if effect.damage_type != DamageType.PHYSICAL and effect.damage_type != DamageType.NONE:
-            nullify_status = None
-            
-            # Map damage types to their nullification status
-            damage_type_to_status = {
-                DamageType.FIRE: Status.NULLIFY_FIRE,
-                DamageType.ICE: Status.NULLIFY_ICE,
-                DamageType.THUNDER: Status.NULLIFY_THUNDER,
-                DamageType.WATER: Status.NULLIFY_WATER
-            }
-            
-            nullify_status = damage_type_to_status.get(effect.damage_type)
-            
-            if nullify_status:
-                # Check if target has matching nullify status
-                for status in target.status_effects[:]:  # Create a copy to safely modify during iteration
-                    if status.status == nullify_status:
-                        # Remove the nullify status
-                        target.status_effects.remove(status)
-                        self.battle_log.append(f"{target.name} nullified the {effect.damage_type.value} damage!")
-                        return 0
-
-        # If not nullified, apply damage normally
-        actual_damage = target.take_damage(effect.damage)
-        return actual_damage
+        result = run_effect(ops, target, self, damage)
+        for code, args in result.messages:
+            self.battle_log.add(code, *args)
+        return result.damage
 
     def _handle_attack(self, attacker, target):
         """
@@ -193,164 +270,500 @@ class Battle:
             attacker (Character): The character performing the attack
             target (Character): The target of the attack
         """
-        result = attacker.calculate_damage(target)
-        effect = SpellEffect(damage=result['damage'], damage_type=DamageType.PHYSICAL)
-        damage = self._apply_damage(target, effect)
+        result = attacker.calculate_damage(target, rng=self.rng)
+        damage = self._apply_damage(target, damage_ops(DamageType.PHYSICAL), result['damage'])
         
-        # Create battle log message
-        msg = f"{attacker.name} attacks {target.name} for {damage} damage!"
-        if result['is_critical']:
-            msg = f"Critical hit! {msg}"
-        self.battle_log.append(msg)
+        code = 'attack_critical' if result['is_critical'] else 'attack'
+        self.battle_log.add(code, attacker.name, target.name, damage)
 
     def _handle_defend(self, character):
         """
-        Process a defend action, which reduces damage taken next turn.
+        Process a defend action, which scales the character's defenses
+        until the end of the round.
         
         Args:
             character (Character): The character defending
         """
-        # Implement defense bonus (handled in damage calculations)
-        self.battle_log.append(f"{character.name} takes a defensive stance!")
+        for stat, scale in DEFEND_MODIFIERS:
+            self.add_modifier(character, StatModifier(stat, MULTIPLY, scale, 1, 'defend'))
+        self.battle_log.add('defend', character.name)
 
-    def _handle_ability(self, ability_name):
+    def _handle_skill(self, actor, target, skill_name):
         """
-        Process a special ability action.
+        Process an ability or skill action through its compiled effect handler.
         
         Args:
-            ability_name (str): Name of the ability to use
-            
-        Returns:
-            bool: Whether the ability was successfully used
-        """
-        if not self.player.use_mp(get_skill_cost(ability_name)):
-            self.battle_log.append(f"Not enough MP to use {ability_name}!")
-            return False
-            
-        if ability_name == "Cheer":
-            self.player.strength += 2
-            self.battle_log.append(f"{self.player.name} uses Cheer! Strength increased!")
-        elif ability_name == "Provoke":
-            # Implement provoke effects
-            self.enemy.defense -= 5
-            self.enemy.strength += 2
-            self.battle_log.append(f"{self.player.name} provokes the enemy!")
-        elif ability_name == "Steal":
-            # Simple steal implementation
-            steal_chance = self.player.luck / 100
-            if random.random() < steal_chance:
-                self.battle_log.append(f"{self.player.name} successfully steals an item!")
-            else:
-                self.battle_log.append(f"{self.player.name}'s steal attempt failed!")
-        return True
-
-    def _handle_skill(self, skill_name):
-        """
-        Process a skill action.
-        
-        Args:
-            skill_name (str): Name of the skill to use
+            actor (Character): Character using the skill
+            target (Character): Opponent of the actor
+            skill_name (str): Name of the ability or skill to use
             
         Returns:
             bool: Whether the skill was successfully used
         """
-        if not self.player.use_mp(get_skill_cost(skill_name)):
-            self.battle_log.append(f"Not enough MP to use {skill_name}!")
+        if skill_name not in actor.abilities and skill_name not in actor.skills:
+            self.battle_log.add('unknown_skill', skill_name)
+            return False
+        if not self.spend_mp(actor, get_skill_cost(skill_name)):
+            self.battle_log.add('not_enough_mp_skill', skill_name)
             return False
             
-        if skill_name == "Power Break":
-            self.enemy.strength = max(1, self.enemy.strength - 5)
-            self.battle_log.append(f"{self.player.name} uses Power Break! Enemy's strength decreased!")
-        elif skill_name == "Armor Break":
-            self.enemy.defense = max(1, self.enemy.defense - 5)
-            self.battle_log.append(f"{self.player.name} uses Armor Break! Enemy's defense decreased!")
-        elif skill_name == "Dark Attack":
-            # Implement accuracy reduction
-            self.battle_log.append(f"{self.player.name} uses Dark Attack! Enemy's accuracy decreased!")
-        elif skill_name == "Flee":
-            # 50% chance to flee
-            if random.random() < 0.5:
-                self.battle_over = True
-                self.battle_log.append(f"{self.player.name} successfully fled from battle!")
-            else:
-                self.battle_log.append(f"{self.player.name}'s attempt to flee failed!")
+        handler = get_skill_handler(skill_name)
+        if handler:
+            handler(self, actor, target)
         return True
 
-    def _handle_magic(self, spell_name, magic_type):
+    def _handle_magic(self, caster, opponent, spell_name, magic_type):
         """
         Process a magic spell action.
         
         Args:
+            caster (Character): Character casting the spell
+            opponent (Character): Opponent of the caster
             spell_name (str): Name of the spell to cast
             magic_type (str): Type of magic (black or white)
             
         Returns:
             bool: Whether the spell was successfully cast
         """
-        if not self.player.use_mp(get_skill_cost(spell_name)):
-            self.battle_log.append(f"Not enough MP to cast {spell_name}!")
+        # Get the spell instance from the spell registry
+        spell = caster.get_spell(spell_name)
+        if not spell:
+            self.battle_log.add('unknown_spell', spell_name)
+            return False
+        
+        if not self.spend_mp(caster, get_skill_cost(spell_name)):
+            self.battle_log.add('not_enough_mp_spell', spell_name)
             return False
             
         if magic_type == 'black_magic':
-            # Get the spell instance from the spell registry
-            spell = self.player.get_spell(spell_name)
-            if not spell:
-                self.battle_log.append(f"Unknown spell: {spell_name}")
-                return False
-                
-            result = self.player.calculate_magic_damage(self.enemy, spell_name)
-            effect = SpellEffect(damage=result['damage'], damage_type=spell.damage_type)
-            damage = self._apply_damage(self.enemy, effect)
+            result = caster.calculate_magic_damage(opponent, spell_name, rng=self.rng)
+            damage = self._apply_damage(opponent, damage_ops(spell.damage_type, spell.inflicts), result['damage'])
             
-            msg = f"{self.player.name} casts {spell_name} for {damage} damage!"
-            if result['is_critical']:
-                msg = f"Critical hit! {msg}"
-            self.battle_log.append(msg)
+            code = 'spell_damage_critical' if result['is_critical'] else 'spell_damage'
+            self.battle_log.add(code, caster.name, spell_name, damage)
             
         elif magic_type == 'white_magic':
-            if spell_name == 'Cure':
-                heal_amount = int(self.player.magic * 1.5)
-                self.player.heal(heal_amount)
-                self.battle_log.append(f"{self.player.name} casts Cure and recovers {heal_amount} HP!")
+            self.battle_log.add('spell_cast', caster.name, spell_name)
+            targets = self._targets(caster, spell.targeting)
+            for target, result in zip(targets, spell.cast(caster, targets, self)):
+                for code, args in result.messages:
+                    self.battle_log.add(code, *args)
+                if result.healing:
+                    self.battle_log.add('healed', target.name, result.healing)
+        return True
+
+    def _targets(self, caster, targeting):
+        """
+        Resolve a spell's targeting to the characters it affects.
+        Each side of a battle is a party of one, so the 'all_' variants
+        resolve to single-member lists.
+        
+        Args:
+            caster (Character): The character casting the spell
+            targeting (str): 'self', 'ally', 'all_allies', 'enemy' or 'all_enemies'
+            
+        Returns:
+            list: Target characters
+        """
+        opponent = self.enemy if caster is self.player else self.player
+        if targeting in ('enemy', 'all_enemies'):
+            return [opponent]
+        return [caster]
+
+    def _handle_item(self, actor, target, item_name):
+        """
+        Use a consumable from the actor's inventory.
+        
+        Args:
+            actor (Character): Character using the item
+            target (Character): Opponent of the actor
+            item_name (str): Name of the item
+            
+        Returns:
+            bool: Whether the item was used
+        """
+        item = get_item(item_name)
+        if item is None or item['type'] != 'consumable' or not self.use_item(actor, item_name):
+            self.battle_log.add('no_item', item_name)
+            return False
+        
+        effect = item['effect']
+        if 'hp' in effect:
+            healed = self.restore_hp(actor, effect['hp'])
+            self.battle_log.add('item_hp', actor.name, item_name, healed)
+        if 'mp' in effect:
+            restored = self.restore_mp(actor, effect['mp'])
+            self.battle_log.add('item_mp', actor.name, item_name, restored)
         return True
 
+    def _handle_black_magic(self, actor, target, spell_name):
+        """Process a black magic action."""
+        return self._handle_magic(actor, target, spell_name, 'black_magic')
+
+    def _handle_white_magic(self, actor, target, spell_name):
+        """Process a white magic action."""
+        return self._handle_magic(actor, target, spell_name, 'white_magic')
+
+    # Action type -> handler, so dispatch is one dict lookup per action
+    _ACTION_HANDLERS = {
+        'basic': _handle_basic,
+        'abilities': _handle_skill,
+        'skills': _handle_skill,
+        'black_magic': _handle_black_magic,
+        'white_magic': _handle_white_magic,
+        'items': _handle_item
+    }
+
     def _check_battle_end(self):
         """
         Check if the battle has ended (either character defeated).
-        Updates battle_over and victory flags accordingly.
+        Updates battle_over and victory flags accordingly. A battle that is
+        already over is left alone, so exp and loot are awarded only once.
         """
-        # Debug logging
-        print(f"Checking battle end:")
-        print(f"Player HP: {self.player.current_hp}/{self.player.max_hp}")
-        print(f"Enemy HP: {self.enemy.current_hp}/{self.enemy.max_hp}")
-        print(f"Enemy alive: {self.enemy.is_alive()}")
+        if self.battle_over:
+            return
+        logger.debug("Checking battle end: player HP %d/%d, enemy HP %d/%d",
+                     self.player.current_hp, self.player.max_hp,
+                     self.enemy.current_hp, self.enemy.max_hp)
         
         if not self.player.is_alive():
-            print("Player defeated")
-            self.battle_over = True
-            self.victory = False
-            self.battle_log.append(f"{self.player.name} has been defeated!")
+            logger.debug("Player defeated")
+            self.end_battle(victory=False)
+            self.battle_log.add('defeated', self.player.name)
         elif not self.enemy.is_alive():
-            print("Enemy defeated")
-            self.battle_over = True
-            self.victory = True
+            logger.debug("Enemy defeated")
+            self.end_battle(victory=True)
             exp_gain = self.enemy.exp_value
             self.player.gain_experience(exp_gain)
-            self.battle_log.append(f"{self.enemy.name} has been defeated!")
-            self.battle_log.append(f"{self.player.name} gains {exp_gain} experience!")
+            self._record('exp', target='player', amount=exp_gain)
+            self.battle_log.add('defeated', self.enemy.name)
+            self.battle_log.add('exp_gained', self.player.name, exp_gain)
+            item = roll_drop(self.enemy.name, self.rng)
+            if item:
+                self.give_item(self.player, item)
+                self.battle_log.add('item_dropped', self.enemy.name, item)
 
-    def _get_battle_state(self):
+    def _end_round(self):
+        """Resolve end-of-round effects, count down statuses and modifiers and advance to the next round."""
+        for character in (self.player, self.enemy):
+            self._resolve_round_statuses(character)
+        _tick_round(self)
+        self._acted.clear()
+        self.turn += 1
+        self._record('turn')
+
+    def _resolve_round_statuses(self, character):
         """
-        Get the current state of the battle.
+        Apply the per-round statuses of a living character. Potency is a
+        percentage of max HP: Regen heals it and Burn deals it as damage.
+        """
+        for status_effect in list(character.status_effects):
+            if not character.is_alive():
+                return
+            if status_effect.status is Status.REGEN:
+                healed = self.restore_hp(character, character.max_hp * status_effect.potency // 100)
+                if healed:
+                    self.battle_log.add('regen', character.name, healed)
+            elif status_effect.status is Status.BURN:
+                damage = self.deal_damage(character, max(1, character.max_hp * status_effect.potency // 100))
+                self.battle_log.add('burn', character.name, damage)
+
+    def _record(self, event_type, **data):
+        """Append an event for the current turn to the journal."""
+        self.journal.record(event_type, self.turn, **data)
+
+    def _side(self, character):
+        """Get the journal side name ('player' or 'enemy') of a character."""
+        return 'player' if character is self.player else 'enemy'
+
+    def _character(self, side):
+        """Get the character on a journal side."""
+        return self.player if side == 'player' else self.enemy
+
+    def deal_damage(self, target, amount):
+        """
+        Apply damage to a character and record it.
+        
+        Returns:
+            int: Actual damage taken
+        """
+        actual_damage = target.take_damage(amount)
+        self._record('damage', target=self._side(target), amount=actual_damage)
+        if actual_damage > 0:
+            # Taking damage breaks sleep
+            for status_effect in [active for active in target.status_effects if active.status is Status.SLEEP]:
+                self.remove_status(target, status_effect)
+                self.battle_log.add('woke_up', target.name)
+        return actual_damage
+
+    def restore_hp(self, target, amount):
+        """
+        Heal a character and record the HP actually restored.
+        
+        Returns:
+            int: HP restored after capping at max HP
+        """
+        old_hp = target.current_hp
+        target.heal(amount)
+        healed = target.current_hp - old_hp
+        self._record('heal', target=self._side(target), amount=healed)
+        return healed
+
+    def spend_mp(self, character, cost):
+        """
+        Spend MP for an action and record it.
+        
+        Returns:
+            bool: True if the character had enough MP
+        """
+        if not character.use_mp(cost):
+            return False
+        if cost:
+            self._record('mp', target=self._side(character), amount=cost)
+        return True
+
+    def restore_mp(self, character, amount):
+        """
+        Restore MP and record the MP actually restored.
         
         Returns:
-            dict: Current battle state including character stats and battle progress
+            int: MP restored after capping at max MP
+        """
+        restored = min(amount, character.max_mp - character.current_mp)
+        character.current_mp += restored
+        if restored:
+            self._record('mp', target=self._side(character), amount=-restored)
+        return restored
+
+    def use_item(self, character, item_name):
+        """
+        Take one item from a character's inventory and record it.
+        
+        Returns:
+            bool: True if the character had the item
+        """
+        if not character.remove_item(item_name):
+            return False
+        self._record('item', target=self._side(character), name=item_name, count=-1)
+        return True
+
+    def give_item(self, character, item_name, count=1):
+        """Put items into a character's inventory and record it."""
+        character.add_item(item_name, count)
+        self._record('item', target=self._side(character), name=item_name, count=count)
+
+    def steal_item(self, thief, target, item_name):
+        """Mark a target as stolen from, give the item to the thief and record both."""
+        target.stolen = True
+        self._record('stolen', target=self._side(target))
+        self.give_item(thief, item_name)
+
+    def change_stat(self, character, stat, delta):
+        """Adjust a stat by delta and record the change."""
+        setattr(character, stat, getattr(character, stat) + delta)
+        self._record('stat', target=self._side(character), stat=stat, delta=delta)
+
+    def add_modifier(self, character, modifier):
+        """Stack a stat modifier on a character and record it."""
+        character.modifiers.add(modifier)
+        self._record('modifier', target=self._side(character), stat=modifier.stat, kind=modifier.kind,
+                     value=modifier.value, duration=modifier.duration, source=modifier.source)
+
+    def add_status(self, character, status_effect):
+        """
+        Add a status effect to a character and record it.
+        A disabling status landed after the character already acted this round
+        gets one extra round, so its duration counts from their next turn.
+        """
+        if (status_effect.status in DISABLING_STATUSES and status_effect.duration > 0
+                and self._side(character) in self._acted):
+            status_effect = replace(status_effect, duration=status_effect.duration + 1)
+        character.status_effects.append(status_effect)
+        self._record('status_add', target=self._side(character), status=status_effect.status.value,
+                     duration=status_effect.duration, potency=status_effect.potency)
+        if status_effect.status in DISABLING_STATUSES:
+            self.refresh_disabled(character)
+
+    def remove_status(self, character, status_effect):
+        """Remove a status effect from a character and record it."""
+        character.status_effects.remove(status_effect)
+        self._record('status_remove', target=self._side(character), status=status_effect.status.value)
+        if status_effect.status in DISABLING_STATUSES:
+            self.refresh_disabled(character)
+
+    def refresh_disabled(self, character):
+        """
+        Recompute the round a character can act again from their disabling statuses.
+        Statuses count down with the rounds, so the result stays valid until
+        a disabling status is added or removed.
+        """
+        character.disabled_until = max(
+            (self.turn + status_effect.duration for status_effect in character.status_effects
+             if status_effect.status in DISABLING_STATUSES and status_effect.duration > 0),
+            default=0
+        )
+
+    def end_battle(self, victory):
+        """Mark the battle as over, drop the player's modifiers and statuses and record the outcome."""
+        self.battle_over = True
+        self.victory = victory
+        self.player.modifiers.clear()
+        self.player.status_effects = []
+        self.player.disabled_until = 0
+        self._record('end', victory=victory)
+
+    def apply_event(self, event):
+        """
+        Apply a recorded state-changing event when replaying a journal.
+        Informational events (actions, RNG draws) are skipped.
+        
+        Args:
+            event (dict): Event recorded by the journal
+        """
+        handler = _REPLAY_HANDLERS.get(event['type'])
+        if handler:
+            handler(self, event)
+        self.turn = event['turn']
+
+    def snapshot(self):
+        """
+        Capture the full battle state for the journal.
+        
+        Returns:
+            dict: Snapshot covering every event up to the journal's current seq
         """
         return {
-            'player': self.player.to_dict(),
-            'enemy': self.enemy.to_dict(),
-            'turn': self.turn,
-            'battle_log': self.battle_log,
+            'seq': self.journal.seq,
+            'player': encode_player(self.player),
+            'battle': encode_battle(self),
             'battle_over': self.battle_over,
             'victory': self.victory
-        } 
\ No newline at end of file
+        }
+
+    def _commit(self, force_snapshot=False):
+        """
+        Flush the events of this turn, snapshotting every N turns and at the end.
+        
+        Args:
+            force_snapshot (bool): Snapshot regardless of the interval
+        """
+        snapshot = None
+        # Snapshots are only built when a store will persist them
+        due = force_snapshot or self.battle_over or (
+            self.turn != self._last_snapshot_turn and self.journal.snapshot_due(self.turn))
+        if due and self.journal.store is not None:
+            snapshot = self.snapshot()
+            self._last_snapshot_turn = self.turn
+        self.journal.commit(snapshot)
+
+    def _get_battle_state(self):
+        """
+        Get the current state of the battle.
+        Only log entries added since the previous call are rendered and included.
+        
+        Returns:
+            BattleState: Current battle state including character stats and battle progress
+        """
+        new_entries = self.battle_log.render(self._log_cursor, self.locale)
+        self._log_cursor = len(self.battle_log)
+        return BattleState(
+            CharacterState.from_character(self.player),
+            CharacterState.from_character(self.enemy),
+            self.turn,
+            new_entries,
+            self.battle_over,
+            self.victory
+        )
+
+def _replay_damage(battle, event):
+    target = battle._character(event['target'])
+    target.current_hp = max(0, target.current_hp - event['amount'])
+
+def _replay_heal(battle, event):
+    battle._character(event['target']).heal(event['amount'])
+
+def _replay_mp(battle, event):
+    battle._character(event['target']).current_mp -= event['amount']
+
+def _replay_item(battle, event):
+    target = battle._character(event['target'])
+    if event['count'] < 0:
+        target.remove_item(event['name'])
+    else:
+        target.add_item(event['name'], event['count'])
+
+def _replay_stolen(battle, event):
+    battle._character(event['target']).stolen = True
+
+def _replay_stat(battle, event):
+    target = battle._character(event['target'])
+    setattr(target, event['stat'], getattr(target, event['stat']) + event['delta'])
+
+def _replay_modifier(battle, event):
+    battle._character(event['target']).modifiers.add(StatModifier(
+        event['stat'], event['kind'], event['value'], event['duration'], event['source']
+    ))
+
+def _count_down_statuses(character):
+    """Shorten timed statuses by one round; a negative duration lasts until triggered."""
+    remaining = []
+    for status_effect in character.status_effects:
+        if status_effect.duration > 0:
+            if status_effect.duration == 1:
+                continue
+            status_effect = replace(status_effect, duration=status_effect.duration - 1)
+        remaining.append(status_effect)
+    character.status_effects = remaining
+
+def _tick_round(battle):
+    """Count down statuses and modifiers at the end of a round. Replayed from 'turn' events."""
+    for character in (battle.player, battle.enemy):
+        _count_down_statuses(character)
+        character.modifiers.tick()
+
+def _replay_turn(battle, event):
+    _tick_round(battle)
+
+def _replay_status_add(battle, event):
+    target = battle._character(event['target'])
+    target.status_effects.append(
+        StatusEffect(status=Status(event['status']), duration=event['duration'], potency=event['potency'])
+    )
+    battle.turn = event['turn']
+    battle.refresh_disabled(target)
+
+def _replay_status_remove(battle, event):
+    target = battle._character(event['target'])
+    removed = Status(event['status'])
+    for status in target.status_effects:
+        if status.status is removed:
+            target.status_effects.remove(status)
+            break
+    battle.turn = event['turn']
+    battle.refresh_disabled(target)
+
+def _replay_end(battle, event):
+    battle.battle_over = True
+    battle.victory = event['victory']
+    battle.player.modifiers.clear()
+    battle.player.status_effects = []
+    battle.player.disabled_until = 0
+
+def _replay_exp(battle, event):
+    battle._character(event['target']).gain_experience(event['amount'])
+
+# Journal event type -> state change applied during replay
+_REPLAY_HANDLERS = {
+    'damage': _replay_damage,
+    'heal': _replay_heal,
+    'mp': _replay_mp,
+    'item': _replay_item,
+    'stolen': _replay_stolen,
+    'stat': _replay_stat,
+    'modifier': _replay_modifier,
+    'turn': _replay_turn,
+    'status_add': _replay_status_add,
+    'status_remove': _replay_status_remove,
+    'end': _replay_end,
+    'exp': _replay_exp
+}
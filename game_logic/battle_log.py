@@ -0,0 +1,99 @@
+"""
+Compact battle log storing (code, args) entries.
+Entries are appended to a preallocated buffer and only rendered to text at
+serialization time, so simulations that never read the log never format it.
+"""
+
+from .messages import DEFAULT_LOCALE, render_message
+
+class BattleLog:
+    """
+    Growable buffer of log entries.
+    Each entry is a (message code, args tuple) pair; codes are the interned
+    keys of MESSAGE_TEMPLATES.
+    """
+
+    __slots__ = ('_entries', '_size')
+
+    def __init__(self, capacity=32):
+        """
+        Initialize an empty log.
+
+        Args:
+            capacity (int): Number of entry slots to preallocate
+        """
+        self._entries = [None] * capacity
+        self._size = 0
+
+    def add(self, code, *args):
+        """
+        Append an entry, doubling the buffer when it is full.
+
+        Args:
+            code (str): Message code in MESSAGE_TEMPLATES
+            *args: Template arguments
+        """
+        if self._size == len(self._entries):
+            self._entries.extend([None] * len(self._entries))
+        self._entries[self._size] = (code, args)
+        self._size += 1
+
+    def __len__(self):
+        return self._size
+
+    def entries(self, start=0):
+        """
+        Get the raw (code, args) entries.
+
+        Args:
+            start (int): Index of the first entry to return
+
+        Returns:
+            list: Entries from start to the end of the log
+        """
+        return self._entries[start:self._size]
+
+    def render(self, start=0, locale=DEFAULT_LOCALE):
+        """
+        Render entries to text.
+
+        Args:
+            start (int): Index of the first entry to render
+            locale (str): Locale of the message templates
+
+        Returns:
+            list: Rendered messages
+        """
+        return [render_message(code, args, locale) for code, args in self.entries(start)]
+
+    def condensed(self, start=0, locale=DEFAULT_LOCALE):
+        """
+        Render entries with repeats folded together.
+        Entries with the same code and the same text arguments (actor,
+        target, spell...) become one line in order of first appearance,
+        with their numeric arguments summed and a repeat count appended.
+
+        Args:
+            start (int): Index of the first entry to include
+            locale (str): Locale of the message templates
+
+        Returns:
+            list: Rendered lines
+        """
+        groups = {}
+        for code, args in self.entries(start):
+            key = (code, tuple(arg for arg in args if not isinstance(arg, int)))
+            group = groups.get(key)
+            if group is None:
+                groups[key] = [list(args), 1]
+            else:
+                totals = group[0]
+                for index, arg in enumerate(args):
+                    if isinstance(arg, int):
+                        totals[index] += arg
+                group[1] += 1
+        lines = []
+        for (code, _), (args, count) in groups.items():
+            line = render_message(code, args, locale)
+            lines.append(f"{line} (x{count})" if count > 1 else line)
+        return lines
@@ -0,0 +1,84 @@
+"""
+Battle state snapshots sent to the client.
+
+These are plain slotted dataclasses so a JSON encoder (see json_provider.py)
+can serialize them field by field without first building nested dicts.
+"""
+
+from dataclasses import dataclass
+
+@dataclass(slots=True)
+class CharacterState:
+    """Client-facing view of a character, with the fields of Character.to_dict."""
+    name: str
+    max_hp: int
+    current_hp: int
+    max_mp: int
+    current_mp: int
+    strength: int
+    defense: int
+    magic: int
+    magic_defense: int
+    agility: int
+    luck: int
+    level: int
+    experience: int
+    abilities: list
+    skills: list
+    black_magic: list
+    white_magic: list
+    special_move: str
+    exp_value: int
+    drops: list
+    equipment: dict
+    inventory: dict
+
+    @classmethod
+    def from_character(cls, character):
+        """
+        Capture a character's current state.
+
+        Args:
+            character (Character): Character to capture
+
+        Returns:
+            CharacterState: The captured state
+        """
+        return cls(
+            character.name,
+            character.max_hp,
+            character.current_hp,
+            character.max_mp,
+            character.current_mp,
+            character.strength,
+            character.defense,
+            character.magic,
+            character.magic_defense,
+            character.agility,
+            character.luck,
+            character.level,
+            character.experience,
+            character.abilities,
+            character.skills,
+            character.black_magic,
+            character.white_magic,
+            character.special_move,
+            character.exp_value,
+            character.drops,
+            dict(character.equipment),
+            dict(character.inventory)
+        )
+
+@dataclass(slots=True)
+class BattleState:
+    """
+    Battle state returned by Battle.start_battle and Battle.process_turn.
+    battle_log only holds the entries added since the previous state.
+    """
+    player: CharacterState
+    enemy: CharacterState
+    turn: int
+    battle_log: list
+    battle_over: bool
+    victory: bool
+    action_success: bool = None
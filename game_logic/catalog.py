@@ -0,0 +1,95 @@
+"""
+Read-only game catalogs for clients.
+
+Each catalog is plain JSON-ready data built from the static game tables, so
+the web layer can encode and compress it once at startup.
+"""
+
+from .character_templates import CHARACTER_TEMPLATES
+from .enemy_database import ENEMY_DATABASE
+from .items import ITEM_DATABASE
+from .skills import SKILL_COSTS, SKILL_EFFECTS, SPECIAL_MOVES
+from .spells import SPELL_REGISTRY, get_spell
+
+def templates_catalog():
+    """
+    Get the playable character templates.
+
+    Returns:
+        dict: Character type -> template
+    """
+    return CHARACTER_TEMPLATES
+
+def enemies_catalog():
+    """
+    Get the enemy database without internal scaling parameters.
+
+    Returns:
+        dict: Enemy name -> base stats, special move, abilities, exp value, drops,
+            elemental affinities and description
+    """
+    return {
+        name: {
+            'base_stats': data['base_stats'],
+            'special_move': data['special_move'],
+            'description': data['description'],
+            'exp_value': data['exp_value'],
+            'abilities': data['abilities'],
+            'drops': data['drops'],
+            'affinities': data.get('affinities', {})
+        }
+        for name, data in ENEMY_DATABASE.items()
+    }
+
+def skills_catalog():
+    """
+    Get abilities, skills and enemy special moves.
+
+    Returns:
+        dict: 'skills' (name -> mp cost and effect kind) and 'special_moves'
+    """
+    return {
+        'skills': {
+            name: {'mp_cost': SKILL_COSTS.get(name, 0), 'effect': definition['effect']}
+            for name, definition in SKILL_EFFECTS.items()
+        },
+        'special_moves': SPECIAL_MOVES
+    }
+
+def spells_catalog():
+    """
+    Get every castable spell.
+
+    Returns:
+        dict: Spell name -> type, mp cost, power, element, targeting and description
+    """
+    catalog = {}
+    for name in SPELL_REGISTRY:
+        spell = get_spell(name)
+        catalog[name] = {
+            'type': spell.spell_type.value,
+            'mp_cost': spell.mp_cost,
+            'base_power': spell.base_power,
+            'damage_type': spell.damage_type.value,
+            'targeting': spell.targeting,
+            'description': spell.description
+        }
+    return catalog
+
+def items_catalog():
+    """
+    Get every item.
+
+    Returns:
+        dict: Item name -> definition
+    """
+    return ITEM_DATABASE
+
+# Catalog name -> builder
+CATALOGS = {
+    'templates': templates_catalog,
+    'enemies': enemies_catalog,
+    'skills': skills_catalog,
+    'spells': spells_catalog,
+    'items': items_catalog
+}
@@ -1,4 +1,14 @@
+import logging
 from .skills import get_skill_cost, get_spell_power, get_special_move_power
+from .character_templates import get_character_template
+from .spells import get_spell
+from .affinities import affinity_offset
+from .items import EQUIPMENT_SLOTS, equipment_bonus, get_item
+from .modifiers import ModifierStack, NEUTRAL
+from .progression import apply_levels, get_progression
+from .shared import thread_rng
+
+logger = logging.getLogger(__name__)
 
 class Character:
     """
@@ -46,6 +56,24 @@ class Character:
         self.special_move = None  # Special move for enemies
         self.exp_value = 0       # Experience points awarded when defeated
         self.drops = []          # Potential item drops
+        self.stolen = False      # Whether the enemy has already been stolen from
+        self.affinity_offset = None  # Row offset in the elemental affinity matrix
+        
+        # Active status effects (StatusEffect instances)
+        self.status_effects = []
+        self.disabled_until = 0  # First battle round the character can act in again (crowd control)
+        
+        # Active buffs and debuffs (see game_logic.modifiers)
+        self.modifiers = ModifierStack()
+        
+        # Equipment (slot -> item name) and inventory (item name -> count)
+        self.equipment = {}
+        self.inventory = {}
+        self.equipment_bonus = {}  # Cached stat bonuses of the equipped items
+        
+        # Catalog references used to rehydrate compact session state
+        self.template_key = None  # Character template key for players (e.g. 'warrior')
+        self.spawn_level = None   # Player level the enemy was scaled for
         
         # Set initial abilities based on character type
         self._init_abilities()
@@ -65,6 +93,93 @@ class Character:
             self.abilities = ["Steal"]
             self.skills = ["Dark Attack", "Flee"]
     
+    def stat(self, stat):
+        """
+        Get a stat including equipment bonuses and active modifiers.
+        Both are cached totals, so this stays constant time however many
+        modifiers are stacked.
+        
+        Args:
+            stat (str): Stat name; 'attack' is the equipped weapon's power
+            
+        Returns:
+            int: Effective stat value
+        """
+        flat, scale = self.modifiers.totals.get(stat, NEUTRAL)
+        return int((getattr(self, stat, 0) + self.equipment_bonus.get(stat, 0) + flat) * scale)
+
+    def refresh_equipment(self):
+        """Recompute the cached equipment bonuses after the equipment changed."""
+        self.equipment_bonus = equipment_bonus(
+            tuple(self.equipment[slot] for slot in EQUIPMENT_SLOTS if slot in self.equipment)
+        )
+
+    def add_item(self, item_name, count=1):
+        """
+        Put items into the inventory.
+        
+        Args:
+            item_name (str): Name of the item
+            count (int): Number of items
+        """
+        self.inventory[item_name] = self.inventory.get(item_name, 0) + count
+
+    def remove_item(self, item_name):
+        """
+        Take one item out of the inventory.
+        
+        Args:
+            item_name (str): Name of the item
+            
+        Returns:
+            bool: True if the character had the item
+        """
+        count = self.inventory.get(item_name, 0)
+        if count <= 0:
+            return False
+        if count == 1:
+            del self.inventory[item_name]
+        else:
+            self.inventory[item_name] = count - 1
+        return True
+
+    def equip(self, item_name):
+        """
+        Equip an item from the inventory, returning any replaced item to it.
+        
+        Args:
+            item_name (str): Name of the equipment
+            
+        Returns:
+            bool: True if the item was equipped
+        """
+        item = get_item(item_name)
+        if item is None or item['type'] not in EQUIPMENT_SLOTS or not self.remove_item(item_name):
+            return False
+        previous = self.equipment.get(item['type'])
+        if previous:
+            self.add_item(previous)
+        self.equipment[item['type']] = item_name
+        self.refresh_equipment()
+        return True
+
+    def unequip(self, slot):
+        """
+        Move the item in an equipment slot back to the inventory.
+        
+        Args:
+            slot (str): Equipment slot
+            
+        Returns:
+            bool: True if something was unequipped
+        """
+        item_name = self.equipment.pop(slot, None)
+        if item_name is None:
+            return False
+        self.add_item(item_name)
+        self.refresh_equipment()
+        return True
+
     def use_mp(self, cost):
         """
         Attempt to use MP for an ability or spell.
@@ -80,33 +195,48 @@ class Character:
             return True
         return False
     
-    def calculate_magic_damage(self, target, spell_name):
+    def calculate_magic_damage(self, target, spell_name, rng=None):
         """
         Calculate magical damage using FFX's formula.
         
         Args:
             target (Character): The target of the spell
             spell_name (str): Name of the spell to cast
+            rng (random.Random, optional): Random source, defaults to the calling thread's stream
             
         Returns:
             dict: Contains damage amount and whether it was a critical hit
         """
-        import random
+        random = rng or thread_rng()
         
         spell_power = get_spell_power(spell_name)
-        base_damage = (self.magic * 0.8 + spell_power * 0.5)
+        base_damage = (self.stat('magic') * 0.8 + spell_power * 0.5)
         random_factor = random.uniform(0, 0.25)
         
         # Critical hits are less common with magic
-        crit_chance = min(self.luck / 4, 15) / 100
+        crit_chance = min(self.stat('luck') / 4, 15) / 100
         is_critical = random.random() < crit_chance
         
         modifier = 1.5 if is_critical else 1.0
         
-        damage = (base_damage * (1 + random_factor) * modifier) - (target.magic_defense * 0.875)
+        damage = (base_damage * (1 + random_factor) * modifier) - (target.stat('magic_defense') * 0.875)
         
         return {'damage': max(1, int(damage)), 'is_critical': is_critical}
     
+    def get_spell(self, spell_name):
+        """
+        Get the spell object for a spell this character knows.
+        
+        Args:
+            spell_name (str): Name of the spell
+            
+        Returns:
+            Spell: The spell instance, or None if unknown or not learned
+        """
+        if spell_name not in self.black_magic and spell_name not in self.white_magic:
+            return None
+        return get_spell(spell_name)
+    
     def get_available_actions(self):
         """
         Get all currently available actions for the character.
@@ -173,14 +303,12 @@ class Character:
         actual_damage = max(1, damage)
         old_hp = self.current_hp
         self.current_hp = max(0, self.current_hp - actual_damage)
-        print(f"{self.name} taking {actual_damage} damage: {old_hp} -> {self.current_hp} HP")
+        logger.debug("%s taking %d damage: %d -> %d HP", self.name, actual_damage, old_hp, self.current_hp)
         return actual_damage
 
     def is_alive(self):
         """Check if the character is still alive."""
-        alive = self.current_hp > 0
-        print(f"Checking if {self.name} is alive: HP={self.current_hp}, result={alive}")
-        return alive
+        return self.current_hp > 0
 
     def heal(self, amount):
         """
@@ -191,24 +319,25 @@ class Character:
         """
         self.current_hp = min(self.max_hp, self.current_hp + amount)
 
-    def calculate_damage(self, target, is_special_move=False):
+    def calculate_damage(self, target, is_special_move=False, rng=None):
         """
         Calculate physical damage using FFX's formula.
         
         Args:
             target (Character): The target of the attack
             is_special_move (bool): Whether this is a special move attack
+            rng (random.Random, optional): Random source, defaults to the calling thread's stream
             
         Returns:
             dict: Contains damage amount and whether it was a critical hit
         """
-        import random
+        random = rng or thread_rng()
         
-        base_damage = (self.strength * 0.8 + self.level * 0.5)
+        base_damage = (self.stat('strength') * 0.8 + self.level * 0.5)
         random_factor = random.uniform(0, 0.25)
         
         # Critical hit chance based on luck (max 25%)
-        crit_chance = min(self.luck / 2, 25) / 100
+        crit_chance = min(self.stat('luck') / 2, 25) / 100
         is_critical = random.random() < crit_chance
         
         modifier = 1.5 if is_critical else 1.0
@@ -217,10 +346,10 @@ class Character:
         if is_special_move and self.special_move:
             modifier *= get_special_move_power(self.special_move)
         
-        # Add weapon bonus (simplified to level-based bonus)
-        weapon_bonus = self.level * 0.1
+        # Add the equipped weapon's power
+        weapon_bonus = self.stat('attack')
         
-        damage = (base_damage * (1 + random_factor) * modifier + weapon_bonus) - (target.defense * 0.875)
+        damage = (base_damage * (1 + random_factor) * modifier + weapon_bonus) - (target.stat('defense') * 0.875)
         
         final_damage = max(1, int(damage))
         
@@ -229,31 +358,26 @@ class Character:
     def gain_experience(self, amount):
         """
         Add experience points and level up if necessary.
+        Any amount resolves in one step on the class's cumulative experience table.
         
         Args:
             amount (int): Amount of experience to gain
         """
-        self.experience += amount
-        while self.experience >= 100:
-            self.level_up()
-            self.experience -= 100
+        new_level, self.experience = get_progression(self.template_key).resolve(
+            self.level, self.experience + amount
+        )
+        apply_levels(self, new_level)
 
-    def level_up(self):
+    def level_up(self, levels=1):
         """
         Increase character level and improve stats.
-        Similar to FFX's sphere grid, but simplified to automatic improvements.
-        """
-        self.level += 1
-        self.max_hp += 40
-        self.current_hp = self.max_hp
-        self.max_mp += 5
-        self.current_mp = self.max_mp
-        self.strength += 1
-        self.defense += 1
-        self.magic += 1
-        self.magic_defense += 1
-        self.agility += 1
-        self.luck += 1
+        Similar to FFX's sphere grid, but simplified to automatic improvements
+        from the class's growth table (see game_logic.progression).
+        
+        Args:
+            levels (int): Number of levels to gain
+        """
+        apply_levels(self, self.level + levels)
 
     def to_dict(self):
         """
@@ -282,9 +406,81 @@ class Character:
             'white_magic': self.white_magic,
             'special_move': self.special_move,
             'exp_value': self.exp_value,
-            'drops': self.drops
+            'drops': self.drops,
+            'equipment': self.equipment,
+            'inventory': self.inventory
         }
 
+    @classmethod
+    def from_template(cls, character_type):
+        """
+        Create a new level 1 character from a character template.
+        
+        Args:
+            character_type (str): Key of the template in CHARACTER_TEMPLATES
+            
+        Returns:
+            Character: New character instance with the template's stats and abilities
+            
+        Raises:
+            KeyError: If character_type is not found
+        """
+        char_data = get_character_template(character_type)
+        character = cls(
+            char_data['name'],
+            char_data['hp'],
+            char_data['mp'],
+            char_data['strength'],
+            char_data['defense'],
+            char_data['magic'],
+            char_data['magic_defense'],
+            char_data['agility'],
+            char_data['luck']
+        )
+        character.abilities = list(char_data['abilities'])
+        character.skills = list(char_data['skills'])
+        character.black_magic = list(char_data['black_magic'])
+        character.white_magic = list(char_data['white_magic'])
+        character.equipment = dict(char_data['equipment'])
+        character.inventory = dict(char_data['inventory'])
+        character.refresh_equipment()
+        character.template_key = character_type
+        return character
+
+    @classmethod
+    def from_enemy_data(cls, enemy_data, spawn_level):
+        """
+        Create an enemy character from scaled enemy database data.
+        
+        Args:
+            enemy_data (dict): Scaled enemy data from get_scaled_enemy_stats
+            spawn_level (int): Player level the stats were scaled for
+            
+        Returns:
+            Character: New enemy character instance
+        """
+        stats = enemy_data["stats"]
+        enemy = cls(
+            enemy_data["name"],
+            stats["hp"],
+            stats["mp"],
+            stats["strength"],
+            stats["defense"],
+            stats["magic"],
+            stats["magic_defense"],
+            stats["agility"],
+            stats["luck"]
+        )
+        
+        # Store additional enemy-specific data
+        enemy.special_move = enemy_data["special_move"]
+        enemy.exp_value = enemy_data["exp_value"]
+        enemy.abilities = enemy_data["abilities"]
+        enemy.drops = enemy_data["drops"]
+        enemy.affinity_offset = affinity_offset(enemy_data["name"])
+        enemy.spawn_level = spawn_level
+        return enemy
+
     @classmethod
     def from_dict(cls, data):
         """
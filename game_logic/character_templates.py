@@ -2,7 +2,9 @@
 Character templates and base stats for different character classes.
 """
 
-CHARACTER_TEMPLATES = {
+from .shared import freeze
+
+CHARACTER_TEMPLATES = freeze({
     'warrior': {
         'name': 'Warrior',
         'hp': 840,
@@ -17,7 +19,9 @@ CHARACTER_TEMPLATES = {
         'abilities': ["Cheer", "Provoke"],
         'skills': ["Power Break", "Armor Break"],
         'black_magic': [],
-        'white_magic': []
+        'white_magic': [],
+        'equipment': {'weapon': 'Bronze Sword', 'armor': 'Leather Armor'},
+        'inventory': {'Potion': 3}
     },
     'mage': {
         'name': 'Black Mage',
@@ -33,7 +37,9 @@ CHARACTER_TEMPLATES = {
         'abilities': [],
         'skills': [],
         'black_magic': ["Fire", "Thunder", "Blizzard"],
-        'white_magic': ["Cure"]
+        'white_magic': ["Cure"],
+        'equipment': {'weapon': 'Oak Staff', 'armor': 'Cotton Robe'},
+        'inventory': {'Potion': 2, 'Spirit Shard': 1}
     },
     'rogue': {
         'name': 'Thief',
@@ -49,9 +55,11 @@ CHARACTER_TEMPLATES = {
         'abilities': ["Steal"],
         'skills': ["Dark Attack", "Flee"],
         'black_magic': [],
-        'white_magic': []
+        'white_magic': [],
+        'equipment': {'weapon': 'Dagger', 'armor': 'Leather Armor'},
+        'inventory': {'Potion': 3}
     }
-}
+})
 
 def get_character_template(character_type):
     """
@@ -61,11 +69,11 @@ def get_character_template(character_type):
         character_type (str): The type of character to get template for
         
     Returns:
-        dict: Character template with base stats and abilities
+        Mapping: Read-only character template with base stats and abilities
         
     Raises:
         KeyError: If character_type is not found
     """
     if character_type not in CHARACTER_TEMPLATES:
         raise KeyError(f"Character type '{character_type}' not found")
-    return CHARACTER_TEMPLATES[character_type].copy() 
\ No newline at end of file
+    return CHARACTER_TEMPLATES[character_type] 
\ No newline at end of file
@@ -0,0 +1,224 @@
+"""
+Difficulty auto-tuning against target win rates.
+
+For every enemy and player level, the enemy's stat multiplier is bisected
+until batches of simulated battles hit that level's target player win
+rate, so early levels can be tuned gentler than late ones. Every
+candidate multiplier is scored on the same battle seeds, so candidates differ
+only in the multiplier, not in the battles drawn. Win rates on fixed seeds
+are still not strictly monotone in the multiplier (a single battle can flip
+either way), so the search keeps the candidate that came closest to the
+target instead of trusting the final bracket. The tuned multipliers are
+saved to TUNING_FILE, which enemy_database loads at startup; in play,
+scaling an enemy remains a cached lookup.
+
+Enemy scaling does not know the player's class, so each (enemy, level)
+multiplier is tuned for the mean win rate over the tuned classes, aiming at
+the mean of their targets at that level. The per-class win rates at the
+tuned multiplier are saved alongside it.
+
+Usage:
+    python -m game_logic.difficulty --target 0.8 --levels 1 5 10 20 --level-target 1=0.95
+"""
+
+import argparse
+import json
+import multiprocessing
+import random
+from .battle import Battle
+from .character import Character
+from .character_templates import CHARACTER_TEMPLATES
+from .enemy_database import ENEMY_DATABASE, TUNING_FILE, scale_enemy_stats
+from .journal import NullJournal
+from .policies import DEFAULT_MAX_TURNS, auto_battle, make_policy
+
+DEFAULT_TARGET_WIN_RATE = 0.8
+DEFAULT_LEVELS = (1, 5, 10, 20, 30, 50)
+DEFAULT_BATTLES = 200
+DEFAULT_POLICY = 'strongest_spell'
+
+# Stat multiplier search range and bisection steps (range / 2**steps resolution)
+MULTIPLIER_BOUNDS = (0.1, 4.0)
+BISECTION_STEPS = 10
+
+def win_rate(character_type, enemy_name, level, stat_multiplier, battles=DEFAULT_BATTLES,
+             seed=0, policy=DEFAULT_POLICY):
+    """
+    Measure the player win rate against an enemy at a stat multiplier.
+    Battles that reach the turn limit count as lost.
+
+    Args:
+        character_type (str): Character template the player uses
+        enemy_name (str): Name of the enemy
+        level (int): Player level, also the level the enemy is scaled to
+        stat_multiplier (float): Enemy stat multiplier to evaluate
+        battles (int): Number of battles to simulate
+        seed (int): Seed of the battle seeds; equal seeds replay the same battles
+        policy (str): Name of the player policy (see policies.make_policy)
+
+    Returns:
+        float: Fraction of battles won
+    """
+    enemy_data = scale_enemy_stats(enemy_name, level, stat_multiplier)
+    player_policy = make_policy(policy)
+    seeds = random.Random(seed)
+    wins = 0
+    for _ in range(battles):
+        player = Character.from_template(character_type)
+        player.level_up(level - 1)
+        enemy = Character.from_enemy_data(enemy_data, level)
+        battle = Battle(player, enemy=enemy, journal=NullJournal(), seed=seeds.getrandbits(64))
+        auto_battle(battle, player_policy, DEFAULT_MAX_TURNS)
+        wins += battle.victory
+    return wins / battles
+
+def tune_enemy(enemy_name, level, targets, battles=DEFAULT_BATTLES, seed=0, policy=DEFAULT_POLICY):
+    """
+    Bisect the stat multiplier of an enemy at one level.
+    Returns the probed multiplier whose mean win rate came closest to the
+    goal, which is robust to brackets that non-monotone win rates mislead.
+
+    Args:
+        enemy_name (str): Name of the enemy
+        level (int): Player level
+        targets (dict): Character template -> target win rate
+        battles (int): Battles per class and candidate multiplier
+        seed (int): Seed of the battle seeds shared by every candidate
+        policy (str): Name of the player policy
+
+    Returns:
+        tuple: (stat multiplier, character template -> win rate at that multiplier)
+    """
+    goal = sum(targets.values()) / len(targets)
+    low, high = MULTIPLIER_BOUNDS
+    best = None  # (distance from goal, multiplier, rates)
+    for _ in range(BISECTION_STEPS):
+        middle = round((low + high) / 2, 3)
+        rates = {c: win_rate(c, enemy_name, level, middle, battles, seed, policy) for c in targets}
+        mean = sum(rates.values()) / len(rates)
+        if best is None or abs(mean - goal) < best[0]:
+            best = (abs(mean - goal), middle, rates)
+        if mean > goal:
+            low = middle  # Player wins too often, strengthen the enemy
+        else:
+            high = middle
+    _, multiplier, rates = best
+    return multiplier, rates
+
+def level_targets(targets, by_level, level):
+    """
+    Get the class targets that apply at one level.
+
+    Args:
+        targets (dict): Character template -> target win rate
+        by_level (dict): Level -> target win rate for every class at that level
+        level (int): Player level
+
+    Returns:
+        dict: Character template -> target win rate at the level
+    """
+    if level not in by_level:
+        return targets
+    return {character_type: by_level[level] for character_type in targets}
+
+def _tune_job(job):
+    """Tune one (enemy, level) pair in a worker process."""
+    enemy_name, level, targets, battles, seed, policy = job
+    return enemy_name, level, tune_enemy(enemy_name, level, targets, battles, seed, policy)
+
+def tune(targets, levels=DEFAULT_LEVELS, enemy_names=tuple(ENEMY_DATABASE), battles=DEFAULT_BATTLES,
+         seed=0, policy=DEFAULT_POLICY, num_workers=None, by_level=None):
+    """
+    Tune the stat multiplier of every enemy at every level.
+
+    Args:
+        targets (dict): Character template -> target win rate
+        levels (iterable): Player levels to tune
+        enemy_names (iterable): Enemies to tune
+        battles (int): Battles per class and candidate multiplier
+        seed (int): Seed of the battle seeds
+        policy (str): Name of the player policy
+        num_workers (int, optional): Worker processes, defaults to the CPU count
+        by_level (dict, optional): Level -> target win rate for every class,
+            replacing targets at that level
+
+    Returns:
+        dict: Tuning data with 'targets', 'level_targets', 'battles', 'policy', 'multipliers'
+            (enemy -> level -> multiplier) and 'win_rates' (enemy -> level -> class -> rate)
+    """
+    by_level = by_level or {}
+    jobs = [(enemy_name, level, level_targets(targets, by_level, level), battles, seed, policy)
+            for enemy_name in enemy_names for level in levels]
+    num_workers = max(1, min(num_workers or multiprocessing.cpu_count(), len(jobs)))
+    if num_workers == 1:
+        results = list(map(_tune_job, jobs))
+    else:
+        with multiprocessing.Pool(num_workers) as pool:
+            results = pool.map(_tune_job, jobs)
+
+    tuning = {'targets': dict(targets), 'level_targets': {str(level): rate for level, rate in by_level.items()},
+              'battles': battles, 'policy': policy, 'multipliers': {}, 'win_rates': {}}
+    for enemy_name, level, (multiplier, rates) in results:
+        tuning['multipliers'].setdefault(enemy_name, {})[str(level)] = multiplier
+        tuning['win_rates'].setdefault(enemy_name, {})[str(level)] = rates
+    return tuning
+
+def save_tuning(tuning, path=TUNING_FILE):
+    """
+    Write tuning data where enemy_database.load_tuning reads it.
+
+    Args:
+        tuning (dict): Tuning data from tune
+        path (str): Destination file
+    """
+    with open(path, 'w') as f:
+        json.dump(tuning, f, indent=2, sort_keys=True)
+
+def _class_target(value):
+    """Parse a CLASS=RATE command line argument."""
+    character_type, _, rate = value.partition('=')
+    if character_type not in CHARACTER_TEMPLATES or not rate:
+        raise argparse.ArgumentTypeError(f"expected CLASS=RATE with CLASS in {', '.join(CHARACTER_TEMPLATES)}")
+    return character_type, float(rate)
+
+def _level_target(value):
+    """Parse a LEVEL=RATE command line argument."""
+    level, _, rate = value.partition('=')
+    try:
+        return int(level), float(rate)
+    except ValueError:
+        raise argparse.ArgumentTypeError("expected LEVEL=RATE") from None
+
+def main(argv=None):
+    """Tune every enemy from the command line and save the result."""
+    parser = argparse.ArgumentParser(description="Tune enemy stat multipliers to target win rates.")
+    parser.add_argument('--target', type=float, default=DEFAULT_TARGET_WIN_RATE,
+                        help="target win rate for every class")
+    parser.add_argument('--class-target', type=_class_target, action='append', default=[],
+                        metavar='CLASS=RATE', help="target win rate for one class")
+    parser.add_argument('--level-target', type=_level_target, action='append', default=[],
+                        metavar='LEVEL=RATE', help="target win rate for every class at one level")
+    parser.add_argument('--levels', type=int, nargs='+', default=list(DEFAULT_LEVELS))
+    parser.add_argument('--enemies', nargs='+', choices=list(ENEMY_DATABASE), default=list(ENEMY_DATABASE))
+    parser.add_argument('--battles', type=int, default=DEFAULT_BATTLES,
+                        help="battles per class and candidate multiplier")
+    parser.add_argument('--policy', default=DEFAULT_POLICY)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--workers', type=int, default=None)
+    parser.add_argument('--output', default=TUNING_FILE)
+    args = parser.parse_args(argv)
+
+    targets = {character_type: args.target for character_type in CHARACTER_TEMPLATES}
+    targets.update(args.class_target)
+    tuning = tune(targets, args.levels, args.enemies, args.battles, args.seed, args.policy, args.workers,
+                  dict(args.level_target))
+    save_tuning(tuning, args.output)
+
+    for enemy_name, by_level in tuning['multipliers'].items():
+        for level, multiplier in by_level.items():
+            rates = ', '.join(f"{c} {rate:.0%}" for c, rate in tuning['win_rates'][enemy_name][level].items())
+            print(f"{enemy_name:<16} level {level:>3}  x{multiplier:<6} {rates}")
+    print(f"Saved to {args.output}")
+
+if __name__ == '__main__':
+    main()
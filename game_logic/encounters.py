@@ -0,0 +1,182 @@
+"""
+Encounter tables for weighted, level-banded and region-aware enemy spawning.
+
+An encounter table lists formations (one or more enemies from
+ENEMY_DATABASE) with a weight, a rarity and the level band and regions they
+appear in. Each (region, level band) pair is compiled once into an alias
+table, so drawing an encounter costs one random index and one coin flip no
+matter how many formations the table holds.
+"""
+
+import bisect
+from .shared import freeze, thread_rng
+
+# Rarity -> weight multiplier applied on top of a formation's base weight
+RARITY_WEIGHTS = freeze({
+    'common': 1.0,
+    'uncommon': 0.5,
+    'rare': 0.15,
+    'legendary': 0.03
+})
+
+DEFAULT_REGION = 'field'
+
+# Default formations built on ENEMY_DATABASE.
+# levels is an inclusive (min, max) band; regions lists where the formation appears.
+DEFAULT_FORMATIONS = freeze([
+    {'enemies': ('Goblin',), 'weight': 10, 'rarity': 'common', 'levels': (1, 10), 'regions': ('field', 'forest')},
+    {'enemies': ('Wolf',), 'weight': 8, 'rarity': 'common', 'levels': (1, 15), 'regions': ('field', 'forest')},
+    {'enemies': ('Sahagin',), 'weight': 8, 'rarity': 'common', 'levels': (1, 20), 'regions': ('field', 'coast')},
+    {'enemies': ('Ogre',), 'weight': 5, 'rarity': 'uncommon', 'levels': (1, 99), 'regions': ('field', 'forest', 'cave')},
+    {'enemies': ('Dark Elemental',), 'weight': 4, 'rarity': 'uncommon', 'levels': (1, 99), 'regions': ('field', 'cave')},
+    {'enemies': ('Goblin', 'Goblin'), 'weight': 6, 'rarity': 'common', 'levels': (3, 20), 'regions': ('forest',)},
+    {'enemies': ('Wolf', 'Wolf', 'Wolf'), 'weight': 4, 'rarity': 'uncommon', 'levels': (8, 40), 'regions': ('forest',)},
+    {'enemies': ('Sahagin', 'Sahagin'), 'weight': 5, 'rarity': 'common', 'levels': (5, 40), 'regions': ('coast',)},
+    {'enemies': ('Ogre', 'Goblin', 'Goblin'), 'weight': 3, 'rarity': 'rare', 'levels': (10, 99), 'regions': ('cave',)},
+    {'enemies': ('Dark Elemental', 'Dark Elemental'), 'weight': 2, 'rarity': 'rare', 'levels': (15, 99), 'regions': ('cave',)},
+    {'enemies': ('Goblin',), 'weight': 10, 'rarity': 'common', 'levels': (11, 99), 'regions': ('coast', 'cave')},
+])
+
+class AliasTable:
+    """
+    Walker/Vose alias table for O(1) sampling from a discrete distribution.
+    """
+
+    __slots__ = ('items', 'probabilities', 'aliases')
+
+    def __init__(self, items, weights):
+        """
+        Build the table.
+
+        Args:
+            items (list): Outcomes to sample
+            weights (list): Non-negative weight for each outcome
+
+        Raises:
+            ValueError: If there are no outcomes or all weights are zero
+        """
+        total = float(sum(weights))
+        if not items or total <= 0:
+            raise ValueError("Alias table needs at least one outcome with positive weight")
+
+        count = len(items)
+        scaled = [weight * count / total for weight in weights]
+        probabilities = [0.0] * count
+        aliases = [0] * count
+        small = [i for i, p in enumerate(scaled) if p < 1.0]
+        large = [i for i, p in enumerate(scaled) if p >= 1.0]
+
+        while small and large:
+            low = small.pop()
+            high = large.pop()
+            probabilities[low] = scaled[low]
+            aliases[low] = high
+            scaled[high] = scaled[high] + scaled[low] - 1.0
+            (small if scaled[high] < 1.0 else large).append(high)
+        for index in large + small:
+            probabilities[index] = 1.0
+
+        self.items = tuple(items)
+        self.probabilities = tuple(probabilities)
+        self.aliases = tuple(aliases)
+
+    def sample(self, rng=None):
+        """
+        Draw one outcome.
+
+        Args:
+            rng (random.Random, optional): Random source, defaults to the calling thread's stream
+
+        Returns:
+            The sampled outcome
+        """
+        rng = rng or thread_rng()
+        index = int(rng.random() * len(self.items))
+        if rng.random() < self.probabilities[index]:
+            return self.items[index]
+        return self.items[self.aliases[index]]
+
+class EncounterTable:
+    """
+    Weighted formations grouped by region and level band.
+    Level bands are the ranges between every formation boundary, so each
+    band has a fixed set of eligible formations and one alias table.
+    """
+
+    def __init__(self, formations=DEFAULT_FORMATIONS, rarity_weights=RARITY_WEIGHTS):
+        """
+        Compile the formations into per-(region, band) alias tables.
+
+        Args:
+            formations (list): Formation definitions like DEFAULT_FORMATIONS
+            rarity_weights (dict): Rarity -> weight multiplier
+        """
+        # Band starts: every level at which some formation enters or leaves
+        starts = set()
+        for formation in formations:
+            low, high = formation['levels']
+            starts.add(low)
+            starts.add(high + 1)
+        self._band_starts = sorted(starts)
+
+        self._tables = {}
+        regions = {region for formation in formations for region in formation['regions']}
+        for region in regions:
+            for band, start in enumerate(self._band_starts):
+                eligible = [
+                    formation for formation in formations
+                    if region in formation['regions'] and formation['levels'][0] <= start <= formation['levels'][1]
+                ]
+                if not eligible:
+                    continue
+                self._tables[(region, band)] = AliasTable(
+                    [tuple(formation['enemies']) for formation in eligible],
+                    [formation['weight'] * rarity_weights[formation['rarity']] for formation in eligible]
+                )
+
+    def _band(self, level):
+        """Get the index of the level band containing level."""
+        return bisect.bisect_right(self._band_starts, level) - 1
+
+    def draw(self, level, region=DEFAULT_REGION, rng=None):
+        """
+        Draw an encounter formation.
+
+        Args:
+            level (int): Player level
+            region (str): Region the encounter happens in
+            rng (random.Random, optional): Random source, defaults to the calling thread's stream
+
+        Returns:
+            tuple: Enemy names in the formation
+
+        Raises:
+            KeyError: If no formation is available for the region and level
+        """
+        rng = rng or thread_rng()
+        table = self._tables.get((region, self._band(level)))
+        if table is None:
+            raise KeyError(f"No encounters for region '{region}' at level {level}")
+        return table.sample(rng)
+
+    def draw_single(self, level, region=DEFAULT_REGION, rng=None, exclude=None):
+        """
+        Draw the lead enemy of an encounter, for battles against one enemy.
+
+        Args:
+            level (int): Player level
+            region (str): Region the encounter happens in
+            rng (random.Random, optional): Random source, defaults to the calling thread's stream
+            exclude (list, optional): Enemy names to redraw on
+
+        Returns:
+            str: Enemy name
+        """
+        rng = rng or thread_rng()
+        for _ in range(100):
+            enemy_name = self.draw(level, region, rng)[0]
+            if not exclude or enemy_name not in exclude:
+                return enemy_name
+        raise KeyError(f"No encounters for region '{region}' at level {level} outside {exclude}")
+
+DEFAULT_ENCOUNTERS = EncounterTable()
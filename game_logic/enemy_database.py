@@ -3,8 +3,23 @@ Enemy database for the JRPG battle system.
 Contains enemy templates and functions for generating and scaling enemies.
 """
 
+import bisect
+import json
+import logging
+import os
+from functools import lru_cache
+from .encounters import DEFAULT_ENCOUNTERS, DEFAULT_REGION
+from .shared import freeze, thread_rng
+
+logger = logging.getLogger(__name__)
+
+# Tuned stat multipliers written by game_logic.difficulty
+TUNING_FILE = os.environ.get('DIFFICULTY_TUNING_FILE') or os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), 'difficulty_tuning.json'
+)
+
 # Base stats for each enemy type
-ENEMY_DATABASE = {
+ENEMY_DATABASE = freeze({
     "Goblin": {
         "base_stats": {
             "hp": 400,
@@ -21,7 +36,8 @@ ENEMY_DATABASE = {
         "description": "A weak but agile creature that often attacks in groups.",
         "exp_value": 50,  # Base experience points for defeating this enemy
         "abilities": ["Attack", "Frenzy"],
-        "drops": ["Potion", "Small Gem"]  # Potential item drops (for future implementation)
+        "drops": ["Potion", "Small Gem"],  # Potential item drops, rolled through game_logic.loot
+        "affinities": {"fire": "weak"}  # Element -> affinity, see game_logic.affinities
     },
     "Wolf": {
         "base_stats": {
@@ -39,7 +55,8 @@ ENEMY_DATABASE = {
         "description": "A fierce predator with high strength and agility.",
         "exp_value": 65,
         "abilities": ["Attack", "Howl"],
-        "drops": ["Beast Fang", "Wolf Pelt"]
+        "drops": ["Beast Fang", "Wolf Pelt"],
+        "affinities": {"fire": "weak", "ice": "resist"}
     },
     "Ogre": {
         "base_stats": {
@@ -57,7 +74,8 @@ ENEMY_DATABASE = {
         "description": "A powerful brute with high HP and strength.",
         "exp_value": 80,
         "abilities": ["Attack", "Smash"],
-        "drops": ["Large Gem", "Ogre Bone"]
+        "drops": ["Large Gem", "Ogre Bone"],
+        "affinities": {"ice": "weak", "thunder": "resist"}
     },
     "Sahagin": {
         "base_stats": {
@@ -75,7 +93,8 @@ ENEMY_DATABASE = {
         "description": "An aquatic creature skilled in both physical and magical attacks.",
         "exp_value": 60,
         "abilities": ["Attack", "Water Splash"],
-        "drops": ["Fish Scale", "Water Gem"]
+        "drops": ["Fish Scale", "Water Gem"],
+        "affinities": {"thunder": "weak", "fire": "resist", "water": "absorb"}
     },
     "Dark Elemental": {
         "base_stats": {
@@ -93,9 +112,79 @@ ENEMY_DATABASE = {
         "description": "A magical entity with powerful dark spells.",
         "exp_value": 75,
         "abilities": ["Attack", "Dark Burst"],
-        "drops": ["Dark Matter", "Spirit Shard"]
+        "drops": ["Dark Matter", "Spirit Shard"],
+        "affinities": {"thunder": "weak", "ice": "immune", "none": "resist"}
+    }
+})
+
+def load_tuning(path=TUNING_FILE):
+    """
+    Load tuned stat multipliers saved by game_logic.difficulty.
+    A missing file means no tuning; an unreadable one is logged and ignored.
+    
+    Args:
+        path (str): Path of the tuning file
+        
+    Returns:
+        dict: Enemy name -> (tuned levels, multipliers), both ascending tuples
+    """
+    try:
+        with open(path) as f:
+            data = json.load(f)
+    except FileNotFoundError:
+        return {}
+    except (OSError, ValueError) as e:
+        logger.warning("Ignoring difficulty tuning file %s: %s", path, e)
+        return {}
+    
+    tuned = {}
+    for enemy_name, by_level in data.get('multipliers', {}).items():
+        if enemy_name not in ENEMY_DATABASE or not by_level:
+            continue
+        points = sorted((int(level), float(multiplier)) for level, multiplier in by_level.items())
+        tuned[enemy_name] = (tuple(level for level, _ in points), tuple(mult for _, mult in points))
+    return tuned
+
+TUNED_MULTIPLIERS = load_tuning()
+
+def get_stat_multiplier(enemy_name, player_level):
+    """
+    Get the stat multiplier of an enemy at a player level.
+    Tuned multipliers are interpolated linearly between tuned levels and
+    held at the nearest tuned level outside them; untuned enemies use
+    their database stat_multiplier.
+    
+    Args:
+        enemy_name (str): Name of the enemy
+        player_level (int): Current level of the player
+        
+    Returns:
+        float: Stat multiplier
+    """
+    tuned = TUNED_MULTIPLIERS.get(enemy_name)
+    if tuned is None:
+        return ENEMY_DATABASE[enemy_name]["stat_multiplier"]
+    levels, multipliers = tuned
+    index = bisect.bisect_right(levels, player_level)
+    if index == 0:
+        return multipliers[0]
+    if index == len(levels):
+        return multipliers[-1]
+    low, high = levels[index - 1], levels[index]
+    weight = (player_level - low) / (high - low)
+    return multipliers[index - 1] + (multipliers[index] - multipliers[index - 1]) * weight
+
+def _enemy_data(enemy_name, scaled_stats, exp_value):
+    """Build the scaled enemy data dict returned by the scaling functions."""
+    enemy_data = ENEMY_DATABASE[enemy_name]
+    return {
+        "name": enemy_name,
+        "stats": dict(scaled_stats),
+        "special_move": enemy_data["special_move"],
+        "exp_value": exp_value,
+        "abilities": enemy_data["abilities"],
+        "drops": enemy_data["drops"]
     }
-}
 
 def get_scaled_enemy_stats(enemy_name, player_level):
     """
@@ -113,45 +202,70 @@ def get_scaled_enemy_stats(enemy_name, player_level):
     """
     if enemy_name not in ENEMY_DATABASE:
         raise KeyError(f"Enemy '{enemy_name}' not found in database")
+    
+    scaled_stats, exp_value = _scale_enemy(enemy_name, player_level)
+    return _enemy_data(enemy_name, scaled_stats, exp_value)
+
+def scale_enemy_stats(enemy_name, player_level, stat_multiplier):
+    """
+    Get enemy stats scaled with an explicit stat multiplier, bypassing
+    tuning and caching. Used to evaluate candidate multipliers.
+    
+    Args:
+        enemy_name (str): Name of the enemy to generate
+        player_level (int): Current level of the player
+        stat_multiplier (float): Multiplier applied on top of level scaling
         
+    Returns:
+        dict: Scaled stats for the enemy
+    """
+    return _enemy_data(enemy_name, *_scaled_stats(enemy_name, player_level, stat_multiplier))
+
+@lru_cache(maxsize=None)
+def _scale_enemy(enemy_name, player_level):
+    """
+    Compute and cache the scaled stats for an enemy at a player level.
+    Enemies are rebuilt from (name, level) on every request, so the
+    scaling is only ever done once per pair.
+    
+    Args:
+        enemy_name (str): Name of the enemy
+        player_level (int): Current level of the player
+        
+    Returns:
+        tuple: Scaled stats as (stat, value) pairs and the scaled exp value
+    """
+    return _scaled_stats(enemy_name, player_level, get_stat_multiplier(enemy_name, player_level))
+
+def _scaled_stats(enemy_name, player_level, stat_mult):
+    """Scale an enemy's base stats and exp value for a player level and stat multiplier."""
     enemy_data = ENEMY_DATABASE[enemy_name]
     base_stats = enemy_data["base_stats"]
-    stat_mult = enemy_data["stat_multiplier"]
     
-    # Scale stats based on player level and enemy's base multiplier
+    # Scale stats based on player level and enemy's multiplier
     level_scaling = 1 + (player_level - 1) * 0.1
     
-    scaled_stats = {}
-    for stat, value in base_stats.items():
-        scaled_stats[stat] = int(value * stat_mult * level_scaling)
-    
-    return {
-        "name": enemy_name,
-        "stats": scaled_stats,
-        "special_move": enemy_data["special_move"],
-        "exp_value": int(enemy_data["exp_value"] * level_scaling),
-        "abilities": enemy_data["abilities"].copy(),
-        "drops": enemy_data["drops"].copy()
-    }
+    scaled_stats = tuple(
+        (stat, int(value * stat_mult * level_scaling))
+        for stat, value in base_stats.items()
+    )
+    return scaled_stats, int(enemy_data["exp_value"] * level_scaling)
 
-def get_random_enemy(player_level, exclude=None):
+def get_random_enemy(player_level, exclude=None, rng=None, region=DEFAULT_REGION):
     """
-    Get a random enemy from the database with scaled stats.
+    Get a random enemy from the encounter tables with scaled stats.
+    The enemy is the lead of a formation drawn for the player's level and region.
     
     Args:
         player_level (int): Current level of the player
         exclude (list, optional): List of enemy names to exclude from selection
+        rng (random.Random, optional): Random source, defaults to the calling thread's stream
+        region (str, optional): Region the encounter happens in
         
     Returns:
         dict: Enemy data with scaled stats
     """
-    import random
-    
-    available_enemies = list(ENEMY_DATABASE.keys())
-    if exclude:
-        available_enemies = [e for e in available_enemies if e not in exclude]
-    
-    enemy_name = random.choice(available_enemies)
+    enemy_name = DEFAULT_ENCOUNTERS.draw_single(player_level, region, rng or thread_rng(), exclude)
     return get_scaled_enemy_stats(enemy_name, player_level)
 
 def get_enemy_description(enemy_name):
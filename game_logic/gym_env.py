@@ -0,0 +1,415 @@
+"""
+Gym-style training environments wrapping Battle.
+
+BattleEnv exposes a single battle as a fixed-length float observation and a
+discrete action space with an availability mask, following the Gymnasium
+reset()/step() conventions without depending on it. VecBattleEnv steps N
+battles in lockstep in-process; SubprocVecBattleEnv spreads them across
+worker processes that exchange observations through shared memory. Both
+vector environments return the same values.
+
+Each step runs the full battle rules for every environment in Python, so
+throughput is on the order of 10^4 steps per second per core (see
+benchmarks/bench_gym.py); subprocesses scale it with the number of cores.
+"""
+
+import multiprocessing
+import random
+from array import array
+from multiprocessing import shared_memory
+from .battle import Battle
+from .character import Character
+from .character_templates import CHARACTER_TEMPLATES
+from .enemy_database import ENEMY_DATABASE
+from .journal import NullJournal
+
+ACTION_CATEGORIES = ('abilities', 'skills', 'black_magic', 'white_magic')
+
+def _build_action_table():
+    """Collect every action any character template can take, in a stable order."""
+    actions = [('basic', 'attack'), ('basic', 'defend')]
+    for category in ACTION_CATEGORIES:
+        for template in CHARACTER_TEMPLATES.values():
+            for name in template[category]:
+                if (category, name) not in actions:
+                    actions.append((category, name))
+    return tuple(actions)
+
+# Discrete action index -> (action type, action name)
+ACTIONS = _build_action_table()
+ACTION_INDEX = {action: index for index, action in enumerate(ACTIONS)}
+
+ENEMY_NAMES = tuple(ENEMY_DATABASE)
+ENEMY_INDEX = {name: index for index, name in enumerate(ENEMY_NAMES)}
+
+# Stats normalized into the observation for each combatant
+OBS_STATS = ('strength', 'defense', 'magic', 'magic_defense', 'agility', 'luck')
+STAT_SCALE = 100.0
+LEVEL_SCALE = 99.0
+TURN_SCALE = 100.0
+
+# player: hp, mp, stats, level; enemy: hp, mp, stats; turn; enemy one-hot
+OBS_SIZE = (2 + len(OBS_STATS) + 1) + (2 + len(OBS_STATS)) + 1 + len(ENEMY_NAMES)
+
+def observe(battle):
+    """
+    Encode the battle state as a fixed-length list of floats.
+    Uses the same fields _get_battle_state reports, read straight from the
+    characters so no dicts or log text are built.
+
+    Args:
+        battle (Battle): Battle to observe
+
+    Returns:
+        list: OBS_SIZE floats
+    """
+    player = battle.player
+    enemy = battle.enemy
+    obs = [
+        player.current_hp / player.max_hp,
+        player.current_mp / player.max_mp if player.max_mp else 0.0
+    ]
+    obs.extend(player.stat(stat) / STAT_SCALE for stat in OBS_STATS)
+    obs.append(player.level / LEVEL_SCALE)
+    obs.append(enemy.current_hp / enemy.max_hp)
+    obs.append(enemy.current_mp / enemy.max_mp if enemy.max_mp else 0.0)
+    obs.extend(enemy.stat(stat) / STAT_SCALE for stat in OBS_STATS)
+    obs.append(battle.turn / TURN_SCALE)
+    one_hot = [0.0] * len(ENEMY_NAMES)
+    if enemy.name in ENEMY_INDEX:
+        one_hot[ENEMY_INDEX[enemy.name]] = 1.0
+    obs.extend(one_hot)
+    return obs
+
+def action_mask(character):
+    """
+    Build the availability mask for the discrete action space.
+
+    Args:
+        character (Character): Character choosing an action
+
+    Returns:
+        list: One bool per entry in ACTIONS
+    """
+    mask = [False] * len(ACTIONS)
+    for category, names in character.get_available_actions().items():
+        for name in names:
+            index = ACTION_INDEX.get((category, name))
+            if index is not None:
+                mask[index] = True
+    return mask
+
+class BattleEnv:
+    """
+    Single-battle environment for training player-side policies.
+    Rewards are the fraction of enemy HP removed minus the fraction of player
+    HP lost each step, plus +1/-1 when the battle is won or lost.
+    """
+
+    def __init__(self, character_type='warrior', level=1, max_turns=200, seed=None):
+        """
+        Initialize the environment.
+
+        Args:
+            character_type (str): Character template the agent plays
+            level (int): Player level, which also scales the enemies
+            max_turns (int): Turns before an episode is truncated
+            seed (int, optional): Seed for the environment's random stream
+        """
+        self.character_type = character_type
+        self.level = level
+        self.max_turns = max_turns
+        self.n_actions = len(ACTIONS)
+        self.observation_size = OBS_SIZE
+        self._seeds = random.Random(seed)
+        self.battle = None
+
+    def _new_player(self):
+        player = Character.from_template(self.character_type)
+        player.level_up(self.level - 1)
+        return player
+
+    def reset(self, seed=None):
+        """
+        Start a new battle against a random enemy.
+
+        Args:
+            seed (int, optional): Reseed the environment before resetting
+
+        Returns:
+            tuple: (observation, info) where info holds the 'action_mask'
+        """
+        if seed is not None:
+            self._seeds.seed(seed)
+        self.battle = Battle(self._new_player(), journal=NullJournal(), seed=self._seeds.getrandbits(64))
+        return observe(self.battle), {'action_mask': action_mask(self.battle.player)}
+
+    def step(self, action):
+        """
+        Take one player action and let the enemy respond.
+
+        Args:
+            action (int): Index into ACTIONS
+
+        Returns:
+            tuple: (observation, reward, terminated, truncated, info)
+        """
+        battle = self.battle
+        player = battle.player
+        enemy = battle.enemy
+        player_hp = player.current_hp
+        enemy_hp = enemy.current_hp
+
+        action_type, action_name = ACTIONS[action]
+        success = battle.take_turn({'type': action_type, 'name': action_name})
+
+        reward = (enemy_hp - enemy.current_hp) / enemy.max_hp - (player_hp - player.current_hp) / player.max_hp
+        terminated = battle.battle_over
+        if terminated:
+            reward += 1.0 if battle.victory else -1.0
+        truncated = not terminated and battle.turn > self.max_turns
+        info = {
+            'action_mask': action_mask(player),
+            'action_success': success,
+            'victory': battle.victory
+        }
+        return observe(battle), reward, terminated, truncated, info
+
+class VecBattleEnv:
+    """
+    N battle environments stepped in lockstep in-process.
+    Finished episodes are reset automatically; the final observation is
+    reported in info['final_observation'] as in Gymnasium's vector API.
+    """
+
+    def __init__(self, num_envs, character_type='warrior', level=1, max_turns=200, seed=None):
+        """
+        Initialize the environments.
+
+        Args:
+            num_envs (int): Number of parallel battles
+            character_type (str): Character template the agent plays
+            level (int): Player level
+            max_turns (int): Turns before an episode is truncated
+            seed (int, optional): Base seed, environment i uses seed + i
+        """
+        self.num_envs = num_envs
+        self.envs = [
+            BattleEnv(character_type, level, max_turns, None if seed is None else seed + i)
+            for i in range(num_envs)
+        ]
+        self.n_actions = len(ACTIONS)
+        self.observation_size = OBS_SIZE
+
+    def reset(self, seed=None):
+        """
+        Reset every environment.
+
+        Args:
+            seed (int, optional): Base seed, environment i is reseeded with seed + i
+
+        Returns:
+            tuple: (observations, infos) with one entry per environment; infos hold the 'action_mask'
+        """
+        observations = []
+        infos = []
+        for i, env in enumerate(self.envs):
+            obs, info = env.reset(None if seed is None else seed + i)
+            observations.append(obs)
+            infos.append(info)
+        return observations, infos
+
+    def step(self, actions):
+        """
+        Step every environment with its action.
+
+        Args:
+            actions (list): One action index per environment
+
+        Returns:
+            tuple: (observations, rewards, terminated, truncated, infos); infos hold
+                'action_mask', 'action_success', 'victory' and, for finished episodes,
+                'final_observation'
+        """
+        observations = []
+        rewards = []
+        terminated = []
+        truncated = []
+        infos = []
+        for env, action in zip(self.envs, actions):
+            obs, reward, done, cut, info = env.step(action)
+            if done or cut:
+                info['final_observation'] = obs
+                obs, reset_info = env.reset()
+                info['action_mask'] = reset_info['action_mask']
+            observations.append(obs)
+            rewards.append(reward)
+            terminated.append(done)
+            truncated.append(cut)
+            infos.append(info)
+        return observations, rewards, terminated, truncated, infos
+
+# Per-environment slots in the shared step buffer:
+# obs, final obs, mask, reward, terminated, truncated, action success, victory
+_FINAL_OBS = OBS_SIZE
+_MASK = 2 * OBS_SIZE
+_TAIL = _MASK + len(ACTIONS)
+_SLOT_SIZE = _TAIL + 5
+
+def _subproc_worker(conn, shm_name, offset, num_envs, character_type, level, max_turns, seed):
+    """
+    Worker loop owning a slice of environments.
+    Results are written in place into the shared buffer; only short command
+    strings travel over the pipe.
+    """
+    shm = shared_memory.SharedMemory(name=shm_name)
+    buf = shm.buf.cast('d')
+    vec = VecBattleEnv(num_envs, character_type, level, max_turns, seed)
+
+    def write(index, obs, info, reward=0.0, done=False, cut=False):
+        start = (offset + index) * _SLOT_SIZE
+        buf[start:start + OBS_SIZE] = array('d', obs)
+        if done or cut:
+            buf[start + _FINAL_OBS:start + _MASK] = array('d', info['final_observation'])
+        buf[start + _MASK:start + _TAIL] = array('d', info['action_mask'])
+        tail = start + _TAIL
+        buf[tail] = reward
+        buf[tail + 1] = 1.0 if done else 0.0
+        buf[tail + 2] = 1.0 if cut else 0.0
+        buf[tail + 3] = 1.0 if info.get('action_success') else 0.0
+        buf[tail + 4] = 1.0 if info.get('victory') else 0.0
+
+    try:
+        while True:
+            command, payload = conn.recv()
+            if command == 'reset':
+                observations, infos = vec.reset(payload)
+                for i in range(num_envs):
+                    write(i, observations[i], infos[i])
+            elif command == 'step':
+                observations, rewards, terminated, truncated, infos = vec.step(payload)
+                for i in range(num_envs):
+                    write(i, observations[i], infos[i], rewards[i], terminated[i], truncated[i])
+            elif command == 'close':
+                break
+            conn.send(True)
+    finally:
+        del buf
+        shm.close()
+
+class SubprocVecBattleEnv:
+    """
+    Battle environments spread across worker processes.
+    Each worker steps its slice of environments in lockstep and writes
+    observations, masks, rewards and done flags into one shared memory block,
+    so no per-step pickling of observations is needed. Returns the same
+    values as VecBattleEnv.
+    """
+
+    def __init__(self, num_envs, num_workers=None, character_type='warrior', level=1, max_turns=200, seed=None):
+        """
+        Start the worker processes.
+
+        Args:
+            num_envs (int): Total number of parallel battles
+            num_workers (int, optional): Worker processes, defaults to the CPU count
+            character_type (str): Character template the agent plays
+            level (int): Player level
+            max_turns (int): Turns before an episode is truncated
+            seed (int, optional): Base seed for the environments
+        """
+        self.num_envs = num_envs
+        self.n_actions = len(ACTIONS)
+        self.observation_size = OBS_SIZE
+        num_workers = max(1, min(num_envs, num_workers or multiprocessing.cpu_count()))
+
+        self._shm = shared_memory.SharedMemory(create=True, size=num_envs * _SLOT_SIZE * 8)
+        self._buf = self._shm.buf.cast('d')
+        self._slices = []
+        self._conns = []
+        self._procs = []
+
+        per_worker, remainder = divmod(num_envs, num_workers)
+        offset = 0
+        for worker in range(num_workers):
+            count = per_worker + (1 if worker < remainder else 0)
+            parent_conn, child_conn = multiprocessing.Pipe()
+            worker_seed = None if seed is None else seed + offset
+            proc = multiprocessing.Process(
+                target=_subproc_worker,
+                args=(child_conn, self._shm.name, offset, count, character_type, level, max_turns, worker_seed),
+                daemon=True
+            )
+            proc.start()
+            self._slices.append((offset, count))
+            self._conns.append(parent_conn)
+            self._procs.append(proc)
+            offset += count
+
+    def _broadcast(self, command, payloads):
+        for conn, payload in zip(self._conns, payloads):
+            conn.send((command, payload))
+        for conn in self._conns:
+            conn.recv()
+
+    def _read(self, stepped):
+        observations = []
+        rewards = []
+        terminated = []
+        truncated = []
+        infos = []
+        buf = self._buf
+        for index in range(self.num_envs):
+            start = index * _SLOT_SIZE
+            tail = start + _TAIL
+            observations.append(list(buf[start:start + OBS_SIZE]))
+            info = {'action_mask': [value > 0.5 for value in buf[start + _MASK:tail]]}
+            if stepped:
+                done = buf[tail + 1] > 0.5
+                cut = buf[tail + 2] > 0.5
+                info['action_success'] = buf[tail + 3] > 0.5
+                info['victory'] = buf[tail + 4] > 0.5
+                if done or cut:
+                    info['final_observation'] = list(buf[start + _FINAL_OBS:start + _MASK])
+                rewards.append(buf[tail])
+                terminated.append(done)
+                truncated.append(cut)
+            infos.append(info)
+        return observations, rewards, terminated, truncated, infos
+
+    def reset(self, seed=None):
+        """
+        Reset every environment.
+
+        Args:
+            seed (int, optional): Base seed, environment i is reseeded with seed + i
+
+        Returns:
+            tuple: (observations, infos) with one entry per environment; infos hold the 'action_mask'
+        """
+        self._broadcast('reset', [None if seed is None else seed + offset for offset, _ in self._slices])
+        observations, _, _, _, infos = self._read(stepped=False)
+        return observations, infos
+
+    def step(self, actions):
+        """
+        Step every environment with its action.
+
+        Args:
+            actions (list): One action index per environment
+
+        Returns:
+            tuple: (observations, rewards, terminated, truncated, infos), as from VecBattleEnv.step
+        """
+        self._broadcast('step', [list(actions[offset:offset + count]) for offset, count in self._slices])
+        return self._read(stepped=True)
+
+    def close(self):
+        """Stop the workers and release the shared memory."""
+        for conn in self._conns:
+            conn.send(('close', None))
+        for proc in self._procs:
+            proc.join()
+        self._buf.release()
+        self._shm.close()
+        self._shm.unlink()
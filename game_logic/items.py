@@ -0,0 +1,147 @@
+"""
+Items, equipment and inventories.
+
+Equipment adds flat bonuses to a character's stats. The bonus totals for a
+set of equipped items are computed once and cached, so damage formulas
+read one precomputed value per stat instead of summing items on every hit.
+"""
+
+from functools import lru_cache
+from types import MappingProxyType
+from .shared import freeze
+
+EQUIPMENT_SLOTS = ('weapon', 'armor', 'accessory')
+
+# Item name -> definition.
+#   type    - 'weapon', 'armor', 'accessory' (equipment slots) or 'consumable'
+#   stats   - equipment stat bonuses; 'attack' is weapon power added to physical damage
+#   effect  - consumable effect: 'hp' and/or 'mp' restored
+ITEM_DATABASE = freeze({
+    # Weapons
+    'Bronze Sword': {
+        'type': 'weapon',
+        'stats': {'attack': 4},
+        'description': 'A plain but sturdy sword.'
+    },
+    'Oak Staff': {
+        'type': 'weapon',
+        'stats': {'attack': 1, 'magic': 3},
+        'description': 'A staff that focuses magical energy.'
+    },
+    'Dagger': {
+        'type': 'weapon',
+        'stats': {'attack': 3, 'agility': 2},
+        'description': 'A light blade for quick strikes.'
+    },
+    'Beast Fang': {
+        'type': 'weapon',
+        'stats': {'attack': 6, 'luck': 1},
+        'description': 'A wolf fang sharp enough to use as a blade.'
+    },
+    'Ogre Bone': {
+        'type': 'weapon',
+        'stats': {'attack': 9, 'agility': -2},
+        'description': 'A heavy club made from an ogre bone.'
+    },
+
+    # Armor
+    'Leather Armor': {
+        'type': 'armor',
+        'stats': {'defense': 3},
+        'description': 'Light armor of tanned leather.'
+    },
+    'Cotton Robe': {
+        'type': 'armor',
+        'stats': {'defense': 1, 'magic_defense': 3},
+        'description': 'A robe woven with protective charms.'
+    },
+    'Wolf Pelt': {
+        'type': 'armor',
+        'stats': {'defense': 4, 'agility': 1},
+        'description': 'A thick pelt that turns aside claws.'
+    },
+
+    # Accessories
+    'Small Gem': {
+        'type': 'accessory',
+        'stats': {'luck': 2},
+        'description': 'A small gem said to bring good fortune.'
+    },
+    'Large Gem': {
+        'type': 'accessory',
+        'stats': {'luck': 3, 'magic_defense': 2},
+        'description': 'A flawless gem that wards off magic.'
+    },
+    'Fish Scale': {
+        'type': 'accessory',
+        'stats': {'magic_defense': 3},
+        'description': 'An iridescent scale that repels water.'
+    },
+    'Water Gem': {
+        'type': 'accessory',
+        'stats': {'magic': 2, 'magic_defense': 2},
+        'description': 'A gem holding the power of the tides.'
+    },
+    'Dark Matter': {
+        'type': 'accessory',
+        'stats': {'magic': 5, 'magic_defense': -2},
+        'description': 'A shard of pure darkness that amplifies spells.'
+    },
+
+    # Consumables
+    'Potion': {
+        'type': 'consumable',
+        'effect': {'hp': 200},
+        'description': 'Restores 200 HP.'
+    },
+    'Spirit Shard': {
+        'type': 'consumable',
+        'effect': {'mp': 30},
+        'description': 'Restores 30 MP.'
+    },
+})
+
+def get_item(item_name):
+    """
+    Get an item definition.
+
+    Args:
+        item_name (str): Name of the item
+
+    Returns:
+        Mapping: Read-only item definition, or None if the item does not exist
+    """
+    return ITEM_DATABASE.get(item_name)
+
+@lru_cache(maxsize=None)
+def equipment_bonus(item_names):
+    """
+    Total the stat bonuses of a set of equipped items.
+    Cached per distinct equipment set, so characters wearing the same gear share one mapping.
+
+    Args:
+        item_names (tuple): Names of the equipped items, in slot order
+
+    Returns:
+        Mapping: Read-only stat -> total bonus
+    """
+    totals = {}
+    for item_name in item_names:
+        for stat, bonus in ITEM_DATABASE[item_name].get('stats', {}).items():
+            totals[stat] = totals.get(stat, 0) + bonus
+    return MappingProxyType(totals)
+
+def usable_items(character):
+    """
+    Get the consumables a character can use in battle.
+
+    Args:
+        character (Character): Character whose inventory to check
+
+    Returns:
+        list: Names of consumables with at least one in the inventory
+    """
+    return [
+        item_name for item_name, count in character.inventory.items()
+        if count > 0 and ITEM_DATABASE[item_name]['type'] == 'consumable'
+    ]
@@ -0,0 +1,222 @@
+"""
+Append-only event journal for battles.
+
+Every action, RNG draw, damage application and status change in a Battle is
+recorded as an event. A snapshot of the full battle state is taken every N
+turns, so a battle can be rebuilt by loading the latest snapshot and
+replaying only the events recorded after it.
+"""
+
+import json
+import os
+import random
+
+class BattleJournal:
+    """
+    In-memory append-only event journal for a single battle.
+    Events recorded during a turn are buffered and handed to the store in
+    one append when the turn is committed.
+    """
+
+    def __init__(self, battle_id=None, store=None, snapshot_interval=10):
+        """
+        Initialize an empty journal.
+
+        Args:
+            battle_id (str, optional): Identifier used by the store
+            store (JournalStore, optional): Persistent store for events and snapshots
+            snapshot_interval (int): Number of turns between snapshots
+        """
+        self.battle_id = battle_id
+        self.store = store
+        self.snapshot_interval = snapshot_interval
+        self.events = []
+        self.seq = 0
+        self._pending = []
+
+    def record(self, event_type, turn, **data):
+        """
+        Append an event to the journal.
+
+        Args:
+            event_type (str): Kind of event ('action', 'rng', 'damage', ...)
+            turn (int): Battle turn the event happened in
+            **data: Event payload
+
+        Returns:
+            dict: The recorded event
+        """
+        self.seq += 1
+        event = {'seq': self.seq, 'turn': turn, 'type': event_type}
+        event.update(data)
+        self.events.append(event)
+        self._pending.append(event)
+        return event
+
+    def commit(self, snapshot=None):
+        """
+        Flush buffered events to the store, together with a snapshot if given.
+
+        Args:
+            snapshot (dict, optional): Full battle state to persist
+        """
+        if self.store is not None and self.battle_id is not None:
+            if self._pending:
+                self.store.append(self.battle_id, self._pending)
+            if snapshot is not None:
+                self.store.write_snapshot(self.battle_id, snapshot)
+        self._pending = []
+
+    def snapshot_due(self, turn):
+        """
+        Check whether a snapshot should be taken at the end of a turn.
+
+        Args:
+            turn (int): Turn that just finished
+
+        Returns:
+            bool: True every snapshot_interval turns
+        """
+        return turn % self.snapshot_interval == 0
+
+    def events_since(self, seq):
+        """
+        Get events recorded after a sequence number.
+
+        Args:
+            seq (int): Last sequence number already applied
+
+        Returns:
+            list: Events with a higher sequence number
+        """
+        return [event for event in self.events if event['seq'] > seq]
+
+class RecordingRandom(random.Random):
+    """
+    Per-battle random number generator that journals its draws.
+    Since this class overrides random() but not getrandbits(), random.Random
+    builds randint(), randrange(), choice(), shuffle() and sample() on
+    random() as well as uniform(), so all of them are recorded. Direct
+    getrandbits() and randbytes() calls are not; battles never make them.
+    The 'rng' events are informational: replay applies the recorded state
+    events and never re-draws.
+    """
+
+    def __init__(self, journal, turn_source, seed=None):
+        """
+        Initialize the generator.
+
+        Args:
+            journal (BattleJournal): Journal receiving 'rng' events
+            turn_source (callable): Returns the current battle turn
+            seed (int, optional): Seed for reproducible battles
+        """
+        self.journal = journal
+        self.turn_source = turn_source
+        super().__init__(seed)
+
+    def random(self):
+        """Draw a float in [0, 1) and record it in the journal."""
+        value = super().random()
+        self.journal.record('rng', self.turn_source(), value=value)
+        return value
+
+class JournalStore:
+    """
+    Local disk store for battle journals.
+    Each battle has an append-only JSON-lines event file and a snapshot file
+    that is atomically replaced whenever a new snapshot is taken.
+    """
+
+    def __init__(self, directory):
+        """
+        Initialize the store.
+
+        Args:
+            directory (str): Directory holding the journal files
+        """
+        self.directory = directory
+        os.makedirs(directory, exist_ok=True)
+
+    def _path(self, battle_id, suffix):
+        return os.path.join(self.directory, f"{battle_id}.{suffix}")
+
+    def append(self, battle_id, events):
+        """
+        Append events to a battle's event file in a single write.
+
+        Args:
+            battle_id (str): Battle identifier
+            events (list): Events to append
+        """
+        lines = ''.join(json.dumps(event, separators=(',', ':')) + '\n' for event in events)
+        with open(self._path(battle_id, 'events'), 'a', encoding='utf-8') as f:
+            f.write(lines)
+
+    def write_snapshot(self, battle_id, snapshot):
+        """
+        Replace a battle's snapshot.
+        The snapshot records the current size of the event file so loading
+        can seek straight to the tail instead of scanning the whole journal.
+
+        Args:
+            battle_id (str): Battle identifier
+            snapshot (dict): Full battle state, including the last applied 'seq'
+        """
+        events_path = self._path(battle_id, 'events')
+        offset = os.path.getsize(events_path) if os.path.exists(events_path) else 0
+        snapshot = dict(snapshot, offset=offset)
+        path = self._path(battle_id, 'snapshot')
+        tmp_path = path + '.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(snapshot, f, separators=(',', ':'))
+        os.replace(tmp_path, path)
+
+    def load(self, battle_id):
+        """
+        Load the latest snapshot and the events recorded after it.
+
+        Args:
+            battle_id (str): Battle identifier
+
+        Returns:
+            tuple: (snapshot dict, list of tail events)
+
+        Raises:
+            KeyError: If no snapshot exists for the battle
+        """
+        snapshot_path = self._path(battle_id, 'snapshot')
+        if not os.path.exists(snapshot_path):
+            raise KeyError(f"Battle '{battle_id}' not found in journal store")
+        with open(snapshot_path, encoding='utf-8') as f:
+            snapshot = json.load(f)
+
+        events = []
+        events_path = self._path(battle_id, 'events')
+        if os.path.exists(events_path):
+            with open(events_path, 'rb') as f:
+                f.seek(snapshot.get('offset', 0))
+                for line in f:
+                    # Ignore a torn final line left by a crash mid-write
+                    if not line.endswith(b'\n'):
+                        break
+                    event = json.loads(line)
+                    if event['seq'] > snapshot['seq']:
+                        events.append(event)
+        return snapshot, events
+
+class NullJournal(BattleJournal):
+    """
+    Journal that discards every event.
+    Used by simulations and training environments that never persist or
+    replay battles, so recording costs a single no-op call.
+    """
+
+    def record(self, event_type, turn, **data):
+        return None
+
+    def commit(self, snapshot=None):
+        return None
+
+    def snapshot_due(self, turn):
+        return False
@@ -0,0 +1,165 @@
+"""
+Loot resolution for enemy drops and steals.
+
+Each enemy's drop and steal tables are compiled once into alias tables.
+The drop table includes a "nothing" outcome sized from the drop rate, so a
+single alias sample decides both whether anything drops and what. Batch
+functions resolve many battle outcomes at once for economy simulations.
+"""
+
+from collections import Counter
+from .encounters import AliasTable, RARITY_WEIGHTS
+from .enemy_database import ENEMY_DATABASE
+from .shared import freeze, thread_rng
+
+# Drop rate for enemies without an entry in LOOT_TABLES
+DEFAULT_DROP_RATE = 0.5
+
+# Enemy name -> loot table.
+#   drop_rate - chance that a defeated enemy drops anything
+#   drops     - (item, weight, rarity) entries for drops
+#   steal     - (item, weight, rarity) entries for successful steals
+# Enemies missing here drop their ENEMY_DATABASE 'drops' with equal weights.
+LOOT_TABLES = freeze({
+    'Goblin': {
+        'drop_rate': 0.5,
+        'drops': [('Potion', 10, 'common'), ('Small Gem', 10, 'uncommon')],
+        'steal': [('Potion', 10, 'common'), ('Dagger', 10, 'rare')]
+    },
+    'Wolf': {
+        'drop_rate': 0.4,
+        'drops': [('Wolf Pelt', 10, 'common'), ('Beast Fang', 10, 'uncommon')],
+        'steal': [('Potion', 10, 'common'), ('Beast Fang', 10, 'rare')]
+    },
+    'Ogre': {
+        'drop_rate': 0.6,
+        'drops': [('Potion', 10, 'common'), ('Ogre Bone', 10, 'uncommon'), ('Large Gem', 10, 'rare')],
+        'steal': [('Potion', 10, 'common'), ('Ogre Bone', 10, 'rare')]
+    },
+    'Sahagin': {
+        'drop_rate': 0.5,
+        'drops': [('Fish Scale', 10, 'common'), ('Water Gem', 10, 'uncommon')],
+        'steal': [('Potion', 10, 'common'), ('Water Gem', 10, 'rare')]
+    },
+    'Dark Elemental': {
+        'drop_rate': 0.5,
+        'drops': [('Spirit Shard', 10, 'common'), ('Dark Matter', 10, 'rare')],
+        'steal': [('Spirit Shard', 10, 'common'), ('Dark Matter', 10, 'rare')]
+    },
+})
+
+def _weights(entries, rarity_weights):
+    """Get the rarity-scaled weight of each (item, weight, rarity) entry."""
+    return [weight * rarity_weights[rarity] for _, weight, rarity in entries]
+
+def compile_loot_tables(loot_tables=LOOT_TABLES, rarity_weights=RARITY_WEIGHTS):
+    """
+    Compile loot tables into alias tables.
+
+    Args:
+        loot_tables (dict): Enemy name -> loot table like LOOT_TABLES
+        rarity_weights (dict): Rarity -> weight multiplier
+
+    Returns:
+        dict: Enemy name -> (drop AliasTable or None, steal AliasTable or None).
+            Drop tables yield None when nothing drops.
+    """
+    compiled = {}
+    for enemy_name, enemy_data in ENEMY_DATABASE.items():
+        table = loot_tables.get(enemy_name) or {
+            'drop_rate': DEFAULT_DROP_RATE,
+            'drops': [(item, 1, 'common') for item in enemy_data['drops']]
+        }
+        drops = None
+        if table['drops'] and table['drop_rate'] > 0:
+            weights = _weights(table['drops'], rarity_weights)
+            items = [item for item, _, _ in table['drops']]
+            if table['drop_rate'] < 1:
+                items.append(None)
+                weights.append(sum(weights) * (1 - table['drop_rate']) / table['drop_rate'])
+            drops = AliasTable(items, weights)
+        steal = None
+        if table.get('steal'):
+            steal = AliasTable([item for item, _, _ in table['steal']], _weights(table['steal'], rarity_weights))
+        compiled[enemy_name] = (drops, steal)
+    return compiled
+
+COMPILED_LOOT = compile_loot_tables()
+
+def roll_drop(enemy_name, rng=None):
+    """
+    Roll the drop of one defeated enemy.
+
+    Args:
+        enemy_name (str): Name of the enemy
+        rng (random.Random, optional): Random source, defaults to the calling thread's stream
+
+    Returns:
+        str: Item name, or None if nothing dropped
+    """
+    rng = rng or thread_rng()
+    drops = COMPILED_LOOT[enemy_name][0]
+    return drops.sample(rng) if drops else None
+
+def roll_steal(enemy_name, rng=None):
+    """
+    Roll the item taken by a successful steal.
+
+    Args:
+        enemy_name (str): Name of the enemy
+        rng (random.Random, optional): Random source, defaults to the calling thread's stream
+
+    Returns:
+        str: Item name, or None if the target has nothing to steal, e.g. a
+            player character in PvP
+    """
+    rng = rng or thread_rng()
+    steal = COMPILED_LOOT.get(enemy_name, (None, None))[1]
+    return steal.sample(rng) if steal else None
+
+def resolve_drops(enemy_names, rng=None):
+    """
+    Roll drops for a sequence of defeated enemies.
+
+    Args:
+        enemy_names (iterable): Enemy name per battle outcome
+        rng (random.Random, optional): Random source, defaults to the calling thread's stream
+
+    Returns:
+        list: Item name or None per enemy, in order
+    """
+    rng = rng or thread_rng()
+    return [roll_drop(enemy_name, rng) for enemy_name in enemy_names]
+
+def tally_drops(defeats, rng=None):
+    """
+    Total the drops of many defeated enemies without keeping each outcome.
+    The alias sampling is inlined over precomputed tuples, takes the slot and
+    the coin flip from a single random number, and counts per table slot, so
+    millions of draws stay cheap.
+
+    Args:
+        defeats (dict): Enemy name -> number defeated
+        rng (random.Random, optional): Random source, defaults to the calling thread's stream
+
+    Returns:
+        Counter: Item name -> number dropped
+    """
+    rng = rng or thread_rng()
+    totals = Counter()
+    rand = rng.random
+    for enemy_name, count in defeats.items():
+        drops = COMPILED_LOOT[enemy_name][0]
+        if drops is None:
+            continue
+        items, probabilities, aliases = drops.items, drops.probabilities, drops.aliases
+        size = len(items)
+        hits = [0] * size
+        for _ in range(count):
+            draw = rand() * size
+            index = int(draw)
+            hits[index if draw - index < probabilities[index] else aliases[index]] += 1
+        for item, hit_count in zip(items, hits):
+            if item is not None and hit_count:
+                totals[item] += hit_count
+    return totals
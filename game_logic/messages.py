@@ -0,0 +1,82 @@
+"""
+Message templates for battle and spell log entries.
+Messages are produced as (code, args) pairs and only formatted into text
+when a client actually needs to display them.
+"""
+
+from .shared import freeze
+
+DEFAULT_LOCALE = 'en'
+
+# Locale -> message code -> format template (positional args)
+MESSAGE_TEMPLATES = freeze({
+    'en': {
+        'enemy_appears': "A {0} appears!",
+        'attack': "{0} attacks {1} for {2} damage!",
+        'attack_critical': "Critical hit! {0} attacks {1} for {2} damage!",
+        'special_move': "{0} uses {1} for {2} damage!",
+        'defend': "{0} takes a defensive stance!",
+        'not_enough_mp_skill': "Not enough MP to use {0}!",
+        'not_enough_mp_spell': "Not enough MP to cast {0}!",
+        'unknown_spell': "Unknown spell: {0}",
+        'unknown_skill': "Unknown skill: {0}",
+        'spell_damage': "{0} casts {1} for {2} damage!",
+        'spell_damage_critical': "Critical hit! {0} casts {1} for {2} damage!",
+        'spell_cast': "{0} casts {1}!",
+        'defeated': "{0} has been defeated!",
+        'exp_gained': "{0} gains {1} experience!",
+        'cheer': "{0} uses Cheer! Strength increased!",
+        'provoke': "{0} provokes the enemy!",
+        'steal_success': "{0} steals {1}!",
+        'steal_failure': "{0}'s steal attempt failed!",
+        'steal_nothing': "{0} has nothing left to steal!",
+        'power_break': "{0} uses Power Break! Enemy's strength decreased!",
+        'armor_break': "{0} uses Armor Break! Enemy's defense decreased!",
+        'dark_attack': "{0} uses Dark Attack! Enemy's accuracy decreased!",
+        'flee_success': "{0} successfully fled from battle!",
+        'flee_failure': "{0}'s attempt to flee failed!",
+        'damage_taken': "{0} takes {1} damage!",
+        'healed': "{0} recovers {1} HP!",
+        'stat_increased': "{0}'s {1} increased by {2}!",
+        'stat_decreased': "{0}'s {1} decreased by {2}!",
+        'stat_raised': "{0}'s {1} rises!",
+        'stat_lowered': "{0}'s {1} falls!",
+        'status_applied': "{0} is afflicted with {1}!",
+        'status_removed': "{0} is cured of {1}!",
+        'revived': "{0} is revived!",
+        'regen': "{0} regenerates {1} HP!",
+        'burn': "{0} takes {1} burn damage!",
+        'woke_up': "{0} wakes up!",
+        'cannot_act': "{0} is unable to act!",
+        'nullified': "{0} nullified the {1} damage!",
+        'mitigated': "{0}'s {1} reduces the damage!",
+        'weakness': "{0} is weak to {1}!",
+        'resisted': "{0} resists {1}!",
+        'immune': "{0} is immune to {1}!",
+        'absorbed': "{0} absorbs the {1} damage and recovers {2} HP!",
+        'item_hp': "{0} uses {1} and recovers {2} HP!",
+        'item_mp': "{0} uses {1} and recovers {2} MP!",
+        'no_item': "No {0} left!",
+        'item_dropped': "{0} dropped {1}!",
+        'pvp_start': "{0} challenges {1}!",
+        'pvp_timeout': "{0} hesitates and takes a defensive stance!",
+        'forfeit': "{0} forfeits the match!",
+        'pvp_abandoned': "Neither {0} nor {1} makes a move; the match is abandoned as a draw!"
+    }
+})
+
+def render_message(code, args, locale=DEFAULT_LOCALE):
+    """
+    Format a message from its code and arguments.
+
+    Args:
+        code (str): Message code in MESSAGE_TEMPLATES
+        args (tuple): Positional arguments for the template
+        locale (str): Locale to render in, falls back to DEFAULT_LOCALE
+
+    Returns:
+        str: Rendered message
+    """
+    templates = MESSAGE_TEMPLATES.get(locale, MESSAGE_TEMPLATES[DEFAULT_LOCALE])
+    template = templates.get(code) or MESSAGE_TEMPLATES[DEFAULT_LOCALE][code]
+    return template.format(*args)
@@ -0,0 +1,147 @@
+"""
+Temporary stat modifiers for buffs, debuffs and defending.
+
+Modifiers never change a character's base stats. Each one either adds to a
+stat ('add') or scales it ('mul'), for a number of rounds or until the
+battle ends. A ModifierStack keeps the active modifiers together with their
+combined per-stat totals, which are recomputed only when a modifier is added
+or expires, so reading an effective stat is a single dict lookup however
+many modifiers are stacked.
+"""
+
+from dataclasses import dataclass
+
+ADD = 'add'
+MULTIPLY = 'mul'
+
+# (flat bonus, scale) of a stat without modifiers
+NEUTRAL = (0, 1.0)
+
+@dataclass(slots=True)
+class StatModifier:
+    """
+    One buff or debuff on a stat.
+    duration counts the rounds left, None lasts until the battle ends.
+    """
+    stat: str
+    kind: str
+    value: float
+    duration: int = None
+    source: str = None
+
+class ModifierStack:
+    """
+    Active modifiers of one character and their cached per-stat totals.
+    totals maps a stat to (flat bonus, scale); the effective stat is
+    (base + flat bonus) * scale.
+    """
+
+    __slots__ = ('modifiers', 'totals')
+
+    def __init__(self, modifiers=()):
+        """
+        Build a stack.
+
+        Args:
+            modifiers (iterable): Initial StatModifier instances
+        """
+        self.modifiers = list(modifiers)
+        self.totals = {}
+        self._recompute()
+
+    def __len__(self):
+        return len(self.modifiers)
+
+    def __iter__(self):
+        return iter(self.modifiers)
+
+    def _recompute(self):
+        """Rebuild the per-stat totals from the active modifiers."""
+        totals = {}
+        for modifier in self.modifiers:
+            flat, scale = totals.get(modifier.stat, NEUTRAL)
+            if modifier.kind == MULTIPLY:
+                scale *= modifier.value
+            else:
+                flat += modifier.value
+            totals[modifier.stat] = (flat, scale)
+        self.totals = totals
+
+    def add(self, modifier):
+        """
+        Add a modifier.
+
+        Args:
+            modifier (StatModifier): Modifier to stack
+        """
+        self.modifiers.append(modifier)
+        self._recompute()
+
+    def remove_source(self, source):
+        """
+        Remove every modifier from a source.
+
+        Args:
+            source (str): Source of the modifiers, e.g. a skill name
+
+        Returns:
+            int: Number of modifiers removed
+        """
+        kept = [modifier for modifier in self.modifiers if modifier.source != source]
+        removed = len(self.modifiers) - len(kept)
+        if removed:
+            self.modifiers = kept
+            self._recompute()
+        return removed
+
+    def clear(self):
+        """Remove every modifier."""
+        if self.modifiers:
+            self.modifiers = []
+            self.totals = {}
+
+    def tick(self):
+        """
+        Count down timed modifiers by one round and drop the ones that ran out.
+
+        Returns:
+            list: The expired modifiers
+        """
+        kept = []
+        expired = []
+        for modifier in self.modifiers:
+            if modifier.duration is not None:
+                modifier.duration -= 1
+                if modifier.duration <= 0:
+                    expired.append(modifier)
+                    continue
+            kept.append(modifier)
+        if expired:
+            self.modifiers = kept
+            self._recompute()
+        return expired
+
+    def encode(self):
+        """
+        Encode the modifiers for the session or a snapshot.
+
+        Returns:
+            list: [stat, kind, value, duration, source] per modifier
+        """
+        return [
+            [modifier.stat, modifier.kind, modifier.value, modifier.duration, modifier.source]
+            for modifier in self.modifiers
+        ]
+
+    @classmethod
+    def decode(cls, data):
+        """
+        Rebuild a stack from its encoded form.
+
+        Args:
+            data (list): Payload produced by encode
+
+        Returns:
+            ModifierStack: The rebuilt stack
+        """
+        return cls(StatModifier(*entry) for entry in data)
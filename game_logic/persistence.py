@@ -0,0 +1,326 @@
+"""
+Persistence for player character progression and server-side battles.
+
+Progress records are the compact player encoding from session_state, keyed
+by a progress key (player id plus character type). Stores are pluggable:
+SQLiteProgressStore is the default on-disk backend and MemoryProgressStore
+keeps everything in process. WriteBehindQueue sits in front of a store and
+coalesces the many per-turn updates into one batched write per flush, so
+request handlers never wait on the disk.
+
+SQLiteBattleStore keeps battles driven through the batch API, each as its
+compact player and battle encodings, and updates many of them in one
+transaction.
+"""
+
+import json
+import logging
+from abc import ABC, abstractmethod
+import queue
+import sqlite3
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+class ProgressStore(ABC):
+    """Interface for progress backends."""
+
+    @abstractmethod
+    def load(self, key):
+        """
+        Load a progress record.
+
+        Args:
+            key (str): Progress key
+
+        Returns:
+            dict: The stored record, or None if there is none
+        """
+
+    @abstractmethod
+    def save_many(self, records):
+        """
+        Write several progress records in one transaction.
+
+        Args:
+            records (dict): Progress key -> record
+        """
+
+    def close(self):
+        """Release any resources held by the store."""
+
+class MemoryProgressStore(ProgressStore):
+    """In-process store, for development and simulations."""
+
+    def __init__(self):
+        self._records = {}
+        self._lock = threading.Lock()
+
+    def load(self, key):
+        with self._lock:
+            record = self._records.get(key)
+        return json.loads(record) if record is not None else None
+
+    def save_many(self, records):
+        encoded = {key: json.dumps(record) for key, record in records.items()}
+        with self._lock:
+            self._records.update(encoded)
+
+class ConnectionPool:
+    """Fixed-size pool of SQLite connections shared between threads."""
+
+    def __init__(self, path, size=4):
+        """
+        Open the pool's connections.
+
+        Args:
+            path (str): SQLite database path
+            size (int): Number of connections
+        """
+        self._connections = queue.Queue()
+        for _ in range(size):
+            connection = sqlite3.connect(path, check_same_thread=False, timeout=30)
+            connection.execute('PRAGMA journal_mode=WAL')
+            connection.execute('PRAGMA synchronous=NORMAL')
+            self._connections.put(connection)
+        self.size = size
+
+    def acquire(self):
+        """Take a connection, blocking until one is free."""
+        return self._connections.get()
+
+    def release(self, connection):
+        """Return a connection to the pool."""
+        self._connections.put(connection)
+
+    def close(self):
+        """Close every connection in the pool; closing again does nothing."""
+        size, self.size = self.size, 0
+        for _ in range(size):
+            self._connections.get().close()
+
+class SQLiteProgressStore(ProgressStore):
+    """Progress store backed by a local SQLite database."""
+
+    def __init__(self, path, pool_size=4):
+        """
+        Open the database and create the progress table if needed.
+
+        Args:
+            path (str): SQLite database path
+            pool_size (int): Number of pooled connections
+        """
+        self.pool = ConnectionPool(path, pool_size)
+        connection = self.pool.acquire()
+        try:
+            with connection:
+                connection.execute(
+                    'CREATE TABLE IF NOT EXISTS progress ('
+                    ' key TEXT PRIMARY KEY,'
+                    ' data TEXT NOT NULL,'
+                    ' updated_at REAL NOT NULL)'
+                )
+        finally:
+            self.pool.release(connection)
+
+    def load(self, key):
+        connection = self.pool.acquire()
+        try:
+            row = connection.execute('SELECT data FROM progress WHERE key = ?', (key,)).fetchone()
+        finally:
+            self.pool.release(connection)
+        return json.loads(row[0]) if row else None
+
+    def save_many(self, records):
+        now = time.time()
+        rows = [(key, json.dumps(record, separators=(',', ':')), now) for key, record in records.items()]
+        connection = self.pool.acquire()
+        try:
+            with connection:
+                connection.executemany(
+                    'INSERT INTO progress (key, data, updated_at) VALUES (?, ?, ?) '
+                    'ON CONFLICT(key) DO UPDATE SET data = excluded.data, updated_at = excluded.updated_at',
+                    rows
+                )
+        finally:
+            self.pool.release(connection)
+
+    def close(self):
+        self.pool.close()
+
+class WriteBehindQueue:
+    """
+    Coalescing write-behind buffer in front of a ProgressStore.
+    Only the latest record per key is kept; a background thread writes the
+    pending records in one batch every flush_interval seconds, or sooner
+    when request_flush() is called (e.g. at the end of a battle).
+    """
+
+    def __init__(self, store, flush_interval=5.0):
+        """
+        Start the background writer.
+
+        Args:
+            store (ProgressStore): Store receiving the batched writes
+            flush_interval (float): Maximum seconds between flushes
+        """
+        self.store = store
+        self.flush_interval = flush_interval
+        self._pending = {}
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._stopped = False
+        self._thread = threading.Thread(target=self._run, name='progress-write-behind', daemon=True)
+        self._thread.start()
+
+    def put(self, key, record):
+        """
+        Queue a record, replacing any pending record for the same key.
+
+        Args:
+            key (str): Progress key
+            record (dict): Progress record
+        """
+        with self._lock:
+            self._pending[key] = record
+
+    def load(self, key):
+        """
+        Load a record, preferring a pending write over the stored value.
+
+        Args:
+            key (str): Progress key
+
+        Returns:
+            dict: The latest record, or None if there is none
+        """
+        with self._lock:
+            record = self._pending.get(key)
+        return record if record is not None else self.store.load(key)
+
+    def request_flush(self):
+        """Ask the background writer to flush now without waiting for it."""
+        self._wake.set()
+
+    def flush(self):
+        """Write every pending record to the store synchronously."""
+        with self._lock:
+            pending, self._pending = self._pending, {}
+        if not pending:
+            return
+        try:
+            self.store.save_many(pending)
+        except Exception:
+            # Put the batch back unless newer records arrived meanwhile
+            with self._lock:
+                for key, record in pending.items():
+                    self._pending.setdefault(key, record)
+            raise
+
+    def _run(self):
+        while not self._stopped:
+            self._wake.wait(self.flush_interval)
+            self._wake.clear()
+            try:
+                self.flush()
+            except Exception:
+                logger.exception("Write-behind flush failed, retrying next interval")
+
+    def close(self):
+        """Stop the writer after a final flush and close the store; closing again does nothing."""
+        if self._stopped:
+            return
+        self._stopped = True
+        self._wake.set()
+        self._thread.join()
+        self.flush()
+        self.store.close()
+
+class SQLiteBattleStore:
+    """Battles addressed by id, backed by a local SQLite database."""
+
+    def __init__(self, path, pool_size=4):
+        """
+        Open the database and create the battles table if needed.
+
+        Args:
+            path (str): SQLite database path
+            pool_size (int): Number of pooled connections
+        """
+        self.pool = ConnectionPool(path, pool_size)
+        connection = self.pool.acquire()
+        try:
+            with connection:
+                connection.execute(
+                    'CREATE TABLE IF NOT EXISTS battles ('
+                    ' id TEXT PRIMARY KEY,'
+                    ' data TEXT NOT NULL,'
+                    ' updated_at REAL NOT NULL)'
+                )
+        finally:
+            self.pool.release(connection)
+
+    def create_many(self, records):
+        """
+        Insert new battles in one transaction.
+
+        Args:
+            records (dict): Battle id -> record
+        """
+        now = time.time()
+        rows = [(battle_id, json.dumps(record, separators=(',', ':')), now) for battle_id, record in records.items()]
+        connection = self.pool.acquire()
+        try:
+            with connection:
+                connection.executemany('INSERT INTO battles (id, data, updated_at) VALUES (?, ?, ?)', rows)
+        finally:
+            self.pool.release(connection)
+
+    def update_many(self, battle_ids, update):
+        """
+        Read, update and write back several battles in a single transaction.
+        The write lock is taken up front so concurrent batches touching the
+        same battles are serialized instead of losing updates.
+
+        Args:
+            battle_ids (iterable): Ids of the battles to load
+            update (callable): Receives {battle id: record} for the battles that
+                exist and returns {battle id: record} to write back
+
+        Returns:
+            The value returned by update
+        """
+        battle_ids = list(dict.fromkeys(battle_ids))
+        connection = self.pool.acquire()
+        try:
+            connection.execute('BEGIN IMMEDIATE')
+            try:
+                records = {}
+                # Stay under SQLite's bound parameter limit
+                for start in range(0, len(battle_ids), 500):
+                    chunk = battle_ids[start:start + 500]
+                    placeholders = ','.join('?' * len(chunk))
+                    rows = connection.execute(
+                        f'SELECT id, data FROM battles WHERE id IN ({placeholders})', chunk
+                    ).fetchall()
+                    records.update((battle_id, json.loads(data)) for battle_id, data in rows)
+
+                updated = update(records)
+
+                now = time.time()
+                connection.executemany(
+                    'UPDATE battles SET data = ?, updated_at = ? WHERE id = ?',
+                    [(json.dumps(record, separators=(',', ':')), now, battle_id)
+                     for battle_id, record in updated.items()]
+                )
+                connection.execute('COMMIT')
+            except BaseException:
+                connection.execute('ROLLBACK')
+                raise
+            return updated
+        finally:
+            self.pool.release(connection)
+
+    def close(self):
+        self.pool.close()
@@ -0,0 +1,110 @@
+"""
+Player policies and the auto-battle loop.
+
+A policy maps a battle to the player's next action dict, the same form the
+client sends to /battle_action. auto_battle runs a policy in a tight loop
+until the battle ends, for fast-forwarded fights and simulations.
+"""
+
+from collections import Counter
+from .skills import get_skill_cost
+
+DEFAULT_HEAL_THRESHOLD = 0.3
+DEFAULT_MAX_TURNS = 200
+
+def attack_policy(battle):
+    """Always use a basic attack."""
+    return {'type': 'basic', 'name': 'attack'}
+
+def strongest_spell_policy(battle):
+    """Cast the most powerful black magic spell the player can afford, otherwise attack."""
+    player = battle.player
+    best, best_power = None, 0
+    for spell_name in player.black_magic:
+        spell = player.get_spell(spell_name)
+        if spell and spell.base_power > best_power and get_skill_cost(spell_name) <= player.current_mp:
+            best, best_power = spell_name, spell.base_power
+    if best is None:
+        return attack_policy(battle)
+    return {'type': 'black_magic', 'name': best}
+
+def heal_below_policy(threshold=DEFAULT_HEAL_THRESHOLD, fallback=attack_policy):
+    """
+    Build a policy that heals when HP is low.
+
+    Args:
+        threshold (float): HP fraction below which the player casts white magic
+        fallback (callable): Policy used when not healing
+
+    Returns:
+        callable: The policy
+    """
+    def policy(battle):
+        player = battle.player
+        if player.current_hp < player.max_hp * threshold:
+            for spell_name in player.white_magic:
+                if get_skill_cost(spell_name) <= player.current_mp:
+                    return {'type': 'white_magic', 'name': spell_name}
+        return fallback(battle)
+    return policy
+
+def make_policy(name, heal_threshold=DEFAULT_HEAL_THRESHOLD):
+    """
+    Build a policy by name.
+
+    Args:
+        name (str): 'attack', 'heal' (heal below heal_threshold, otherwise
+            attack) or 'strongest_spell' (heal below heal_threshold, otherwise
+            cast the strongest affordable spell)
+        heal_threshold (float): HP fraction for the healing policies
+
+    Returns:
+        callable: The policy
+
+    Raises:
+        ValueError: If the policy name is unknown
+    """
+    if name == 'attack':
+        return attack_policy
+    if name == 'heal':
+        return heal_below_policy(heal_threshold)
+    if name == 'strongest_spell':
+        return heal_below_policy(heal_threshold, strongest_spell_policy)
+    raise ValueError(f"Unknown policy: {name}")
+
+def auto_battle(battle, policy=attack_policy, max_turns=DEFAULT_MAX_TURNS):
+    """
+    Play a battle with a policy until it ends or the turn limit is reached.
+    Actions the player cannot afford fall back to a basic attack.
+
+    Args:
+        battle (Battle): Battle in progress
+        policy (callable): Maps the battle to the player's next action
+        max_turns (int): Turn limit; the battle is left in progress when reached
+
+    Returns:
+        dict: Summary with turns played, outcome, remaining HP/MP, damage, exp and action counts
+    """
+    rounds = 0
+    start_level = battle.player.level
+    start_enemy_hp = battle.enemy.current_hp
+    actions = Counter()
+    while not battle.battle_over and battle.turn <= max_turns:
+        action = policy(battle)
+        if not battle.take_turn(action):
+            action = attack_policy(battle)
+            battle.take_turn(action)
+        actions[action['name']] += 1
+        rounds += 1
+    return {
+        # Counted here: the turn counter only advances when a round ends, not when the battle does
+        'turns': rounds,
+        'battle_over': battle.battle_over,
+        'victory': battle.victory,
+        'player_hp': battle.player.current_hp,
+        'player_mp': battle.player.current_mp,
+        'damage_dealt': start_enemy_hp - battle.enemy.current_hp,
+        'level_ups': battle.player.level - start_level,
+        'exp_gained': battle.enemy.exp_value if battle.victory else 0,
+        'actions': dict(actions)
+    }
@@ -0,0 +1,161 @@
+"""
+Experience curves and per-class stat growth.
+
+Each class gets a ProgressionTable holding the cumulative experience needed
+for every level and prefix sums of its per-level stat growth. Granting any
+amount of experience is then a bisect over the cumulative table plus one
+subtraction per stat, however many levels it spans.
+"""
+
+import bisect
+from functools import lru_cache
+from .shared import freeze
+
+MAX_LEVEL = 99
+
+# Curve name -> experience needed to advance from a level to the next
+EXP_CURVES = {
+    'flat': lambda level: 100,
+    'standard': lambda level: int(100 * level ** 1.5),
+}
+
+# Stat gains per level for classes without their own growth table
+DEFAULT_GROWTH = freeze({
+    'max_hp': 40,
+    'max_mp': 5,
+    'strength': 1,
+    'defense': 1,
+    'magic': 1,
+    'magic_defense': 1,
+    'agility': 1,
+    'luck': 1
+})
+
+# Character template key -> per-level stat gains. Fractional gains accumulate,
+# e.g. 1.5 strength per level gives +3 every two levels.
+CLASS_GROWTH = freeze({
+    'warrior': {
+        'max_hp': 48, 'max_mp': 3, 'strength': 1.5, 'defense': 1.5,
+        'magic': 0.5, 'magic_defense': 0.75, 'agility': 0.75, 'luck': 1
+    },
+    'mage': {
+        'max_hp': 32, 'max_mp': 8, 'strength': 0.5, 'defense': 0.75,
+        'magic': 1.75, 'magic_defense': 1.5, 'agility': 0.75, 'luck': 0.75
+    },
+    'rogue': {
+        'max_hp': 40, 'max_mp': 4, 'strength': 1, 'defense': 0.75,
+        'magic': 0.75, 'magic_defense': 0.75, 'agility': 1.75, 'luck': 1.5
+    }
+})
+
+# Character template key -> experience curve name
+CLASS_CURVES = freeze({})
+DEFAULT_CURVE = 'flat'
+
+class ProgressionTable:
+    """
+    Precomputed experience and growth tables for one class.
+    cumulative_exp[i] is the total experience needed to reach level i + 1,
+    and growth_prefix[stat][i] the total gain of stat from level 1 to i + 1.
+    """
+
+    __slots__ = ('max_level', 'cumulative_exp', 'growth_prefix')
+
+    def __init__(self, exp_to_next, growth, max_level=MAX_LEVEL):
+        """
+        Build the tables.
+
+        Args:
+            exp_to_next (callable): Maps a level to the experience needed to leave it
+            growth (dict): Stat -> gain per level
+            max_level (int): Highest reachable level
+        """
+        self.max_level = max_level
+        cumulative = [0]
+        for level in range(1, max_level):
+            cumulative.append(cumulative[-1] + exp_to_next(level))
+        self.cumulative_exp = tuple(cumulative)
+        self.growth_prefix = {
+            stat: tuple(gain * level for level in range(max_level))
+            for stat, gain in growth.items()
+        }
+
+    def exp_to_next(self, level):
+        """
+        Get the experience needed to advance from a level.
+
+        Args:
+            level (int): Current level
+
+        Returns:
+            int: Experience needed, or 0 at the maximum level
+        """
+        if level >= self.max_level:
+            return 0
+        return self.cumulative_exp[level] - self.cumulative_exp[level - 1]
+
+    def resolve(self, level, experience):
+        """
+        Find the level a character ends up at with some experience.
+
+        Args:
+            level (int): Current level
+            experience (int): Experience accumulated towards the next level,
+                possibly more than one level's worth
+
+        Returns:
+            tuple: (new level, experience towards the level after it)
+        """
+        total = self.cumulative_exp[level - 1] + experience
+        new_level = min(bisect.bisect_right(self.cumulative_exp, total), self.max_level)
+        return new_level, total - self.cumulative_exp[new_level - 1]
+
+    def stat_gain(self, stat, from_level, to_level):
+        """
+        Get the total gain of a stat between two levels.
+
+        Args:
+            stat (str): Stat name
+            from_level (int): Starting level
+            to_level (int): Final level
+
+        Returns:
+            int: Stat gain, 0 for stats the class does not grow
+        """
+        prefix = self.growth_prefix.get(stat)
+        if prefix is None:
+            return 0
+        return int(prefix[to_level - 1]) - int(prefix[from_level - 1])
+
+@lru_cache(maxsize=None)
+def get_progression(template_key):
+    """
+    Get the progression table for a class.
+
+    Args:
+        template_key (str): Character template key, or None for the defaults
+
+    Returns:
+        ProgressionTable: The class's shared table
+    """
+    curve = EXP_CURVES[CLASS_CURVES.get(template_key, DEFAULT_CURVE)]
+    return ProgressionTable(curve, CLASS_GROWTH.get(template_key, DEFAULT_GROWTH))
+
+def apply_levels(character, new_level):
+    """
+    Move a character to a higher level, applying the stat growth in between.
+    Gaining a level fully restores HP and MP.
+
+    Args:
+        character (Character): Character to advance
+        new_level (int): Level to reach; ignored if not above the current level
+    """
+    table = get_progression(character.template_key)
+    new_level = min(new_level, table.max_level)
+    if new_level <= character.level:
+        return
+    for stat in table.growth_prefix:
+        setattr(character, stat, getattr(character, stat) + table.stat_gain(stat, character.level, new_level))
+    character.level = new_level
+    character.current_hp = character.max_hp
+    character.current_mp = character.max_mp
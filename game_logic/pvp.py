@@ -0,0 +1,502 @@
+"""
+Player-versus-player battles.
+
+Two sessions share one server-side PvPBattle. Both sides commit an action
+for the round; the round is resolved in agility order once both have
+committed, or when the round timeout runs out, in which case a side that
+did not commit defends. A match in which neither side commits for
+MAX_IDLE_ROUNDS rounds in a row is abandoned as a draw and then dropped.
+
+Matches are spread over shards, each served by one resolver thread that is
+the only writer of its matches' battles. Request threads never touch a
+battle: they put commands (join, action, forfeit) on the match's own
+SimpleQueue and wake the shard through its inbox, then read the results the
+resolver publishes. Publishing takes the match's own condition only, so
+matches never contend with each other and there is no global lock.
+The one write a request thread makes is create_match registering a new
+match in its shard's registry; that is a single atomic dict store, and
+only the resolver removes matches.
+
+Matches live in the memory of the process that created them. The shard
+index leads the match id, so a deployment with several worker processes
+can route /api/pvp/<match_id> requests to the owning process by id.
+"""
+
+import heapq
+import itertools
+import queue
+import threading
+import time
+import uuid
+from .battle import Battle
+from .battle_state import BattleState, CharacterState
+from .journal import NullJournal
+from .shared import freeze
+from .skills import get_skill_cost
+
+# Journal side names; the host plays 'player' and the challenger 'enemy'
+SIDES = ('player', 'enemy')
+OPPONENT = freeze({'player': 'enemy', 'enemy': 'player'})
+
+DEFAULT_SHARDS = 4
+ROUND_TIMEOUT = 30.0   # Seconds both sides have to commit their actions
+JOIN_TIMEOUT = 300.0   # Seconds an open match waits for a challenger
+FINISHED_TTL = 60.0    # Seconds a finished match stays available for polling
+MAX_IDLE_ROUNDS = 5    # Timed out rounds without any committed action before a match is abandoned
+
+# Action a side takes when the round times out before it committed one
+TIMEOUT_ACTION = freeze({'type': 'basic', 'name': 'defend'})
+# Actions that only make sense against monsters
+FORBIDDEN_ACTIONS = frozenset(('Flee',))
+# Action types that use a named skill or spell from the character's lists
+LEARNED_ACTION_TYPES = frozenset(('abilities', 'skills', 'black_magic', 'white_magic'))
+
+def validate_action(action, character):
+    """
+    Check an action a client commits before it is queued.
+    Skills and spells must be on the character's own lists and affordable,
+    and items must be in their inventory.
+
+    Args:
+        action: Decoded request body
+        character (CharacterState): The committing side's latest published character state
+
+    Returns:
+        str: Error message, or None if the action may be committed
+    """
+    if not isinstance(action, dict):
+        return 'Invalid action data'
+    action_type = action.get('type', 'basic')
+    name = action.get('name', 'attack')
+    if not isinstance(action_type, str) or not isinstance(name, str):
+        return 'Action type and name must be strings'
+    if name in FORBIDDEN_ACTIONS:
+        return f"{name} cannot be used in PvP"
+    if action_type in LEARNED_ACTION_TYPES:
+        if name not in getattr(character, action_type):
+            return f"{character.name} does not know {name}"
+        if character.current_mp < get_skill_cost(name):
+            return f"Not enough MP for {name}"
+    elif action_type == 'items' and character.inventory.get(name, 0) <= 0:
+        return f"No {name} in inventory"
+    return None
+
+class PvPBattle(Battle):
+    """
+    Battle between two player characters.
+    The host is stored as the battle's player and the challenger as its
+    enemy, so the journal, replay and action handlers work unchanged.
+    There is no experience or loot; winner names the side still standing.
+    """
+
+    def __init__(self, host, challenger, journal=None, seed=None):
+        """
+        Initialize a PvP battle.
+
+        Args:
+            host (Character): Character of the player who opened the match
+            challenger (Character): Character of the player who joined it
+            journal (BattleJournal, optional): Event journal, discarding events if not given
+            seed (int, optional): Seed for the battle's random number generator
+        """
+        super().__init__(host, enemy=challenger, journal=journal if journal is not None else NullJournal(), seed=seed)
+        self.winner = None
+        self.idle_rounds = 0  # Consecutive rounds in which neither side committed
+
+    def start_battle(self):
+        """Log the start of the match and commit the opening snapshot."""
+        self.battle_log.add('pvp_start', self.player.name, self.enemy.name)
+        self._commit(force_snapshot=True)
+
+    def turn_order(self):
+        """
+        Get the order in which the sides act this round.
+        Higher effective agility acts first; ties are broken by the battle's random stream.
+
+        Returns:
+            tuple: Side names in acting order
+        """
+        player_agility = self.player.stat('agility')
+        enemy_agility = self.enemy.stat('agility')
+        if player_agility == enemy_agility:
+            player_first = self.rng.random() < 0.5
+        else:
+            player_first = player_agility > enemy_agility
+        return SIDES if player_first else SIDES[::-1]
+
+    def resolve_round(self, actions):
+        """
+        Resolve one round from the actions both sides committed.
+        Failed actions (e.g. not enough MP) lose the turn instead of being retried.
+        The match is abandoned as a draw after MAX_IDLE_ROUNDS rounds in a
+        row without any committed action.
+
+        Args:
+            actions (dict): Side -> action dict; a missing side timed out and defends
+        """
+        self.idle_rounds = 0 if actions else self.idle_rounds + 1
+        if self.idle_rounds >= MAX_IDLE_ROUNDS:
+            self.battle_log.add('pvp_abandoned', self.player.name, self.enemy.name)
+            self._finish(None)
+            self._commit()
+            return
+        for side in self.turn_order():
+            if self.battle_over:
+                break
+            actor = self._character(side)
+            action = actions.get(side)
+            if action is None:
+                self.battle_log.add('pvp_timeout', actor.name)
+                action = TIMEOUT_ACTION
+            if self.can_act(actor):
+                self._process_action(actor, self._character(OPPONENT[side]), action)
+            else:
+                self._skip_turn(actor)
+            self._acted.add(side)
+            self._check_battle_end()
+        if not self.battle_over:
+            self._end_round()
+            self._check_battle_end()
+        self._commit()
+
+    def forfeit(self, side):
+        """
+        End the battle in favour of the other side.
+
+        Args:
+            side (str): Side that gives up
+        """
+        if self.battle_over:
+            return
+        self.battle_log.add('forfeit', self._character(side).name)
+        self._finish(OPPONENT[side])
+        self._commit()
+
+    def _check_battle_end(self):
+        """End the battle once a side is down; both going down together is a draw."""
+        if self.battle_over:
+            return
+        player_alive = self.player.is_alive()
+        enemy_alive = self.enemy.is_alive()
+        if player_alive and enemy_alive:
+            return
+        for character in (self.player, self.enemy):
+            if not character.is_alive():
+                self.battle_log.add('defeated', character.name)
+        self._finish('player' if player_alive else 'enemy' if enemy_alive else None)
+
+    def _finish(self, winner):
+        """Record the winning side (None for a draw) and end the battle."""
+        self.winner = winner
+        self.end_battle(victory=winner == 'player')
+
+    def end_battle(self, victory):
+        """End the battle, clearing the challenger's modifiers and statuses as well as the host's."""
+        super().end_battle(victory)
+        self.enemy.modifiers.clear()
+        self.enemy.status_effects = []
+        self.enemy.disabled_until = 0
+
+    def side_states(self, locales):
+        """
+        Get each side's view of the battle, with the log entries added since the previous call.
+
+        Args:
+            locales (dict): Side -> locale to render the log in
+
+        Returns:
+            dict: Side -> BattleState with that side's character as player
+        """
+        states = {}
+        for side in SIDES:
+            states[side] = BattleState(
+                CharacterState.from_character(self._character(side)),
+                CharacterState.from_character(self._character(OPPONENT[side])),
+                self.turn,
+                self.battle_log.render(self._log_cursor, locales[side]),
+                self.battle_over,
+                self.winner == side
+            )
+        self._log_cursor = len(self.battle_log)
+        return states
+
+class PvPMatch:
+    """
+    A PvP match and the results published for its clients.
+    battle and pending belong to the shard's resolver thread;
+    request threads only use commands, view and wait.
+    """
+
+    def __init__(self, match_id, shard, host_id, host, locale):
+        """
+        Open a match waiting for a challenger.
+
+        Args:
+            match_id (str): Match identifier
+            shard (int): Index of the shard serving the match
+            host_id (str): Player id of the host
+            host (Character): Host's character
+            locale (str): Locale of the host's client
+        """
+        self.match_id = match_id
+        self.shard = shard
+        self.participants = {'player': host_id, 'enemy': None}
+        self.locales = {'player': locale, 'enemy': locale}
+        self.host = host
+        self.battle = None
+        self.commands = queue.SimpleQueue()
+        self.pending = {}
+        self.updates = []  # Published side -> BattleState dicts, one per version
+        self.closed = False
+        self._condition = threading.Condition()
+
+    @property
+    def version(self):
+        """Number of results published so far."""
+        return len(self.updates)
+
+    def side_of(self, player_id):
+        """
+        Get the side a player plays in this match.
+
+        Returns:
+            str: 'player', 'enemy' or None for non-participants
+        """
+        for side in SIDES:
+            if self.participants[side] == player_id:
+                return side
+        return None
+
+    def publish(self, states):
+        """Publish the sides' states of a resolved step and wake waiting clients."""
+        with self._condition:
+            self.updates.append(states)
+            self._condition.notify_all()
+
+    def close(self):
+        """Mark the match as gone and wake waiting clients."""
+        with self._condition:
+            self.closed = True
+            self._condition.notify_all()
+
+    def wait(self, since, timeout):
+        """
+        Block until a result newer than a version is published.
+
+        Args:
+            since (int): Version the client already has
+            timeout (float): Longest time to wait, in seconds
+
+        Returns:
+            bool: Whether a newer result is available
+        """
+        with self._condition:
+            return self._condition.wait_for(lambda: self.version > since or self.closed, timeout)
+
+    def latest(self, side):
+        """
+        Get the state most recently published for a side.
+
+        Returns:
+            BattleState: The side's latest state, or None before the match started
+        """
+        return self.updates[-1][side] if self.updates else None
+
+    def view(self, side, since=0):
+        """
+        Get a side's view of the match.
+
+        Args:
+            side (str): Side of the client
+            since (int): Version the client already has
+
+        Returns:
+            dict: Match id, side, version, whether the match has an opponent
+                and is over, the latest state and the log entries published after since
+        """
+        since = min(max(since, 0), self.version)
+        updates = self.updates[since:]
+        latest = self.latest(side)
+        return {
+            'match_id': self.match_id,
+            'side': side,
+            'version': since + len(updates),
+            'started': self.participants['enemy'] is not None,
+            'battle_over': latest.battle_over if latest else self.closed,
+            'state': latest,
+            'battle_log': [entry for update in updates for entry in update[side].battle_log]
+        }
+
+class _Shard(threading.Thread):
+    """Resolver thread owning the battles of one shard's matches."""
+
+    def __init__(self, index, round_timeout):
+        super().__init__(name=f'pvp-shard-{index}', daemon=True)
+        self.index = index
+        self.round_timeout = round_timeout
+        self.matches = {}
+        self.inbox = queue.SimpleQueue()
+        self._deadlines = []  # (time, tiebreak, match, kind, turn)
+        self._tiebreak = itertools.count()
+
+    def submit(self, match, command):
+        """Queue a command on a match and wake the resolver."""
+        match.commands.put(command)
+        self.inbox.put(match)
+
+    def stop(self):
+        """Ask the resolver to exit once its inbox is drained."""
+        self.inbox.put(None)
+
+    def run(self):
+        while True:
+            timeout = None
+            if self._deadlines:
+                timeout = max(0.0, self._deadlines[0][0] - time.monotonic())
+            try:
+                match = self.inbox.get(timeout=timeout)
+            except queue.Empty:
+                match = False
+            if match is None:
+                return
+            if match:
+                self._drain(match)
+            self._expire(time.monotonic())
+
+    def _schedule(self, match, kind, delay):
+        turn = match.battle.turn if match.battle else 0
+        heapq.heappush(self._deadlines, (time.monotonic() + delay, next(self._tiebreak), match, kind, turn))
+
+    def _expire(self, now):
+        """Resolve timed out rounds and drop expired matches."""
+        while self._deadlines and self._deadlines[0][0] <= now:
+            _, _, match, kind, turn = heapq.heappop(self._deadlines)
+            battle = match.battle
+            if kind == 'drop':
+                self.matches.pop(match.match_id, None)
+                match.close()
+            elif kind == 'join' and battle is None:
+                self.matches.pop(match.match_id, None)
+                match.close()
+            elif kind == 'round' and battle and not battle.battle_over and battle.turn == turn:
+                self._resolve(match)
+
+    def _drain(self, match):
+        """Apply every queued command of a match."""
+        while True:
+            try:
+                kind, player_id, payload = match.commands.get_nowait()
+            except queue.Empty:
+                return
+            if kind == 'open':
+                self._schedule(match, 'join', JOIN_TIMEOUT)
+            elif kind == 'join':
+                self._join(match, player_id, *payload)
+            elif match.battle is None or match.battle.battle_over:
+                continue
+            elif kind == 'action':
+                side = match.side_of(player_id)
+                # The first action a side commits for a round is the one that counts
+                if side is not None and side not in match.pending:
+                    match.pending[side] = payload
+                    if len(match.pending) == len(SIDES):
+                        self._resolve(match)
+            elif kind == 'forfeit':
+                side = match.side_of(player_id)
+                if side is not None:
+                    match.battle.forfeit(side)
+                    self._publish(match)
+
+    def _join(self, match, player_id, challenger, locale):
+        """Start the battle with the first challenger to join."""
+        if match.battle is not None or match.closed or player_id == match.participants['player']:
+            return
+        match.participants['enemy'] = player_id
+        match.locales['enemy'] = locale
+        match.battle = PvPBattle(match.host, challenger)
+        match.battle.start_battle()
+        self._publish(match)
+
+    def _resolve(self, match):
+        """Resolve the current round with the actions committed so far."""
+        actions, match.pending = match.pending, {}
+        match.battle.resolve_round(actions)
+        self._publish(match)
+
+    def _publish(self, match):
+        """Publish both sides' states and schedule the next deadline."""
+        match.publish(match.battle.side_states(match.locales))
+        if match.battle.battle_over:
+            self._schedule(match, 'drop', FINISHED_TTL)
+        else:
+            self._schedule(match, 'round', self.round_timeout)
+
+class PvPServer:
+    """Sharded registry and resolvers of PvP matches."""
+
+    def __init__(self, num_shards=DEFAULT_SHARDS, round_timeout=ROUND_TIMEOUT):
+        """
+        Start the resolver threads.
+
+        Args:
+            num_shards (int): Number of shards, each with its own resolver thread
+            round_timeout (float): Seconds both sides have to commit a round's actions
+        """
+        self.shards = [_Shard(index, round_timeout) for index in range(num_shards)]
+        self._next_shard = itertools.count()
+        for shard in self.shards:
+            shard.start()
+
+    def create_match(self, host_id, host, locale):
+        """
+        Open a match for a host.
+        The match is registered here so it can be looked up right away;
+        its join deadline is set by the shard's resolver.
+
+        Args:
+            host_id (str): Player id of the host
+            host (Character): Host's character
+            locale (str): Locale of the host's client
+
+        Returns:
+            PvPMatch: The open match
+        """
+        shard = self.shards[next(self._next_shard) % len(self.shards)]
+        match_id = f'{shard.index:x}-{uuid.uuid4().hex}'
+        match = PvPMatch(match_id, shard.index, host_id, host, locale)
+        shard.matches[match_id] = match
+        shard.submit(match, ('open', host_id, None))
+        return match
+
+    def get_match(self, match_id):
+        """
+        Look up a match.
+
+        Returns:
+            PvPMatch: The match, or None if it does not exist or expired
+        """
+        index, _, _ = match_id.partition('-')
+        try:
+            shard = self.shards[int(index, 16)]
+        except (ValueError, IndexError):
+            return None
+        return shard.matches.get(match_id)
+
+    def join(self, match, player_id, challenger, locale):
+        """Ask to join a match as its challenger."""
+        self.shards[match.shard].submit(match, ('join', player_id, (challenger, locale)))
+
+    def commit(self, match, player_id, action):
+        """Commit a player's action for the current round."""
+        self.shards[match.shard].submit(match, ('action', player_id, action))
+
+    def forfeit(self, match, player_id):
+        """Give up a match."""
+        self.shards[match.shard].submit(match, ('forfeit', player_id, None))
+
+    def close(self):
+        """Stop the resolver threads."""
+        for shard in self.shards:
+            shard.stop()
+        for shard in self.shards:
+            shard.join()
@@ -0,0 +1,245 @@
+"""
+Compact session encoding for characters and battles.
+
+The Flask session is a signed cookie, so everything stored in it is sent,
+signed and verified on every request. Instead of full Character.to_dict()
+payloads, the session only keeps catalog references (template key or enemy
+name plus level) and the mutable values that differ from what the templates
+regenerate. Static data such as ability lists, drops and special moves is
+rebuilt from CHARACTER_TEMPLATES and ENEMY_DATABASE through cached lookups.
+
+Encoded keys are kept short on purpose:
+    t   - character template key (players)
+    e   - enemy name (enemies)
+    lv  - level (players) or spawn level (enemies)
+    xp  - experience towards the next level
+    hp  - current HP
+    mp  - current MP
+    d   - stat deltas from the regenerated baseline (only non-zero entries)
+    eq  - equipment, when it differs from the template's
+    inv - inventory, when it differs from the template's
+    s   - set when the enemy has been stolen from
+    m   - active stat modifiers, when there are any
+    st  - active status effects as [status, duration, potency], when there are any
+"""
+
+from functools import lru_cache
+from .character import Character
+from .character_templates import get_character_template
+from .enemy_database import get_scaled_enemy_stats
+from .modifiers import ModifierStack
+from .spells.base import Status, StatusEffect
+
+# Stats that may drift from the template baseline during play
+TRACKED_STATS = (
+    'max_hp', 'max_mp', 'strength', 'defense',
+    'magic', 'magic_defense', 'agility', 'luck'
+)
+
+@lru_cache(maxsize=None)
+def _player_baseline(template_key, level):
+    """
+    Get the stats a player of the given template has at a level.
+
+    Args:
+        template_key (str): Character template key
+        level (int): Character level
+
+    Returns:
+        tuple: Stat values in TRACKED_STATS order
+    """
+    player = Character.from_template(template_key)
+    player.level_up(level - 1)
+    return tuple(getattr(player, stat) for stat in TRACKED_STATS)
+
+@lru_cache(maxsize=None)
+def _enemy_baseline(enemy_name, spawn_level):
+    """
+    Get the stats an enemy has when spawned for a player level.
+
+    Args:
+        enemy_name (str): Name of the enemy in ENEMY_DATABASE
+        spawn_level (int): Player level the enemy was scaled for
+
+    Returns:
+        tuple: Stat values in TRACKED_STATS order
+    """
+    enemy = Character.from_enemy_data(get_scaled_enemy_stats(enemy_name, spawn_level), spawn_level)
+    return tuple(getattr(enemy, stat) for stat in TRACKED_STATS)
+
+def _stat_deltas(character, baseline):
+    """Collect the tracked stats that differ from the baseline."""
+    deltas = {}
+    for stat, base_value in zip(TRACKED_STATS, baseline):
+        delta = getattr(character, stat) - base_value
+        if delta:
+            deltas[stat] = delta
+    return deltas
+
+def _apply_stat_deltas(character, deltas):
+    """Re-apply stored stat deltas to a freshly built character."""
+    for stat, delta in deltas.items():
+        setattr(character, stat, getattr(character, stat) + delta)
+
+def _encode_statuses(character):
+    """Encode active status effects; the apply chance no longer matters once applied."""
+    return [
+        [status_effect.status.value, status_effect.duration, status_effect.potency]
+        for status_effect in character.status_effects
+    ]
+
+def _decode_statuses(data):
+    """Rebuild status effects stored by _encode_statuses."""
+    return [StatusEffect(Status(status), duration, potency) for status, duration, potency in data]
+
+def encode_player(player):
+    """
+    Encode a player character into its compact session form.
+
+    Args:
+        player (Character): Player character built from a template
+
+    Returns:
+        dict: Compact session payload
+    """
+    data = {
+        't': player.template_key,
+        'lv': player.level,
+        'xp': player.experience,
+        'hp': player.current_hp,
+        'mp': player.current_mp
+    }
+    deltas = _stat_deltas(player, _player_baseline(player.template_key, player.level))
+    if deltas:
+        data['d'] = deltas
+    # Equipment and inventory are only stored once they differ from the template's
+    template = get_character_template(player.template_key)
+    if player.equipment != template['equipment']:
+        data['eq'] = player.equipment
+    if player.inventory != template['inventory']:
+        data['inv'] = player.inventory
+    if player.modifiers:
+        data['m'] = player.modifiers.encode()
+    if player.status_effects:
+        data['st'] = _encode_statuses(player)
+    return data
+
+def decode_player(data):
+    """
+    Rebuild a player character from its compact session form.
+
+    Args:
+        data (dict): Payload produced by encode_player
+
+    Returns:
+        Character: Rehydrated player character
+    """
+    player = Character.from_template(data['t'])
+    for stat, value in zip(TRACKED_STATS, _player_baseline(data['t'], data['lv'])):
+        setattr(player, stat, value)
+    player.level = data['lv']
+    player.experience = data['xp']
+    _apply_stat_deltas(player, data.get('d', {}))
+    player.current_hp = data['hp']
+    player.current_mp = data['mp']
+    if 'eq' in data:
+        player.equipment = dict(data['eq'])
+        player.refresh_equipment()
+    if 'inv' in data:
+        player.inventory = dict(data['inv'])
+    if 'm' in data:
+        player.modifiers = ModifierStack.decode(data['m'])
+    if 'st' in data:
+        player.status_effects = _decode_statuses(data['st'])
+    return player
+
+def encode_enemy(enemy):
+    """
+    Encode an enemy character into its compact session form.
+
+    Args:
+        enemy (Character): Enemy built from the enemy database
+
+    Returns:
+        dict: Compact session payload
+    """
+    data = {
+        'e': enemy.name,
+        'lv': enemy.spawn_level,
+        'hp': enemy.current_hp,
+        'mp': enemy.current_mp
+    }
+    deltas = _stat_deltas(enemy, _enemy_baseline(enemy.name, enemy.spawn_level))
+    if deltas:
+        data['d'] = deltas
+    if enemy.stolen:
+        data['s'] = 1
+    if enemy.modifiers:
+        data['m'] = enemy.modifiers.encode()
+    if enemy.status_effects:
+        data['st'] = _encode_statuses(enemy)
+    return data
+
+def decode_enemy(data):
+    """
+    Rebuild an enemy character from its compact session form.
+
+    Args:
+        data (dict): Payload produced by encode_enemy
+
+    Returns:
+        Character: Rehydrated enemy character
+    """
+    enemy = Character.from_enemy_data(get_scaled_enemy_stats(data['e'], data['lv']), data['lv'])
+    _apply_stat_deltas(enemy, data.get('d', {}))
+    enemy.current_hp = data['hp']
+    enemy.current_mp = data['mp']
+    enemy.stolen = bool(data.get('s'))
+    if 'm' in data:
+        enemy.modifiers = ModifierStack.decode(data['m'])
+    if 'st' in data:
+        enemy.status_effects = _decode_statuses(data['st'])
+    return enemy
+
+def encode_battle(battle):
+    """
+    Encode the battle progress that is not derivable from the characters.
+    The battle log is deliberately not stored; responses only carry the
+    entries produced during the current request. The seed is stored so a
+    resumed battle draws from the same reproducible stream.
+
+    Args:
+        battle (Battle): Active battle
+
+    Returns:
+        dict: Compact session payload
+    """
+    return {
+        'turn': battle.turn,
+        'seed': battle.seed,
+        'enemy': encode_enemy(battle.enemy)
+    }
+
+def decode_battle(data, player, journal=None):
+    """
+    Rebuild an active battle from its compact session form.
+    The generator is reseeded from the battle seed and the current turn, so
+    every turn draws its own stream instead of replaying the stream start
+    on each request, and the same actions always produce the same battle.
+
+    Args:
+        data (dict): Payload produced by encode_battle
+        player (Character): The rehydrated player character
+        journal (BattleJournal, optional): Journal the battle should record into
+
+    Returns:
+        Battle: Battle instance ready to process the next turn
+    """
+    from .battle import Battle
+
+    battle = Battle(player, enemy=decode_enemy(data['enemy']), journal=journal, seed=data.get('seed'))
+    battle.turn = data['turn']
+    battle.rng.seed(f"{battle.seed}:{battle.turn}")
+    battle.refresh_disabled(battle.player)
+    battle.refresh_disabled(battle.enemy)
+    return battle
@@ -0,0 +1,50 @@
+"""
+State shared between threads.
+
+Battles may run concurrently on the threads of a WSGI server, or truly in
+parallel on free-threaded CPython. Everything they share is either read-only
+or per-thread, so no lock is ever taken on the battle path:
+
+- Static catalogs (templates, enemies, items, skills, loot, encounters) are
+  frozen at import: dicts become read-only mappings and lists become tuples.
+- Each Battle owns its random stream; code running outside a battle draws
+  from a random stream private to its thread instead of the shared global
+  one from the random module.
+- Process-wide caches (functools.lru_cache) only hold immutable values.
+"""
+
+import random
+import threading
+from types import MappingProxyType
+
+_local = threading.local()
+
+def freeze(value):
+    """
+    Make catalog data deeply read-only.
+
+    Args:
+        value: Catalog value built from dicts, lists, sets and scalars
+
+    Returns:
+        The same data with dicts as MappingProxyType, lists as tuples and sets as frozensets
+    """
+    if isinstance(value, dict):
+        return MappingProxyType({key: freeze(item) for key, item in value.items()})
+    if isinstance(value, (list, tuple)):
+        return tuple(freeze(item) for item in value)
+    if isinstance(value, set):
+        return frozenset(value)
+    return value
+
+def thread_rng():
+    """
+    Get the calling thread's private random stream.
+
+    Returns:
+        random.Random: Stream created on first use in each thread, seeded from the OS
+    """
+    rng = getattr(_local, 'rng', None)
+    if rng is None:
+        rng = _local.rng = random.Random()
+    return rng
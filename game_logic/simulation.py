@@ -0,0 +1,216 @@
+"""
+Batch battle simulation with shared-memory result aggregation.
+
+Worker processes run battles and add their outcomes in place into a
+multiprocessing.shared_memory block: one row of counters and a turn
+histogram per (character class, enemy) pair, per worker. The parent merges
+all worker rows with a single reduction over the shared block once the
+workers finish, vectorized with NumPy when it is installed, so no
+per-battle results are pickled between processes.
+"""
+
+import multiprocessing
+import random
+from multiprocessing import shared_memory
+from .battle import Battle
+from .character import Character
+from .character_templates import CHARACTER_TEMPLATES
+from .enemy_database import ENEMY_DATABASE
+from .journal import NullJournal
+from .policies import attack_policy, auto_battle
+
+try:
+    import numpy
+except ImportError:  # Optional dependency
+    numpy = None
+
+CLASS_NAMES = tuple(CHARACTER_TEMPLATES)
+ENEMY_NAMES = tuple(ENEMY_DATABASE)
+CLASS_INDEX = {name: index for index, name in enumerate(CLASS_NAMES)}
+ENEMY_INDEX = {name: index for index, name in enumerate(ENEMY_NAMES)}
+
+# Counter fields stored for every (class, enemy) cell
+COUNTER_FIELDS = ('battles', 'victories', 'turns', 'damage_dealt', 'damage_taken', 'crits')
+TURN_BIN_WIDTH = 5
+TURN_BINS = 20  # Last bin collects every battle longer than the others cover
+CELL_SIZE = len(COUNTER_FIELDS) + TURN_BINS
+
+# Log codes that mark a critical hit
+CRITICAL_CODES = frozenset(('attack_critical', 'spell_damage_critical'))
+
+class _DamageTallyJournal(NullJournal):
+    """Journal that only totals damage per side, for simulation statistics."""
+
+    def __init__(self):
+        super().__init__()
+        self.damage = {'player': 0, 'enemy': 0}
+
+    def record(self, event_type, turn, **data):
+        if event_type == 'damage':
+            self.damage[data['target']] += data['amount']
+
+def simulate_battle(character_type, level=1, seed=None, policy=attack_policy, max_turns=200):
+    """
+    Run one battle to completion without rendering or persisting anything.
+
+    Args:
+        character_type (str): Character template the player uses
+        level (int): Player level
+        seed (int, optional): Seed for the battle's random stream
+        policy (callable): Maps the battle to the player's next action
+        max_turns (int): Turn limit after which the battle counts as lost
+
+    Returns:
+        dict: Outcome with enemy, victory, turns, damage and crit counts
+    """
+    player = Character.from_template(character_type)
+    player.level_up(level - 1)
+    journal = _DamageTallyJournal()
+    battle = Battle(player, journal=journal, seed=seed)
+    summary = auto_battle(battle, policy, max_turns)
+    crits = sum(1 for code, _ in battle.battle_log.entries() if code in CRITICAL_CODES)
+    return {
+        'enemy': battle.enemy.name,
+        'victory': battle.victory,
+        'turns': summary['turns'],
+        'damage_dealt': journal.damage['enemy'],
+        'damage_taken': journal.damage['player'],
+        'crits': crits
+    }
+
+class SharedResultCollector:
+    """
+    Shared-memory table of simulation counters.
+    Layout is int64[worker][class][enemy][CELL_SIZE], where each cell holds
+    COUNTER_FIELDS followed by the turn histogram.
+    """
+
+    def __init__(self, num_workers, name=None):
+        """
+        Create the shared block, or attach to an existing one by name.
+
+        Args:
+            num_workers (int): Number of worker rows
+            name (str, optional): Name of an existing block to attach to
+        """
+        self.num_workers = num_workers
+        self.worker_size = len(CLASS_NAMES) * len(ENEMY_NAMES) * CELL_SIZE
+        size = num_workers * self.worker_size * 8
+        self._owner = name is None
+        self._shm = shared_memory.SharedMemory(name=name, create=self._owner, size=size)
+        self._counts = self._shm.buf.cast('q')  # New blocks start zero-filled
+
+    @property
+    def name(self):
+        """Name workers use to attach to the block."""
+        return self._shm.name
+
+    def record(self, worker, class_name, result):
+        """
+        Add one battle outcome to a worker's row in place.
+
+        Args:
+            worker (int): Worker row index
+            class_name (str): Character template key
+            result (dict): Outcome from simulate_battle
+        """
+        cell = (worker * self.worker_size
+                + (CLASS_INDEX[class_name] * len(ENEMY_NAMES) + ENEMY_INDEX[result['enemy']]) * CELL_SIZE)
+        counts = self._counts
+        counts[cell] += 1
+        counts[cell + 1] += 1 if result['victory'] else 0
+        counts[cell + 2] += result['turns']
+        counts[cell + 3] += result['damage_dealt']
+        counts[cell + 4] += result['damage_taken']
+        counts[cell + 5] += result['crits']
+        turn_bin = min(result['turns'] // TURN_BIN_WIDTH, TURN_BINS - 1)
+        counts[cell + len(COUNTER_FIELDS) + turn_bin] += 1
+
+    def merge(self):
+        """
+        Sum every worker's row into one table.
+
+        Returns:
+            dict: (class, enemy) -> counters plus 'turn_histogram', for cells with battles
+        """
+        worker_size = self.worker_size
+        if numpy is not None:
+            table = numpy.frombuffer(self._shm.buf, dtype=numpy.int64).reshape(self.num_workers, worker_size)
+            totals = table.sum(axis=0).tolist()
+            del table  # Release the buffer export so the block can be closed
+        else:
+            # Each field's values across workers are one strided slice of the block
+            counts = self._counts
+            totals = [sum(counts[index::worker_size]) for index in range(worker_size)]
+
+        merged = {}
+        for class_index, class_name in enumerate(CLASS_NAMES):
+            for enemy_index, enemy_name in enumerate(ENEMY_NAMES):
+                cell = (class_index * len(ENEMY_NAMES) + enemy_index) * CELL_SIZE
+                if not totals[cell]:
+                    continue
+                stats = dict(zip(COUNTER_FIELDS, totals[cell:cell + len(COUNTER_FIELDS)]))
+                stats['turn_histogram'] = totals[cell + len(COUNTER_FIELDS):cell + CELL_SIZE]
+                merged[(class_name, enemy_name)] = stats
+        return merged
+
+    def close(self):
+        """Detach from the block, removing it if this collector created it."""
+        self._counts.release()
+        self._shm.close()
+        if self._owner:
+            self._shm.unlink()
+
+def _simulation_worker(collector_name, num_workers, worker, jobs, level, seed):
+    """Run a worker's share of battles and record them in its shared row."""
+    collector = SharedResultCollector(num_workers, name=collector_name)
+    seeds = random.Random(seed)
+    try:
+        for class_name, count in jobs:
+            for _ in range(count):
+                result = simulate_battle(class_name, level, seeds.getrandbits(64))
+                collector.record(worker, class_name, result)
+    finally:
+        collector.close()
+
+def run_simulations(battles_per_class, character_types=CLASS_NAMES, level=1, num_workers=None, seed=None):
+    """
+    Simulate battles across worker processes and aggregate the outcomes.
+
+    Args:
+        battles_per_class (int): Battles to run for each character type
+        character_types (tuple): Character template keys to simulate
+        level (int): Player level
+        num_workers (int, optional): Worker processes, defaults to the CPU count
+        seed (int, optional): Base seed, worker i derives its stream from seed + i
+
+    Returns:
+        dict: (class, enemy) -> aggregated counters and turn histogram
+
+    Raises:
+        RuntimeError: If a worker process did not exit cleanly
+    """
+    num_workers = max(1, num_workers or multiprocessing.cpu_count())
+    collector = SharedResultCollector(num_workers)
+    try:
+        procs = []
+        for worker in range(num_workers):
+            share, remainder = divmod(battles_per_class, num_workers)
+            count = share + (1 if worker < remainder else 0)
+            jobs = [(class_name, count) for class_name in character_types]
+            worker_seed = None if seed is None else seed + worker
+            proc = multiprocessing.Process(
+                target=_simulation_worker,
+                args=(collector.name, num_workers, worker, jobs, level, worker_seed)
+            )
+            proc.start()
+            procs.append(proc)
+        for proc in procs:
+            proc.join()
+        for worker, proc in enumerate(procs):
+            # A crashed worker leaves its row partly or entirely unfilled
+            if proc.exitcode != 0:
+                raise RuntimeError(f"Simulation worker {worker} exited with code {proc.exitcode}")
+        return collector.merge()
+    finally:
+        collector.close()
@@ -3,8 +3,13 @@ Definitions for skills, abilities, and magic in the game.
 Includes MP costs, effects, and targeting information.
 """
 
+from .loot import roll_steal
+from .modifiers import ADD, StatModifier
+from .shared import freeze
+from .spells import get_spell
+
 # MP costs for different actions
-SKILL_COSTS = {
+SKILL_COSTS = freeze({
     # Basic abilities (no MP cost)
     'Cheer': 0,
     'Provoke': 0,
@@ -23,17 +28,17 @@ SKILL_COSTS = {
 
     # White Magic
     'Cure': 4
-}
+})
 
 # Spell power for magic spells
-SPELL_POWER = {
+SPELL_POWER = freeze({
     'Fire': 20,
     'Thunder': 20,
     'Blizzard': 20
-}
+})
 
 # Special move data for enemies
-SPECIAL_MOVES = {
+SPECIAL_MOVES = freeze({
     'Frenzy': {
         'power': 1.5,
         'description': 'A powerful attack with increased damage'
@@ -54,11 +59,172 @@ SPECIAL_MOVES = {
         'power': 1.6,
         'description': 'A burst of dark energy that deals magical damage'
     }
+})
+
+# Declarative effect definitions for abilities and skills.
+# Each entry names an effect kind from EFFECT_COMPILERS plus its parameters;
+# messages are message codes from game_logic.messages, given the user's name.
+# Definitions are compiled once at import into SKILL_HANDLERS, so adding a
+# skill only needs a new entry here (and a cost in SKILL_COSTS).
+#   modifier - stack 'changes' as modifiers on the 'target' ('self' or 'enemy') for
+#              'duration' rounds (default: until the battle ends); 'kind' is 'add'
+#              (default) or 'mul', and added effective stats are floored at 'minimum'
+#   steal   - steal attempt with a chance of user luck / 100, taking an item from
+#             the target's steal table (see game_logic.loot) once per enemy
+#   flee    - end the battle without victory with probability 'chance'
+#   message - log only, for effects not modelled yet
+SKILL_EFFECTS = freeze({
+    'Cheer': {
+        'effect': 'modifier',
+        'target': 'self',
+        'changes': {'strength': 2},
+        'message': 'cheer'
+    },
+    'Provoke': {
+        'effect': 'modifier',
+        'target': 'enemy',
+        'changes': {'defense': -5, 'strength': 2},
+        'message': 'provoke'
+    },
+    'Steal': {
+        'effect': 'steal',
+        'success': 'steal_success',
+        'failure': 'steal_failure',
+        'nothing': 'steal_nothing'
+    },
+    'Power Break': {
+        'effect': 'modifier',
+        'target': 'enemy',
+        'changes': {'strength': -5},
+        'minimum': 1,
+        'message': 'power_break'
+    },
+    'Armor Break': {
+        'effect': 'modifier',
+        'target': 'enemy',
+        'changes': {'defense': -5},
+        'minimum': 1,
+        'message': 'armor_break'
+    },
+    'Dark Attack': {
+        'effect': 'message',
+        'message': 'dark_attack'
+    },
+    'Flee': {
+        'effect': 'flee',
+        'chance': 0.5,
+        'success': 'flee_success',
+        'failure': 'flee_failure'
+    }
+})
+
+def _compile_modifier(name, definition):
+    """Compile a 'modifier' effect into a handler stacking stat modifiers from the skill."""
+    changes = tuple(definition['changes'].items())
+    kind = definition.get('kind', ADD)
+    duration = definition.get('duration')
+    minimum = definition.get('minimum')
+    on_self = definition['target'] == 'self'
+    message = definition['message']
+
+    def handler(battle, user, target):
+        recipient = user if on_self else target
+        for stat, value in changes:
+            if minimum is not None and kind == ADD:
+                current = recipient.stat(stat)
+                value = max(minimum, current + value) - current
+            battle.add_modifier(recipient, StatModifier(stat, kind, value, duration, name))
+        battle.battle_log.add(message, user.name)
+    return handler
+
+def _compile_steal(name, definition):
+    """Compile a 'steal' effect into a luck-based steal attempt on the target's steal table."""
+    success = definition['success']
+    failure = definition['failure']
+    nothing = definition['nothing']
+
+    def handler(battle, user, target):
+        if target.stolen:
+            battle.battle_log.add(nothing, target.name)
+            return
+        steal_chance = user.stat('luck') / 100
+        if battle.rng.random() >= steal_chance:
+            battle.battle_log.add(failure, user.name)
+            return
+        item = roll_steal(target.name, battle.rng)
+        if item is None:
+            battle.battle_log.add(nothing, target.name)
+            return
+        battle.steal_item(user, target, item)
+        battle.battle_log.add(success, user.name, item)
+    return handler
+
+def _compile_flee(name, definition):
+    """Compile a 'flee' effect into a chance to end the battle."""
+    chance = definition['chance']
+    success = definition['success']
+    failure = definition['failure']
+
+    def handler(battle, user, target):
+        if battle.rng.random() < chance:
+            battle.end_battle(victory=False)
+            battle.battle_log.add(success, user.name)
+        else:
+            battle.battle_log.add(failure, user.name)
+    return handler
+
+def _compile_message(name, definition):
+    """Compile a 'message' effect that only logs."""
+    message = definition['message']
+
+    def handler(battle, user, target):
+        battle.battle_log.add(message, user.name)
+    return handler
+
+# Effect kind -> compiler(name, definition) producing a handler(battle, user, target)
+EFFECT_COMPILERS = {
+    'modifier': _compile_modifier,
+    'steal': _compile_steal,
+    'flee': _compile_flee,
+    'message': _compile_message
 }
 
+def compile_skill_effects(definitions):
+    """
+    Compile declarative effect definitions into bound handlers.
+    
+    Args:
+        definitions (dict): Skill name -> effect definition
+        
+    Returns:
+        dict: Skill name -> handler(battle, user, target)
+        
+    Raises:
+        KeyError: If a definition uses an unknown effect kind
+    """
+    return {
+        name: EFFECT_COMPILERS[definition['effect']](name, definition)
+        for name, definition in definitions.items()
+    }
+
+SKILL_HANDLERS = compile_skill_effects(SKILL_EFFECTS)
+
+def get_skill_handler(skill_name):
+    """
+    Get the compiled effect handler for an ability or skill.
+    
+    Args:
+        skill_name (str): Name of the ability or skill
+        
+    Returns:
+        callable: handler(battle, user, target), or None if the skill has no effect
+    """
+    return SKILL_HANDLERS.get(skill_name)
+
 def get_skill_cost(skill_name):
     """
     Get the MP cost for a skill or spell.
+    Spells missing from SKILL_COSTS cost their own mp_cost.
     
     Args:
         skill_name (str): Name of the skill
@@ -66,7 +232,11 @@ def get_skill_cost(skill_name):
     Returns:
         int: MP cost of the skill (0 if not found)
     """
-    return SKILL_COSTS.get(skill_name, 0)
+    cost = SKILL_COSTS.get(skill_name)
+    if cost is None:
+        spell = get_spell(skill_name)
+        cost = spell.mp_cost if spell else 0
+    return cost
 
 def get_spell_power(spell_name):
     """
@@ -4,13 +4,67 @@ Spells package containing all spell implementations for the game.
 
 from .base import Spell, SpellType, SpellEffect, Status, StatusEffect
 from .fire_spells import Fire, Fira, Firaga
-# Future imports will go here as we add more spell types:
-# from .ice_spells import Ice, Blizzara, Blizzaga
-# from .thunder_spells import Thunder, Thundara, Thundaga
-# from .healing_spells import Cure, Cura, Curaga
+from .ice_spells import Blizzard
+from .thunder_spells import Thunder
+from .healing_spells import (
+    Cure, Cura, Curaga, Regen, HighRegen, MassRegen, Esuna, Revive, MassRevive,
+    Dispel, MassDispel, NulBlaze, NulFrost, NulThunder, NulWater,
+    Haste, MassHaste, Slow, MassSlow, Shell, Protect
+)
+from ..shared import freeze
+
+# Spell name (as used in character templates) -> spell class
+SPELL_REGISTRY = freeze({
+    'Fire': Fire,
+    'Fira': Fira,
+    'Firaga': Firaga,
+    'Thunder': Thunder,
+    'Blizzard': Blizzard,
+    'Cure': Cure,
+    'Cura': Cura,
+    'Curaga': Curaga,
+    'Regen': Regen,
+    'High Regen': HighRegen,
+    'Mass Regen': MassRegen,
+    'Esuna': Esuna,
+    'Revive': Revive,
+    'Mass Revive': MassRevive,
+    'Dispel': Dispel,
+    'Mass Dispel': MassDispel,
+    'Nul Blaze': NulBlaze,
+    'Nul Frost': NulFrost,
+    'Nul Thunder': NulThunder,
+    'Nul Water': NulWater,
+    'Haste': Haste,
+    'Mass Haste': MassHaste,
+    'Slow': Slow,
+    'Mass Slow': MassSlow,
+    'Shell': Shell,
+    'Protect': Protect,
+})
+
+# Spells hold no per-cast state, so one instance per name is built at import
+# and shared by every battle and thread
+_SPELL_INSTANCES = freeze({name: spell_class() for name, spell_class in SPELL_REGISTRY.items()})
+
+def get_spell(name):
+    """
+    Get the shared spell instance for a spell name.
+    
+    Args:
+        name (str): Spell name
+        
+    Returns:
+        Spell: The spell instance, or None if the name is unknown
+    """
+    return _SPELL_INSTANCES.get(name)
 
 # Export all spell classes for easy access
 __all__ = [
     'Spell', 'SpellType', 'SpellEffect', 'Status', 'StatusEffect',
-    'Fire', 'Fira', 'Firaga',
+    'Fire', 'Fira', 'Firaga', 'Blizzard', 'Thunder',
+    'Cure', 'Cura', 'Curaga', 'Regen', 'HighRegen', 'MassRegen', 'Esuna', 'Revive', 'MassRevive',
+    'Dispel', 'MassDispel', 'NulBlaze', 'NulFrost', 'NulThunder', 'NulWater',
+    'Haste', 'MassHaste', 'Slow', 'MassSlow', 'Shell', 'Protect',
+    'SPELL_REGISTRY', 'get_spell',
 ] 
\ No newline at end of file
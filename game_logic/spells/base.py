@@ -1,11 +1,19 @@
 """
 Base classes and types for the spell system.
+
+This is the single spell core shared by the battle engine and every spell
+implementation, so enum members keep one identity and can be compared with
+`is`. Effects are frozen slotted dataclasses: they are small, allocated on
+every cast and never changed once calculated.
 """
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from functools import lru_cache
 from typing import Optional
 from enum import Enum
-import random
+from ..affinities import AFFINITY_MATRIX, ELEMENT_COLUMNS
+from ..modifiers import MULTIPLY, StatModifier
+from ..shared import thread_rng
 
 class SpellType(Enum):
     """Defines the different types of spells available"""
@@ -27,6 +35,7 @@ class Status(Enum):
     """Defines possible status effects"""
     BURN = "burn"      # Deals damage over time
     FREEZE = "freeze"  # Freezes the target
+    PARALYZE = "paralyze"  # Cannot act
     POISON = "poison"  # Deals percentage-based damage over time
     BLIND = "blind"    # Reduces accuracy
     SLEEP = "sleep"    # Cannot act
@@ -37,30 +46,42 @@ class Status(Enum):
     NULLIFY_ICE = "nullify_ice"         # Blocks one instance of ice damage
     NULLIFY_THUNDER = "nullify_thunder"  # Blocks one instance of thunder damage
     NULLIFY_WATER = "nullify_water"      # Blocks one instance of water damage
+    SHELL = "shell"      # Halves magic damage
+    PROTECT = "protect"  # Halves physical damage
+
+# Ailments removed by status-curing white magic such as Esuna
+NEGATIVE_STATUSES = frozenset((
+    Status.BURN, Status.FREEZE, Status.PARALYZE, Status.POISON, Status.BLIND, Status.SLEEP, Status.SLOW
+))
+
+# Crowd control: statuses that make their target skip turns
+DISABLING_STATUSES = frozenset((Status.FREEZE, Status.PARALYZE, Status.SLEEP))
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class StatusEffect:
     """Represents a status effect with duration and potency"""
     status: Status
     duration: int  # Number of turns
-    potency: int  # Effect strength (e.g., damage per turn for burn)
+    potency: int = 0  # Effect strength (e.g., damage per turn for burn)
     chance: float = 1.0  # Probability of applying the status (0.0 to 1.0)
+    max_duration: int = None  # If set, each application rolls its duration from duration to max_duration
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class SpellEffect:
     """Represents the effects a spell can have"""
     damage: int = 0
     healing: int = 0
     damage_type: DamageType = DamageType.NONE
-    stat_changes: dict = None
-    status_effects: list[StatusEffect] = None
+    stat_changes: dict = None  # Stat -> delta, None for no changes
+    status_effects: tuple[StatusEffect, ...] = ()
+    revive: float = 0.0  # Fraction of max HP a defeated target is revived with
+    cleanse: frozenset = frozenset()  # Statuses removed from the target
+    modifiers: tuple[tuple, ...] = ()  # (stat, kind, value, duration) stat modifiers put on the target
 
-    def __post_init__(self):
-        """Initialize empty collections if None"""
-        if self.stat_changes is None:
-            self.stat_changes = {}
-        if self.status_effects is None:
-            self.status_effects = []
+    def with_status(self, status_effect: StatusEffect) -> 'SpellEffect':
+        """Get a copy of this effect that also applies a status effect"""
+        return SpellEffect(self.damage, self.healing, self.damage_type, self.stat_changes,
+                           self.status_effects + (status_effect,), self.revive, self.cleanse, self.modifiers)
 
 class Spell:
     """Base class for all spells, abilities, and skills in the game"""
@@ -80,8 +101,10 @@ class Spell:
         self.spell_type = spell_type
         self.base_power = base_power
         self.description = description
-        self.targeting = targeting  # 'enemy', 'self', 'ally', 'all_enemies'
+        self.targeting = targeting  # 'enemy', 'self', 'ally', 'all_allies', 'all_enemies'
         self.damage_type = damage_type
+        self.inflicts = ()  # StatusEffects the spell may apply to its target
+
     def calculate_effect(self, caster, target) -> SpellEffect:
         """
         Calculate the effect of the spell based on caster and target stats.
@@ -95,24 +118,216 @@ class Spell:
             return False, f"Not enough MP! (Need {self.mp_cost} MP)"
         return True, None
 
-    def apply_effect(self, effect: SpellEffect, target) -> list[str]:
-        """Apply the calculated effect to the target and return log messages"""
+    def apply_effect(self, effect: SpellEffect, target, applier=None) -> list[tuple]:
+        """
+        Apply the calculated effect to the target through the compiled effect pipeline.
+        Returns lazily formatted log messages as (code, args) pairs, see game_logic.messages.
+        """
+        result = run_effect(compile_effect(effect), target, applier or DIRECT_APPLIER,
+                            effect.damage, effect.healing, self.name)
         messages = []
-        
-        if effect.damage > 0:
-            actual_damage = target.take_damage(effect.damage)
-            messages.append(f"{target.name} takes {actual_damage} damage!")
-            
-        if effect.healing > 0:
-            actual_healing = target.heal(effect.healing)
-            messages.append(f"{target.name} recovers {actual_healing} HP!")
-            
-        if effect.stat_changes:
-            for stat, change in effect.stat_changes.items():
-                setattr(target, stat, getattr(target, stat) + change)
-                messages.append(f"{target.name}'s {stat} {'increased' if change > 0 else 'decreased'} by {abs(change)}!")
-                
+        if result.damage > 0:
+            messages.append(('damage_taken', (target.name, result.damage)))
+        if result.healing > 0:
+            messages.append(('healed', (target.name, result.healing)))
+        messages.extend(result.messages)
         return messages
+
+# Compiled effect pipeline
+
+# Opcodes for compiled effect operations. Damage and healing amounts change
+# with every cast, so they are passed to run_effect rather than compiled in.
+OP_DAMAGE = 0  # (OP_DAMAGE, damage_type, nullify_status, halving_status, affinity_column)
+OP_HEAL = 1    # (OP_HEAL,)
+OP_STAT = 2    # (OP_STAT, stat, delta)
+OP_STATUS = 3  # (OP_STATUS, status_effect)
+OP_REVIVE = 4  # (OP_REVIVE, max_hp_fraction)
+OP_CLEANSE = 5  # (OP_CLEANSE, statuses)
+OP_MODIFIER = 6  # (OP_MODIFIER, stat, kind, value, duration)
+
+# Character attributes a SpellEffect may change
+STAT_SLOTS = frozenset((
+    'max_hp', 'max_mp', 'strength', 'defense',
+    'magic', 'magic_defense', 'agility', 'luck'
+))
+
+# Damage type -> (status that blocks one hit, status that halves the damage)
+DAMAGE_GUARDS = {
+    DamageType.PHYSICAL: (None, Status.PROTECT),
+    DamageType.FIRE: (Status.NULLIFY_FIRE, Status.SHELL),
+    DamageType.ICE: (Status.NULLIFY_ICE, Status.SHELL),
+    DamageType.THUNDER: (Status.NULLIFY_THUNDER, Status.SHELL),
+    DamageType.WATER: (Status.NULLIFY_WATER, Status.SHELL),
+    DamageType.NONE: (None, Status.SHELL)
+}
+
+@dataclass(slots=True)
+class EffectResult:
+    """Outcome of running a compiled effect against a target"""
+    damage: int = 0
+    healing: int = 0
+    messages: list = field(default_factory=list)  # (code, args) pairs
+
+def _damage_op(damage_type: DamageType) -> tuple:
+    nullify_status, halving_status = DAMAGE_GUARDS[damage_type]
+    return (OP_DAMAGE, damage_type, nullify_status, halving_status, ELEMENT_COLUMNS[damage_type.value])
+
+@lru_cache(maxsize=None)
+def damage_ops(damage_type: DamageType, status_effects: tuple[StatusEffect, ...] = ()) -> tuple:
+    """
+    Get the compiled operations of a hit: damage of one type, then the
+    statuses it may inflict. Compiled once per damage type and status set,
+    so attacks and black magic never compile at cast time.
+    """
+    return (_damage_op(damage_type),) + tuple((OP_STATUS, status_effect) for status_effect in status_effects)
+
+def compile_effect(effect: SpellEffect) -> tuple:
+    """
+    Turn a SpellEffect into a flat sequence of operations on known stat slots.
+    Damage guards and affinity columns are resolved here so running the
+    effect needs no lookups. The amounts are left out: pass effect.damage and
+    effect.healing to run_effect, so the same operations serve every cast.
+    """
+    ops = []
+    if effect.revive > 0:
+        ops.append((OP_REVIVE, effect.revive))
+    if effect.damage > 0:
+        ops.append(_damage_op(effect.damage_type))
+    if effect.healing > 0:
+        ops.append((OP_HEAL,))
+    if effect.cleanse:
+        ops.append((OP_CLEANSE, effect.cleanse))
+    for stat, change in (effect.stat_changes or {}).items():
+        if stat not in STAT_SLOTS:
+            raise ValueError(f"Unknown stat '{stat}' in spell effect")
+        if change:
+            ops.append((OP_STAT, stat, change))
+    for stat, kind, value, duration in effect.modifiers:
+        if stat not in STAT_SLOTS:
+            raise ValueError(f"Unknown stat '{stat}' in spell effect")
+        ops.append((OP_MODIFIER, stat, kind, value, duration))
+    for status_effect in effect.status_effects:
+        ops.append((OP_STATUS, status_effect))
+    return tuple(ops)
+
+def _find_status(target, status: Status):
+    """Get the target's active effect for a status, if any"""
+    for status_effect in target.status_effects:
+        if status_effect.status is status:
+            return status_effect
+    return None
+
+def run_effect(ops: tuple, target, applier, damage: int = 0, healing: int = 0, source: str = None) -> EffectResult:
+    """
+    Run compiled effect operations against a target, dealing damage and
+    restoring healing HP through the operations that take them. Stat
+    modifiers are tagged with source, normally the spell name. A hit that
+    is nullified, absorbed or resisted by immunity carries no statuses.
+    State changes go through the applier (a Battle, or DIRECT_APPLIER outside
+    of battles) so they are journaled when a battle is involved.
+    """
+    result = EffectResult()
+    blocked = False  # Set when the target blocked the hit; its statuses are skipped
+    for op in ops:
+        opcode = op[0]
+        if opcode == OP_DAMAGE:
+            if damage <= 0:
+                continue
+            _, damage_type, nullify_status, halving_status, column = op
+            amount = damage
+            if nullify_status is not None:
+                nullify = _find_status(target, nullify_status)
+                if nullify is not None:
+                    applier.remove_status(target, nullify)
+                    result.messages.append(('nullified', (target.name, damage_type.value)))
+                    blocked = True
+                    continue
+            if target.affinity_offset is not None:
+                multiplier = AFFINITY_MATRIX[target.affinity_offset + column]
+                if multiplier < 0:
+                    healed = applier.restore_hp(target, int(-multiplier * amount))
+                    result.healing += healed
+                    result.messages.append(('absorbed', (target.name, damage_type.value, healed)))
+                    blocked = True
+                    continue
+                if multiplier == 0:
+                    result.messages.append(('immune', (target.name, damage_type.value)))
+                    blocked = True
+                    continue
+                if multiplier != 1.0:
+                    amount = int(multiplier * amount)
+                    code = 'weakness' if multiplier > 1 else 'resisted'
+                    result.messages.append((code, (target.name, damage_type.value)))
+            if _find_status(target, halving_status) is not None:
+                amount = max(1, amount // 2)
+                result.messages.append(('mitigated', (target.name, halving_status.value)))
+            result.damage += applier.deal_damage(target, amount)
+        elif opcode == OP_HEAL:
+            # Healing does not reach defeated targets; reviving them is OP_REVIVE
+            if target.current_hp > 0 and healing > 0:
+                result.healing += applier.restore_hp(target, healing)
+        elif opcode == OP_REVIVE:
+            if target.current_hp <= 0:
+                result.healing += applier.restore_hp(target, max(1, int(target.max_hp * op[1])))
+                result.messages.append(('revived', (target.name,)))
+        elif opcode == OP_CLEANSE:
+            for status_effect in [active for active in target.status_effects if active.status in op[1]]:
+                applier.remove_status(target, status_effect)
+                result.messages.append(('status_removed', (target.name, status_effect.status.value)))
+        elif opcode == OP_STAT:
+            _, stat, change = op
+            applier.change_stat(target, stat, change)
+            code = 'stat_increased' if change > 0 else 'stat_decreased'
+            result.messages.append((code, (target.name, stat, abs(change))))
+        elif opcode == OP_MODIFIER:
+            _, stat, kind, value, duration = op
+            if any(modifier.source == source and modifier.stat == stat for modifier in target.modifiers):
+                continue  # Modifiers from one spell do not stack
+            applier.add_modifier(target, StatModifier(stat, kind, value, duration, source))
+            raised = value > 1 if kind == MULTIPLY else value > 0
+            code = 'stat_raised' if raised else 'stat_lowered'
+            result.messages.append((code, (target.name, stat)))
+        elif opcode == OP_STATUS:
+            status_effect = op[1]
+            if blocked or _find_status(target, status_effect.status) is not None:
+                continue  # Statuses do not stack
+            if status_effect.chance >= 1.0 or applier.rng.random() < status_effect.chance:
+                if status_effect.max_duration is not None:
+                    # Durations are rolled per application from the applier's random stream
+                    duration = applier.rng.randint(status_effect.duration, status_effect.max_duration)
+                    status_effect = StatusEffect(status_effect.status, duration, status_effect.potency)
+                applier.add_status(target, status_effect)
+                result.messages.append(('status_applied', (target.name, status_effect.status.value)))
+    return result
+
+class DirectApplier:
+    """Applies effect operations straight to a target, for use outside of battles"""
+
+    @property
+    def rng(self):
+        return thread_rng()
+
+    def deal_damage(self, target, amount):
+        return target.take_damage(amount)
+
+    def restore_hp(self, target, amount):
+        old_hp = target.current_hp
+        target.heal(amount)
+        return target.current_hp - old_hp
+
+    def change_stat(self, target, stat, delta):
+        setattr(target, stat, getattr(target, stat) + delta)
+
+    def add_status(self, target, status_effect):
+        target.status_effects.append(status_effect)
+
+    def add_modifier(self, target, modifier):
+        target.modifiers.add(modifier)
+
+    def remove_status(self, target, status_effect):
+        target.status_effects.remove(status_effect)
+
+DIRECT_APPLIER = DirectApplier()
     
 # Black Magic Spells subclass
 
@@ -161,7 +376,7 @@ class BlackMagicSpell(Spell):
         final_damage = min(int(final_damage), 99999)
         final_damage = max(final_damage, 0)  # Ensure damage isn't negative
         
-        return SpellEffect(damage=final_damage) 
+        return SpellEffect(damage=final_damage, damage_type=self.damage_type, status_effects=self.inflicts)
     
 # White Magic Spells subclass
 class WhiteMagicSpell(Spell):
@@ -171,7 +386,7 @@ class WhiteMagicSpell(Spell):
         self,
         name: str,
         mp_cost: int,
-        base_healing: int,
+        base_healing: int = 0,
         description: str = "",
         targeting: str = "ally"
     ):
@@ -179,13 +394,29 @@ class WhiteMagicSpell(Spell):
             name=name,
             mp_cost=mp_cost,
             spell_type=SpellType.WHITE_MAGIC,
-            base_healing=base_healing,
+            base_power=base_healing,
             description=description,
             targeting=targeting
-        )   
+        )
+        self.base_healing = base_healing
 
-    def calculate_effect(self, caster) -> SpellEffect:
-        """Calculate healing amount based on caster's magic stat"""
-        raw_healing = self.base_healing * ([caster.magic + self.base_healing] / 2)
-        return SpellEffect(healing=raw_healing)
-    
+    def calculate_effect(self, caster, target=None) -> SpellEffect:
+        """
+        Calculate healing from the caster's magic stat.
+        White magic does not depend on the target, so one effect serves every target of a cast.
+        """
+        if not self.base_healing:
+            return SpellEffect()
+        healing = self.base_healing * (caster.stat('magic') + self.base_healing) / 2
+        return SpellEffect(healing=int(healing))
+
+    def cast(self, caster, targets, applier=None) -> list[EffectResult]:
+        """
+        Cast the spell on every target in one pass: the effect is calculated and
+        compiled once, then its operations run against each target in turn.
+        Returns one EffectResult per target, in order.
+        """
+        effect = self.calculate_effect(caster)
+        ops = compile_effect(effect)
+        applier = applier or DIRECT_APPLIER
+        return [run_effect(ops, target, applier, effect.damage, effect.healing, self.name) for target in targets]
@@ -2,7 +2,7 @@
 Fire-based spell implementations.
 """
 
-from .base import BlackMagicSpell, SpellEffect, Status, StatusEffect, DamageType
+from .base import BlackMagicSpell, Status, StatusEffect, DamageType
 
 class FireSpell(BlackMagicSpell):
     """Base class for fire-element spells with burn effect"""
@@ -13,36 +13,26 @@ class FireSpell(BlackMagicSpell):
         mp_cost: int,
         base_power: int,
         burn_chance: float,
-        description: str
+        description: str,
+        targeting: str = "enemy"
     ):
         super().__init__(
             name=name,
             mp_cost=mp_cost,
             base_power=base_power,
             description=description,
-            targeting="enemy",
+            targeting=targeting,
             damage_type=DamageType.FIRE
         )
         self.burn_chance = burn_chance
-        self.burn_potency = 0.05 # 5% of max HP per turn if burned
+        self.burn_potency = 5  # 5% of max HP per turn if burned
         self.burn_duration = 999
-
-    def calculate_effect(self, caster, target) -> SpellEffect:
-        """Calculate fire damage and potential burn effect"""
-        # Get the base damage calculation from BlackMagicSpell
-        effect = super().calculate_effect(caster, target)
-        
-        # Add burn status effect
-        burn_effect = StatusEffect(
+        self.inflicts = (StatusEffect(
             status=Status.BURN,
-            duration=3,  # Lasts 3 turns
+            duration=self.burn_duration,
             potency=self.burn_potency,
-            chance=self.burn_chance,
-            duration=self.burn_duration
-        )
-        
-        effect.status_effects.append(burn_effect)
-        return effect
+            chance=self.burn_chance
+        ),)
 
 # Different tiers of fire spells
 class Fire(FireSpell):
@@ -2,8 +2,8 @@
 Healing-based spell implementations.
 """
 
-import random
-from .base import WhiteMagicSpell, SpellEffect, Status, StatusEffect
+from ..modifiers import MULTIPLY
+from .base import NEGATIVE_STATUSES, WhiteMagicSpell, SpellEffect, Status, StatusEffect
 
 class CureSpell(WhiteMagicSpell):
     """Base class for cure-type healing spells with regen effect"""
@@ -12,25 +12,26 @@ class CureSpell(WhiteMagicSpell):
         self,
         name: str,
         mp_cost: int,
-        base_healing: int,
+        base_healing: int = 0,
         regen_chance: float = 0.0,
         regen_percent: float = 0.0,  # Percentage of max HP to heal per turn
-        description: str = ""
+        description: str = "",
+        targeting: str = "ally"  # Healing spells target allies by default
     ):
         super().__init__(
             name=name,
             mp_cost=mp_cost,
             base_healing=base_healing,
             description=description,
-            targeting="ally"  # Healing spells target allies by default
+            targeting=targeting
         )
         self.regen_chance = regen_chance
         self.regen_percent = regen_percent
 
-    def calculate_effect(self, caster) -> SpellEffect:
+    def calculate_effect(self, caster, target=None) -> SpellEffect:
         """Calculate healing amount and potential regen effect"""
         # Get the base healing calculation from WhiteMagicSpell
-        effect = super().calculate_effect(caster)
+        effect = super().calculate_effect(caster, target)
         
         # Add regeneration status effect if applicable
         if self.regen_chance > 0:
@@ -42,7 +43,7 @@ class CureSpell(WhiteMagicSpell):
                 potency=int(self.regen_percent * 100),  # Store as percentage * 100 for easier reading
                 chance=self.regen_chance
             )
-            effect.status_effects.append(regen_effect)
+            effect = effect.with_status(regen_effect)
         
         return effect
     
@@ -53,18 +54,19 @@ class NullifySpell(WhiteMagicSpell):
         name: str,
         mp_cost: int,
         nullify_status: Status,
-        description: str
+        description: str,
+        targeting: str = "ally"
     ):
         super().__init__(
             name=name,
             mp_cost=mp_cost,
             base_healing=0,
             description=description,
-            targeting="ally"
+            targeting=targeting
         )
         self.nullify_status = nullify_status
 
-    def calculate_effect(self, caster) -> SpellEffect:
+    def calculate_effect(self, caster, target=None) -> SpellEffect:
         """Apply the nullify status effect"""
         effect = SpellEffect()
         
@@ -76,9 +78,100 @@ class NullifySpell(WhiteMagicSpell):
             chance=1.0    # Always applies
         )
         
-        effect.status_effects.append(nullify_effect)
+        effect = effect.with_status(nullify_effect)
         return effect
     
+class GuardSpell(WhiteMagicSpell):
+    """Base class for spells that put a timed damage guard (Shell, Protect) on the target"""
+    def __init__(
+        self,
+        name: str,
+        mp_cost: int,
+        status: Status,
+        description: str,
+        duration: int = 3,
+        targeting: str = "ally"
+    ):
+        super().__init__(
+            name=name,
+            mp_cost=mp_cost,
+            description=description,
+            targeting=targeting
+        )
+        self.effect = SpellEffect(status_effects=(StatusEffect(status=status, duration=duration),))
+
+    def calculate_effect(self, caster, target=None) -> SpellEffect:
+        """Apply the guard status; damage guards in the effect pipeline read it"""
+        return self.effect
+
+class ModifierSpell(WhiteMagicSpell):
+    """Base class for spells that scale a stat of the target for a few rounds"""
+    def __init__(
+        self,
+        name: str,
+        mp_cost: int,
+        stat: str,
+        scale: float,
+        description: str,
+        duration: int = 3,
+        targeting: str = "ally"
+    ):
+        super().__init__(
+            name=name,
+            mp_cost=mp_cost,
+            description=description,
+            targeting=targeting
+        )
+        self.effect = SpellEffect(modifiers=((stat, MULTIPLY, scale, duration),))
+
+    def calculate_effect(self, caster, target=None) -> SpellEffect:
+        """Stack the stat modifier; recasting does not stack it again"""
+        return self.effect
+
+class CleanseSpell(WhiteMagicSpell):
+    """Base class for spells that remove status effects"""
+    def __init__(
+        self,
+        name: str,
+        mp_cost: int,
+        statuses: frozenset,
+        description: str,
+        targeting: str = "ally"
+    ):
+        super().__init__(
+            name=name,
+            mp_cost=mp_cost,
+            description=description,
+            targeting=targeting
+        )
+        self.statuses = statuses
+
+    def calculate_effect(self, caster, target=None) -> SpellEffect:
+        """Remove the spell's statuses from the target"""
+        return SpellEffect(cleanse=self.statuses)
+
+class ReviveSpell(WhiteMagicSpell):
+    """Base class for spells that bring defeated allies back"""
+    def __init__(
+        self,
+        name: str,
+        mp_cost: int,
+        revive_percent: float,  # Fraction of max HP the target comes back with
+        description: str,
+        targeting: str = "ally"
+    ):
+        super().__init__(
+            name=name,
+            mp_cost=mp_cost,
+            description=description,
+            targeting=targeting
+        )
+        self.revive_percent = revive_percent
+
+    def calculate_effect(self, caster, target=None) -> SpellEffect:
+        """Revive a defeated target; living targets are unaffected"""
+        return SpellEffect(revive=self.revive_percent)
+
 # HEALING SPELLS
 
 class Cure(CureSpell):
@@ -87,7 +180,7 @@ class Cure(CureSpell):
         super().__init__(
             name="Cure",
             mp_cost=4,
-            base_healing=30,
+            base_healing=10,
             description="Restores a small amount of HP"
         )
 
@@ -97,7 +190,7 @@ class Cura(CureSpell):
         super().__init__(
             name="Cura",
             mp_cost=10,
-            base_healing=65,
+            base_healing=20,
             regen_chance=0.25,     # 25% chance to apply regen
             regen_percent=0.05,    # Heals 5% of max HP per turn
             description="Restores moderate HP with a chance to regenerate 5% HP per turn"
@@ -109,7 +202,7 @@ class Curaga(CureSpell):
         super().__init__(
             name="Curaga",
             mp_cost=20,
-            base_healing=120,
+            base_healing=35,
             regen_chance=0.4,      # 40% chance to apply regen
             regen_percent=0.10,    # Heals 10% of max HP per turn
             description="Restores significant HP with a chance to regenerate 10% HP per turn"
@@ -201,117 +294,124 @@ class NulWater(NullifySpell):
 
 # STATUS CURE SPELLS
 
-class Esuna(WhiteMagicSpell):
-    """Cures all status effects from the target"""
+class Esuna(CleanseSpell):
+    """Cures all status ailments from the target"""
     def __init__(self):
         super().__init__(
             name="Esuna",
-            mp_cost=5
-            
+            mp_cost=5,
+            statuses=NEGATIVE_STATUSES,
+            description="Cures the target of all status ailments"
         )
 
-class Revive(WhiteMagicSpell):
+class Revive(ReviveSpell):
     """Revives the target from death"""
     def __init__(self):
         super().__init__(
             name="Revive",
-            mp_cost=18
-            
+            mp_cost=18,
+            revive_percent=0.25,
+            description="Revives a defeated ally with 25% of their max HP"
         )
 
-class MassRevive(WhiteMagicSpell):
+class MassRevive(ReviveSpell):
     """Revives all allies from death"""
     def __init__(self):
         super().__init__(
             name="Mass Revive",
             mp_cost=60,
+            revive_percent=0.25,
+            description="Revives all defeated allies with 25% of their max HP",
             targeting="all_allies"
         )
 
-class Dispel(WhiteMagicSpell):
+class Dispel(CleanseSpell):
     """Removes all status effects from the target"""
     def __init__(self):
         super().__init__(
             name="Dispel",
             mp_cost=12,
+            statuses=frozenset(Status),
+            description="Removes all status effects from an enemy",
             targeting="enemy"
         )
 
-class MassDispel(WhiteMagicSpell):
-    """Removes all status effects from all allies"""
+class MassDispel(CleanseSpell):
+    """Removes all status effects from all enemies"""
     def __init__(self):
         super().__init__(
             name="Mass Dispel",
             mp_cost=35,
+            statuses=frozenset(Status),
+            description="Removes all status effects from all enemies",
             targeting="all_enemies"
         )
 
 # BUFF/DEBUFF SPELLS
 
-class Haste(WhiteMagicSpell):
+class Haste(ModifierSpell):
     """Increases the speed of the target"""
     def __init__(self):
         super().__init__(
             name="Haste",
-            mp_cost=8
+            mp_cost=8,
+            stat='agility',
+            scale=1.5,
+            description="Raises the target's agility by half for 3 rounds"
         )
 
-class MassHaste(WhiteMagicSpell):
+class MassHaste(ModifierSpell):
     """Increases the speed of all allies"""
     def __init__(self):
         super().__init__(
             name="Mass Haste",
             mp_cost=30,
+            stat='agility',
+            scale=1.5,
+            description="Raises the agility of all allies by half for 3 rounds",
             targeting="all_allies"
         )
 
-class Slow(WhiteMagicSpell):
+class Slow(ModifierSpell):
     """Decreases the speed of the target"""
     def __init__(self):
         super().__init__(
             name="Slow",
             mp_cost=8,
+            stat='agility',
+            scale=0.5,
+            description="Halves an enemy's agility for 3 rounds",
             targeting="enemy"
         )
 
-class MassSlow(WhiteMagicSpell):
+class MassSlow(ModifierSpell):
     """Decreases the speed of all enemies"""
     def __init__(self):
         super().__init__(
             name="Mass Slow",
             mp_cost=30,
+            stat='agility',
+            scale=0.5,
+            description="Halves the agility of all enemies for 3 rounds",
             targeting="all_enemies"
         )
 
-class Shell(WhiteMagicSpell):
+class Shell(GuardSpell):
     """Halves magic damage applied to the target"""
     def __init__(self):
         super().__init__(
             name="Shell",
             mp_cost=10,
+            status=Status.SHELL,
+            description="Halves magic damage taken by the target for 3 rounds"
         )
 
-class Protect(WhiteMagicSpell):
+class Protect(GuardSpell):
     """Halves physical damage applied to the target"""
     def __init__(self):
         super().__init__(
             name="Protect",
-            mp_cost=10
-        )
-
-class Reflect(WhiteMagicSpell):
-    """Reflects magic damage back to the caster"""
-    def __init__(self):
-        super().__init__(
-            name="Reflect",
-            mp_cost=14            
-        )
-
-class Barrier(WhiteMagicSpell):
-    """Blocks physical damage from the target"""
-    def __init__(self):
-        super().__init__(
-            name="Barrier",
-            mp_cost=14 
+            mp_cost=10,
+            status=Status.PROTECT,
+            description="Halves physical damage taken by the target for 3 rounds"
         )
-
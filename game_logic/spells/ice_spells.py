@@ -2,8 +2,8 @@
 Ice-based spell implementations.
 """
 
-from .base import BlackMagicSpell, SpellEffect, Status, StatusEffect, DamageType
-from random import randrange
+from .base import BlackMagicSpell, Status, StatusEffect, DamageType
+
 class IceSpell(BlackMagicSpell):
     """Base class for ice-element spells with freeze effect"""
     
@@ -13,32 +13,25 @@ class IceSpell(BlackMagicSpell):
         mp_cost: int,
         base_power: int,
         freeze_chance: float,
-        description: str
+        description: str,
+        targeting: str = "enemy"
     ):
         super().__init__(
             name=name,
             mp_cost=mp_cost,
             base_power=base_power,
             description=description,
-            targeting="enemy",
+            targeting=targeting,
             damage_type=DamageType.ICE
         )
         self.freeze_chance = freeze_chance
-        self.freeze_duration = randrange(1, 3)
-
-    def calculate_effect(self, caster, target) -> SpellEffect:
-        """Calculate ice damage and potential freeze effect"""
-        # Get the base damage calculation from BlackMagicSpell
-        effect = super().calculate_effect(caster, target)
-        
-        # Add freeze status effect
-        freeze_effect = StatusEffect(
-            status=Status.FREEZE, 
-            duration=self.freeze_duration,
+        # Frozen targets lose 1-2 turns, rolled on each application
+        self.inflicts = (StatusEffect(
+            status=Status.FREEZE,
+            duration=1,
+            max_duration=2,
             chance=self.freeze_chance
-        )
-        effect.status_effects.append(freeze_effect)
-        return effect
+        ),)
 
 # Different tiers of ice spells
 
@@ -46,11 +39,11 @@ class Blizzard(IceSpell):
     """Basic ice spell"""
     def __init__(self):
         super().__init__(
-            name="Frost",
+            name="Blizzard",
             mp_cost=4,
             base_power=20,
             freeze_chance=0.1,
-            description="Frost spell which hits all enemies"
+            description="Deals ice damage with a small chance to freeze"
         )
 
 class Blizzara(IceSpell):
@@ -61,7 +54,7 @@ class Blizzara(IceSpell):
             mp_cost=12,
             base_power=45,
             freeze_chance=0.25,
-            description="Blizzara spell which hits all enemies"
+            description="Deals moderate ice damage with a moderate chance to freeze"
         )
 
 class Blizzaga(IceSpell):
@@ -72,7 +65,7 @@ class Blizzaga(IceSpell):
             mp_cost=24,
             base_power=85,
             freeze_chance=0.4,
-            description="Blizzaga spell which hits all enemies"
+            description="Deals heavy ice damage with a high chance to freeze"
         )
 
 class Icywind(IceSpell):
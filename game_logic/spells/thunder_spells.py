@@ -1,7 +1,6 @@
 """Lightning-based spell implementations."""
 
-from .base import BlackMagicSpell, SpellEffect, Status, StatusEffect, DamageType
-from random import randrange
+from .base import BlackMagicSpell, Status, StatusEffect, DamageType
 
 class ThunderSpell(BlackMagicSpell):
     """Base class for lightning-element spells with paralyze effect"""
@@ -12,30 +11,25 @@ class ThunderSpell(BlackMagicSpell):
         mp_cost: int,
         base_power: int,
         paralyze_chance: float,
-        description: str
+        description: str,
+        targeting: str = "enemy"
     ):
         super().__init__(
             name=name,
             mp_cost=mp_cost,
             base_power=base_power,
             description=description,
-            targeting="enemy",
+            targeting=targeting,
             damage_type=DamageType.THUNDER
         )
         self.paralyze_chance = paralyze_chance
-        self.paralyze_duration = randrange(1, 3)  # Generate random duration here
-
-    def calculate_effect(self, caster, target) -> SpellEffect:
-        """Calculate lightning damage and potential paralyze effect"""
-        effect = super().calculate_effect(caster, target)
-        
-        paralyze_effect = StatusEffect(
+        # Paralyzed targets lose 1-2 turns, rolled on each application
+        self.inflicts = (StatusEffect(
             status=Status.PARALYZE,
-            duration=self.paralyze_duration,
+            duration=1,
+            max_duration=2,
             chance=self.paralyze_chance
-        )
-        effect.status_effects.append(paralyze_effect)
-        return effect
+        ),)
 
 class Thunder(ThunderSpell):
     """Basic thunder spell"""
@@ -0,0 +1,91 @@
+"""
+Fast JSON provider for the Flask app.
+
+Uses orjson when it is installed and falls back to the standard library
+encoder otherwise. Dataclasses such as BattleState are encoded field by
+field; orjson does this natively, the fallback through _default.
+"""
+
+import dataclasses
+import enum
+import json
+from collections.abc import Mapping
+from flask.json.provider import JSONProvider
+
+try:
+    import orjson
+except ImportError:  # Optional dependency
+    orjson = None
+
+def _default(obj):
+    """Encode values the JSON encoder does not handle natively."""
+    if dataclasses.is_dataclass(obj):
+        return {name: getattr(obj, name) for name in obj.__dataclass_fields__}
+    if isinstance(obj, enum.Enum):
+        return obj.value
+    if isinstance(obj, (set, frozenset)):
+        return list(obj)
+    if isinstance(obj, Mapping):  # Frozen catalog data
+        return dict(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+class FastJSONProvider(JSONProvider):
+    """
+    JSON provider producing compact UTF-8 output.
+    Calls asking for formatting options orjson does not support (indent,
+    sort_keys, ...) are served by the standard library encoder.
+    """
+
+    mimetype = 'application/json'
+
+    def dumps(self, obj, **kwargs):
+        """
+        Serialize data as a JSON string.
+
+        Args:
+            obj: The data to serialize
+            **kwargs: Standard library json.dumps options
+
+        Returns:
+            str: JSON text
+        """
+        if orjson is not None and not kwargs.keys() - {'separators'}:
+            return orjson.dumps(obj, default=_default).decode()
+        kwargs.setdefault('default', _default)
+        kwargs.setdefault('separators', (',', ':'))
+        kwargs.setdefault('ensure_ascii', False)
+        return json.dumps(obj, **kwargs)
+
+    def dumps_bytes(self, obj):
+        """
+        Serialize data straight to UTF-8 encoded JSON.
+
+        Args:
+            obj: The data to serialize
+
+        Returns:
+            bytes: JSON body
+        """
+        if orjson is not None:
+            return orjson.dumps(obj, default=_default)
+        return json.dumps(obj, default=_default, separators=(',', ':'), ensure_ascii=False).encode()
+
+    def loads(self, s, **kwargs):
+        """
+        Deserialize JSON text.
+
+        Args:
+            s (str or bytes): JSON text
+            **kwargs: Standard library json.loads options
+
+        Returns:
+            The decoded data
+        """
+        if orjson is not None and not kwargs:
+            return orjson.loads(s)
+        return json.loads(s, **kwargs)
+
+    def response(self, *args, **kwargs):
+        """Serialize the arguments into an application/json response."""
+        obj = self._prepare_response_obj(args, kwargs)
+        return self._app.response_class(self.dumps_bytes(obj), mimetype=self.mimetype)
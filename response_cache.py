@@ -0,0 +1,66 @@
+"""
+Precomputed HTTP responses for content that never changes while the app runs.
+
+A PrecomputedResponse hashes its body once for a strong ETag and keeps
+gzip (and, when the brotli package is installed, brotli) compressed copies,
+so serving it is a header lookup: a 304 when the client's ETag matches,
+otherwise the smallest encoding the client accepts.
+"""
+
+import gzip
+import hashlib
+
+try:
+    import brotli
+except ImportError:  # Optional dependency
+    brotli = None
+
+class PrecomputedResponse:
+    """A response body with its ETag and compressed variants."""
+
+    def __init__(self, body, mimetype, cache_control='public, max-age=3600'):
+        """
+        Hash and compress the body.
+
+        Args:
+            body (bytes): Uncompressed response body
+            mimetype (str): Response mimetype
+            cache_control (str): Cache-Control header value
+        """
+        self.mimetype = mimetype
+        self.cache_control = cache_control
+        self.etag = hashlib.sha256(body).hexdigest()[:32]
+        # Content-Encoding -> body, best compression first
+        self.bodies = {}
+        if brotli is not None:
+            self.bodies['br'] = brotli.compress(body, quality=11)
+        self.bodies['gzip'] = gzip.compress(body, compresslevel=9, mtime=0)
+        self.bodies = {encoding: data for encoding, data in self.bodies.items() if len(data) < len(body)}
+        self.body = body
+
+    def respond(self, request, response_class):
+        """
+        Build the response for a request.
+
+        Args:
+            request (flask.Request): Incoming request
+            response_class (type): Response class to instantiate
+
+        Returns:
+            flask.Response: 304 if the client's copy is current, otherwise the body
+        """
+        if request.if_none_match.contains(self.etag):
+            response = response_class(status=304)
+        else:
+            encoding, body = None, self.body
+            for candidate, data in self.bodies.items():
+                if request.accept_encodings[candidate]:
+                    encoding, body = candidate, data
+                    break
+            response = response_class(body, mimetype=self.mimetype)
+            if encoding:
+                response.headers['Content-Encoding'] = encoding
+        response.set_etag(self.etag)
+        response.headers['Cache-Control'] = self.cache_control
+        response.vary.add('Accept-Encoding')
+        return response
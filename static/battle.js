@@ -0,0 +1,212 @@
+// Stores the current state of the battle
+let battleState = null;
+
+// Action menus built from the bootstrap data: menu type -> button style
+const ACTION_MENUS = {
+  abilities: 'btn-info',
+  skills: 'btn-warning',
+  black_magic: 'btn-danger',
+  white_magic: 'btn-success',
+  items: 'btn-light'
+};
+
+/**
+ * Shows the player's stats in the player card
+ * @param {Object} player - Player state from the bootstrap data or a battle state
+ */
+function renderPlayer(player) {
+  const fields = ['name', 'current_hp', 'max_hp', 'current_mp', 'max_mp', 'level', 'experience',
+    'strength', 'defense', 'magic', 'magic_defense', 'agility', 'luck'];
+  fields.forEach(field => {
+    document.getElementById(`player-${field.replace('_', '-')}`).textContent = player[field];
+  });
+  const playerHpPercent = (player.current_hp / player.max_hp) * 100;
+  const playerMpPercent = (player.current_mp / player.max_mp) * 100;
+  document.getElementById('player-hp-bar').style.width = `${playerHpPercent}%`;
+  document.getElementById('player-mp-bar').style.width = `${playerMpPercent}%`;
+}
+
+/**
+ * Fills the submenus with the actions the player can take
+ * @param {Object} actions - Menu type -> action names, from the bootstrap data
+ */
+function buildActionMenus(actions) {
+  Object.entries(ACTION_MENUS).forEach(([menuType, buttonClass]) => {
+    const container = document.querySelector(`#${menuType}_menu .d-flex`);
+    const backButton = container.lastElementChild;
+    actions[menuType].forEach(name => {
+      const button = document.createElement('button');
+      button.className = `btn ${buttonClass}`;
+      button.textContent = name;
+      button.addEventListener('click', () => performAction(menuType, name));
+      container.insertBefore(button, backButton);
+    });
+  });
+}
+
+/**
+ * Updates the UI with the latest battle state
+ * @param {Object} state - The current battle state including player and enemy information
+ */
+function updateUI(state) {
+  battleState = state;
+
+  // Update player stats and status bars
+  renderPlayer(state.player);
+
+  // Update enemy information and status
+  document.getElementById('enemy-name').textContent = state.enemy.name;
+  document.getElementById('enemy-hp').textContent = state.enemy.current_hp;
+  document.getElementById('enemy-max-hp').textContent = state.enemy.max_hp;
+  document.getElementById('enemy-strength').textContent = state.enemy.strength;
+  document.getElementById('enemy-defense').textContent = state.enemy.defense;
+  document.getElementById('enemy-magic').textContent = state.enemy.magic;
+  document.getElementById('enemy-magic-defense').textContent = state.enemy.magic_defense;
+  const enemyHpPercent = (state.enemy.current_hp / state.enemy.max_hp) * 100;
+  document.getElementById('enemy-hp-bar').style.width = `${enemyHpPercent}%`;
+
+  // Append the entries produced by this request to the battle log
+  const battleLog = document.getElementById('battle-log');
+  battleLog.insertAdjacentHTML('beforeend', state.battle_log.map(log => `<p>${log}</p>`).join(''));
+  battleLog.scrollTop = battleLog.scrollHeight;  // Auto-scroll to latest entries
+
+  // Handle end of battle conditions
+  if (state.battle_over) {
+    // Disable all buttons when battle ends
+    document.querySelectorAll('button').forEach(btn => btn.disabled = true);
+    const message = state.victory ? 'Victory!' : 'Defeat!';
+    // Show result and return to character selection
+    setTimeout(() => {
+      alert(message);
+      window.location.href = '/';
+    }, 1000);
+  }
+}
+
+/**
+ * Handles showing/hiding action menus
+ * @param {string} menuType - The type of menu to display ('main' or specific submenu)
+ */
+function showActionMenu(menuType) {
+  // Hide all submenus first
+  document.querySelectorAll('.sub-menu').forEach(menu => menu.classList.add('d-none'));
+
+  // Show either main menu or specific submenu
+  if (menuType === 'main') {
+    document.getElementById('main_menu').classList.remove('d-none');
+  } else {
+    document.getElementById('main_menu').classList.add('d-none');
+    document.getElementById(`${menuType}_menu`).classList.remove('d-none');
+  }
+}
+
+/**
+ * Performs a battle action and sends it to the server
+ * @param {string} type - The type of action (basic, abilities, skills, etc.)
+ * @param {string} name - The specific action name
+ */
+function performAction(type, name) {
+  fetch('/battle_action', {
+    method: 'POST',
+    headers: {
+      'Content-Type': 'application/json',
+    },
+    body: JSON.stringify({ type: type, name: name })
+  })
+    .then(response => response.json())
+    .then(data => {
+      if (data.error) {
+        alert(data.error);
+        return;
+      }
+
+      updateUI(data);
+
+      // If action failed (e.g., not enough MP), don't hide the menus
+      if (!data.action_success) {
+        return;
+      }
+
+      // Hide all menus only if action was successful
+      document.querySelectorAll('.sub-menu, #main_menu').forEach(menu => menu.classList.add('d-none'));
+
+      // Show main menu after a short delay (unless battle is over)
+      if (!data.battle_over) {
+        setTimeout(() => {
+          showActionMenu('main');
+        }, 100);
+      }
+
+      // Show game over message if battle is over
+      if (data.battle_over) {
+        const message = data.victory ?
+          "Victory! You have won the battle!" :
+          "Defeat! You have been defeated...";
+        setTimeout(() => alert(message), 100);
+      }
+    })
+    .catch(error => {
+      console.error('Error:', error);
+      alert('An error occurred during battle');
+    });
+}
+
+/**
+ * Lets the server play out the rest of the battle with a policy
+ * @param {string} policy - 'attack', 'heal' or 'strongest_spell'
+ */
+function autoBattle(policy) {
+  fetch('/auto_battle', {
+    method: 'POST',
+    headers: {
+      'Content-Type': 'application/json',
+    },
+    body: JSON.stringify({ policy: policy, log: true })
+  })
+    .then(response => response.json())
+    .then(data => {
+      if (data.error) {
+        alert(data.error);
+        return;
+      }
+      updateUI(data);
+    })
+    .catch(error => {
+      console.error('Error:', error);
+      alert('An error occurred during battle');
+    });
+}
+
+/**
+ * Loads the player's bootstrap data and builds the action menus
+ */
+function loadPlayer() {
+  return fetch('/battle/bootstrap')
+    .then(response => response.json())
+    .then(data => {
+      if (data.error) {
+        window.location.href = '/';
+        return;
+      }
+      renderPlayer(data.player);
+      buildActionMenus(data.actions);
+    });
+}
+
+/**
+ * Initializes a new battle when the page loads
+ */
+function startBattle() {
+  fetch('/start_battle', {
+    method: 'POST'
+  })
+    .then(response => response.json())
+    .then(updateUI)
+    .catch(error => console.error('Error:', error));
+}
+
+// Initialize the battle when the page loads
+document.addEventListener('DOMContentLoaded', function () {
+  loadPlayer().then(startBattle);
+  showActionMenu('main');
+});
@@ -0,0 +1,34 @@
+document.addEventListener('DOMContentLoaded', function () {
+  const buttons = document.querySelectorAll('.select-character');
+  buttons.forEach(button => {
+    button.addEventListener('click', function () {
+      const characterType = this.dataset.character;
+      const body = new URLSearchParams({ character_type: characterType });
+      // The player id keys saved progress; keep it so a lost cookie does not lose progress
+      const playerId = localStorage.getItem('playerId');
+      if (playerId) {
+        body.set('player_id', playerId);
+      }
+      fetch('/select_character', {
+        method: 'POST',
+        headers: {
+          'Content-Type': 'application/x-www-form-urlencoded',
+        },
+        body: body.toString()
+      })
+        .then(response => response.json())
+        .then(data => {
+          if (data.success) {
+            localStorage.setItem('playerId', data.player_id);
+            window.location.href = '/battle';
+          } else {
+            alert('Error selecting character: ' + data.error);
+          }
+        })
+        .catch(error => {
+          console.error('Error:', error);
+          alert('Error selecting character');
+        });
+    });
+  });
+});
@@ -0,0 +1,38 @@
+import importlib
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+def _stop(module):
+    """Shut the app down the way atexit does; stopping again does nothing."""
+    module.progress.close()
+    module.battle_store.close()
+    module.pvp_server.close()
+
+@pytest.fixture
+def start_app(tmp_path, monkeypatch):
+    """
+    Start the app module against temporary databases.
+    Each call stops the previously started app first, like a process restart.
+    """
+    monkeypatch.delenv('SECRET_KEY', raising=False)
+    monkeypatch.setenv('SECRET_KEY_FILE', str(tmp_path / 'secret_key'))
+    monkeypatch.setenv('PROGRESS_DB', str(tmp_path / 'progress.db'))
+    monkeypatch.setenv('BATTLE_DB', str(tmp_path / 'battles.db'))
+    started = []
+
+    def start():
+        if started:
+            _stop(started[-1])
+        sys.modules.pop('app', None)
+        module = importlib.import_module('app')
+        started.append(module)
+        return module
+
+    yield start
+    if started:
+        _stop(started[-1])
+    sys.modules.pop('app', None)
@@ -0,0 +1,83 @@
+"""Session battles through the app: finished battles cannot be replayed."""
+
+from game_logic.battle import Battle
+from game_logic.character import Character
+
+ATTACK = {'type': 'basic', 'name': 'attack'}
+
+def select(client, character_type):
+    assert client.post('/select_character', data={'character_type': character_type}).status_code == 200
+
+def player_state(client):
+    return client.get('/battle/bootstrap').get_json()['player']
+
+def fight_to_the_end(client):
+    client.post('/start_battle')
+    for _ in range(500):
+        data = client.post('/battle_action', json=ATTACK).get_json()
+        if data['battle_over']:
+            return data
+    raise AssertionError('battle did not end')
+
+def test_finished_battle_rejects_further_actions(start_app):
+    client = start_app().app.test_client()
+    select(client, 'warrior')
+    fight_to_the_end(client)
+    after_battle = player_state(client)
+
+    response = client.post('/battle_action', json=ATTACK)
+    assert response.status_code == 400
+    assert response.get_json()['battle_over']
+    assert player_state(client) == after_battle
+    # Equipment can be changed again once the battle is over
+    assert client.post('/equip', json={'unequip': 'weapon'}).status_code == 200
+
+def test_battle_end_awards_exp_and_loot_once():
+    battle = Battle(Character.from_template('warrior'), seed=2)
+    battle.start_battle()
+    battle.enemy.current_hp = 0
+    battle._check_battle_end()
+    rewarded = (battle.player.experience, dict(battle.player.inventory))
+    battle._check_battle_end()
+    assert battle.victory
+    assert (battle.player.experience, dict(battle.player.inventory)) == rewarded
+
+def test_auto_battle_cannot_replay_a_finished_battle(start_app):
+    client = start_app().app.test_client()
+    select(client, 'warrior')
+    client.post('/start_battle')
+    data = client.post('/auto_battle', json={'policy': 'attack'}).get_json()
+    assert data['battle_over']
+    after_battle = player_state(client)
+
+    response = client.post('/auto_battle', json={'policy': 'attack'})
+    assert response.status_code == 400
+    assert player_state(client) == after_battle
+
+def test_auto_battle_errors_are_json(start_app, monkeypatch):
+    module = start_app()
+    client = module.app.test_client()
+    select(client, 'warrior')
+    client.post('/start_battle')
+
+    def explode(battle, policy):
+        raise RuntimeError('boom')
+    monkeypatch.setattr(module, 'auto_battle', explode)
+    response = client.post('/auto_battle', json={})
+    assert response.status_code == 500
+    assert response.get_json()['battle_over']
+
+def test_battle_action_errors_are_logged_with_their_traceback(start_app, monkeypatch, caplog):
+    module = start_app()
+    client = module.app.test_client()
+    select(client, 'warrior')
+    client.post('/start_battle')
+
+    def explode(data, player, journal=None):
+        raise RuntimeError('boom')
+    monkeypatch.setattr(module, 'decode_battle', explode)
+    response = client.post('/battle_action', json=ATTACK)
+    assert response.status_code == 500
+    assert response.get_json()['battle_over']
+    record, = [record for record in caplog.records if record.getMessage() == 'Error in battle_action']
+    assert record.exc_info[1].args == ('boom',)
@@ -0,0 +1,39 @@
+"""Saved progress survives app restarts and lost session cookies."""
+
+def select(client, character_type, **form):
+    response = client.post('/select_character', data={'character_type': character_type, **form})
+    assert response.status_code == 200
+    return response.get_json()
+
+def test_progress_survives_restart(start_app):
+    first = start_app()
+    client = first.app.test_client()
+    select(client, 'warrior')
+    assert client.post('/equip', json={'unequip': 'weapon'}).get_json()['success']
+    cookie = client.get_cookie('session')
+
+    restarted = start_app()
+    assert restarted.app.secret_key == first.app.secret_key
+    client = restarted.app.test_client()
+    client.set_cookie('session', cookie.value)
+    character = select(client, 'warrior')['character']
+    assert 'weapon' not in character['equipment']
+
+def test_player_id_restores_progress_without_cookie(start_app):
+    first = start_app()
+    client = first.app.test_client()
+    player_id = select(client, 'mage')['player_id']
+    client.post('/equip', json={'unequip': 'armor'})
+
+    restarted = start_app()
+    fresh = restarted.app.test_client()
+    assert 'armor' in select(fresh, 'mage')['character']['equipment']
+    restored = restarted.app.test_client()
+    data = select(restored, 'mage', player_id=player_id)
+    assert data['player_id'] == player_id
+    assert 'armor' not in data['character']['equipment']
+
+def test_invalid_player_id_is_rejected(start_app):
+    client = start_app().app.test_client()
+    response = client.post('/select_character', data={'character_type': 'mage', 'player_id': '../etc'})
+    assert response.status_code == 400
@@ -0,0 +1,68 @@
+"""Batch battle API: several actions per request, finished battles and the battle store."""
+
+import pytest
+
+from game_logic.batch import create_battles, run_batch
+from game_logic.persistence import SQLiteBattleStore
+
+ATTACK = {'type': 'basic', 'name': 'attack'}
+
+@pytest.fixture
+def store(tmp_path):
+    store = SQLiteBattleStore(str(tmp_path / 'battles.db'))
+    yield store
+    store.close()
+
+def test_store_round_trips_and_updates_records(store):
+    store.create_many({'a': {'p': {'lv': 1}, 'b': {'turn': 1}, 'over': False}, 'b': {'p': {}, 'b': {}, 'over': True}})
+    seen = {}
+
+    def update(records):
+        seen.update(records)
+        return {'a': dict(records['a'], over=True)}
+
+    assert store.update_many(['a', 'b', 'missing', 'a'], update) == {'a': {'p': {'lv': 1}, 'b': {'turn': 1}, 'over': True}}
+    assert seen == {'a': {'p': {'lv': 1}, 'b': {'turn': 1}, 'over': False}, 'b': {'p': {}, 'b': {}, 'over': True}}
+    reread = {}
+    store.update_many(['a'], lambda records: reread.update(records) or {})
+    assert reread == {'a': {'p': {'lv': 1}, 'b': {'turn': 1}, 'over': True}}
+
+def test_failed_updates_leave_records_and_store_usable(store):
+    store.create_many({'a': {'over': False}})
+
+    def fail(records):
+        raise RuntimeError('boom')
+
+    with pytest.raises(RuntimeError):
+        store.update_many(['a'], fail)
+    reread = {}
+    store.update_many(['a'], lambda records: reread.update(records) or {})
+    assert reread == {'a': {'over': False}}
+
+def test_batch_applies_several_actions_per_battle_in_order(store):
+    first, second = create_battles(store, 'warrior', 2, 'en')
+    results = run_batch(store, [[first, ATTACK], [second, ATTACK], [first, ATTACK], ['missing', ATTACK]], 'en')
+    assert [result['battle_id'] for result in results] == [first, second, first, 'missing']
+    assert [result.get('turn') for result in results[:3]] == [2, 2, 3]
+    assert results[3] == {'battle_id': 'missing', 'error': 'Unknown battle'}
+    # The battles were written back, so the next batch continues from turn 3
+    assert run_batch(store, [[first, ATTACK]], 'en')[0]['turn'] == 4
+
+def test_finished_battles_reject_actions(store):
+    battle_id, = create_battles(store, 'warrior', 1, 'en')
+    results = run_batch(store, [[battle_id, ATTACK]] * 300, 'en')
+    finished = next(index for index, result in enumerate(results) if result.get('battle_over'))
+    assert all(result == {'battle_id': battle_id, 'error': 'Battle is over', 'battle_over': True}
+               for result in results[finished + 1:])
+    assert run_batch(store, [[battle_id, ATTACK]], 'en')[0]['error'] == 'Battle is over'
+
+def test_batch_endpoints(start_app):
+    client = start_app().app.test_client()
+    created = client.post('/api/battles', json={'character_type': 'mage', 'count': 3}).get_json()['battles']
+    assert len(created) == 3
+    actions = [[battle_id, ATTACK] for battle_id in created] * 2
+    results = client.post('/api/battles/actions', json={'actions': actions}).get_json()['results']
+    assert len(results) == 6
+    assert all(result['turn'] == 3 for result in results[3:])
+    assert client.post('/api/battles/actions', json={'actions': [['id', 'attack']]}).status_code == 400
+    assert client.post('/api/battles', json={'character_type': 'bard'}).status_code == 400
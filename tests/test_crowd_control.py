@@ -0,0 +1,54 @@
+"""Crowd control: rolled durations, lost turns, sleep and persistence."""
+
+from game_logic.battle import Battle
+from game_logic.character import Character
+from game_logic.session_state import decode_battle, decode_player, encode_battle, encode_player
+from game_logic.spells.base import OP_STATUS, Status, StatusEffect, run_effect
+
+ATTACK = {'type': 'basic', 'name': 'attack'}
+
+def start_battle(seed=1):
+    battle = Battle(Character.from_template('warrior'), seed=seed)
+    battle.start_battle()
+    return battle
+
+def skipped_turns(battle):
+    return sum(1 for code, _ in battle.battle_log.entries() if code == 'cannot_act')
+
+def test_durations_are_rolled_per_application():
+    battle = start_battle()
+    ops = ((OP_STATUS, StatusEffect(Status.FREEZE, 1, max_duration=3)),)
+    durations = set()
+    for _ in range(60):
+        run_effect(ops, battle.enemy, battle)
+        (frozen,) = battle.enemy.status_effects
+        durations.add(frozen.duration)
+        battle.remove_status(battle.enemy, frozen)
+    assert durations == {1, 2, 3}
+
+def test_disabled_player_loses_exactly_its_duration():
+    battle = start_battle()
+    battle.add_status(battle.player, StatusEffect(Status.PARALYZE, 2))
+    battle.take_turn(ATTACK)
+    battle.take_turn(ATTACK)
+    assert skipped_turns(battle) == 2
+    assert battle.can_act(battle.player)
+    battle.take_turn(ATTACK)
+    assert skipped_turns(battle) == 2
+
+def test_damage_wakes_a_sleeping_target():
+    battle = start_battle()
+    battle.add_status(battle.enemy, StatusEffect(Status.SLEEP, 3))
+    assert not battle.can_act(battle.enemy)
+    battle.take_turn(ATTACK)
+    assert not battle.enemy.status_effects
+    assert skipped_turns(battle) == 0
+
+def test_disabled_state_survives_the_session_round_trip():
+    battle = start_battle()
+    battle.add_status(battle.enemy, StatusEffect(Status.FREEZE, 2))
+    battle.take_turn(ATTACK)
+    restored = decode_battle(encode_battle(battle), decode_player(encode_player(battle.player)))
+    assert not restored.can_act(restored.enemy)
+    restored.take_turn(ATTACK)
+    assert restored.can_act(restored.enemy)
@@ -0,0 +1,30 @@
+"""Difficulty tuning: the bisection keeps the best candidate it measured."""
+
+from game_logic import difficulty
+
+def test_tune_enemy_keeps_closest_candidate_when_win_rates_are_not_monotone(monkeypatch):
+    probed = []
+
+    def fake_win_rate(character_type, enemy_name, level, multiplier, *args):
+        probed.append(multiplier)
+        # Falls with the multiplier and crosses 0.5 at 2.0, except for one unlucky
+        # probe that sends the bracket below the answer
+        return 0.2 if multiplier == 1.075 else 1.0 - multiplier / 4
+
+    monkeypatch.setattr(difficulty, 'win_rate', fake_win_rate)
+    multiplier, rates = difficulty.tune_enemy('Goblin', 1, {'warrior': 0.5})
+    assert probed[:2] == [2.05, 1.075]
+    assert len(probed) == difficulty.BISECTION_STEPS
+    assert multiplier == 2.05
+    assert rates == {'warrior': 1.0 - 2.05 / 4}
+
+def test_tune_aims_each_level_at_its_own_target(monkeypatch):
+    monkeypatch.setattr(difficulty, 'win_rate', lambda c, e, l, multiplier, *args: 1.0 - multiplier / 4)
+    tuning = difficulty.tune({'warrior': 0.5, 'mage': 0.7}, levels=(1, 5), enemy_names=('Goblin',),
+                             num_workers=1, by_level={1: 0.9})
+    multipliers = tuning['multipliers']['Goblin']
+    # Level 1 aims at 0.9 for every class, level 5 at the classes' mean of 0.6
+    assert abs(multipliers['1'] - 0.4) < 0.01
+    assert abs(multipliers['5'] - 1.6) < 0.01
+    assert tuning['level_targets'] == {'1': 0.9}
+    assert difficulty.level_targets({'warrior': 0.5}, {1: 0.9}, 5) == {'warrior': 0.5}
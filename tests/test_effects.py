@@ -0,0 +1,61 @@
+"""Compiled effect pipeline: operations are compiled once and amounts passed at run time."""
+
+import pytest
+
+from game_logic.affinities import AFFINITY_MATRIX, ELEMENT_COLUMNS, ENEMY_ROWS, affinity_offset, apply_affinities
+from game_logic.character import Character
+from game_logic.spells.base import (
+    DIRECT_APPLIER, DamageType, SpellEffect, Status, StatusEffect, compile_effect, damage_ops, run_effect
+)
+
+def test_damage_ops_are_compiled_once_per_damage_type_and_statuses():
+    burn = (StatusEffect(Status.BURN, 3, 5),)
+    assert damage_ops(DamageType.FIRE, burn) is damage_ops(DamageType.FIRE, burn)
+    assert damage_ops(DamageType.FIRE) is not damage_ops(DamageType.ICE)
+
+def test_same_ops_serve_different_amounts():
+    ops = damage_ops(DamageType.PHYSICAL)
+    target = Character.from_template('warrior')
+    hp = target.current_hp
+    assert run_effect(ops, target, DIRECT_APPLIER, 10).damage == 10
+    assert run_effect(ops, target, DIRECT_APPLIER, 25).damage == 25
+    assert target.current_hp == hp - 35
+
+def test_compiled_effect_leaves_amounts_out():
+    heal = compile_effect(SpellEffect(healing=50))
+    assert heal == compile_effect(SpellEffect(healing=80))
+    target = Character.from_template('mage')
+    target.current_hp = 1
+    assert run_effect(heal, target, DIRECT_APPLIER, healing=80).healing == 80
+
+FREEZING_ICE = damage_ops(DamageType.ICE, (StatusEffect(Status.FREEZE, 2),))
+
+def statuses(target):
+    return [effect.status for effect in target.status_effects]
+
+def test_immune_targets_shrug_off_the_hits_statuses():
+    target = Character.from_template('mage')
+    target.affinity_offset = affinity_offset('Dark Elemental')
+    hp = target.current_hp
+    result = run_effect(FREEZING_ICE, target, DIRECT_APPLIER, 30)
+    assert result.damage == 0 and target.current_hp == hp
+    assert Status.FREEZE not in statuses(target)
+
+def test_nullified_hits_carry_no_statuses():
+    target = Character.from_template('mage')
+    run_effect(compile_effect(SpellEffect(status_effects=(StatusEffect(Status.NULLIFY_ICE, 3),))),
+               target, DIRECT_APPLIER)
+    run_effect(FREEZING_ICE, target, DIRECT_APPLIER, 30)
+    assert statuses(target) == []
+    # The nullify is spent, so the next hit lands with its status
+    run_effect(FREEZING_ICE, target, DIRECT_APPLIER, 30)
+    assert statuses(target) == [Status.FREEZE]
+
+def test_affinity_matrix_is_read_only():
+    with pytest.raises(TypeError):
+        AFFINITY_MATRIX[0] = 5.0
+
+def test_apply_affinities_matches_per_hit_resolution():
+    row, ice, thunder = ENEMY_ROWS['Dark Elemental'], ELEMENT_COLUMNS['ice'], ELEMENT_COLUMNS['thunder']
+    water, sahagin = ELEMENT_COLUMNS['water'], ENEMY_ROWS['Sahagin']
+    assert list(apply_affinities([row, row, sahagin], [ice, thunder, water], [30, 30, 30])) == [0, 60, -30]
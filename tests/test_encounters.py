@@ -0,0 +1,61 @@
+"""Encounter tables: alias sampling frequencies, level bands and degenerate tables."""
+
+import random
+from collections import Counter
+
+import pytest
+
+from game_logic.encounters import AliasTable, EncounterTable
+
+DRAWS = 30000
+
+def formation(enemies, weight, levels=(1, 99), regions=('field',), rarity='common'):
+    return {'enemies': enemies, 'weight': weight, 'rarity': rarity, 'levels': levels, 'regions': regions}
+
+def test_alias_table_matches_its_weights():
+    table = AliasTable(['a', 'b', 'c', 'd'], [5, 3, 1.5, 0.5])
+    rng = random.Random(5)
+    counts = Counter(table.sample(rng) for _ in range(DRAWS))
+    for item, weight in zip('abcd', (5, 3, 1.5, 0.5)):
+        assert abs(counts[item] / DRAWS - weight / 10) < 0.015
+
+def test_encounter_frequencies_follow_weight_and_rarity():
+    table = EncounterTable([
+        formation(('Goblin',), 10),
+        formation(('Ogre',), 10, rarity='uncommon'),
+        formation(('Wolf', 'Wolf'), 30, levels=(5, 10)),
+    ])
+    rng = random.Random(11)
+    early = Counter(table.draw(1, rng=rng) for _ in range(DRAWS))
+    assert set(early) == {('Goblin',), ('Ogre',)}
+    assert abs(early[('Goblin',)] / DRAWS - 2 / 3) < 0.015
+    banded = Counter(table.draw(10, rng=rng) for _ in range(DRAWS))
+    assert abs(banded[('Wolf', 'Wolf')] / DRAWS - 30 / 45) < 0.015
+    # Level 11 is past the pack's band again
+    assert ('Wolf', 'Wolf') not in {table.draw(11, rng=rng) for _ in range(500)}
+
+def test_seeded_draws_are_reproducible():
+    table = EncounterTable()
+    assert ([table.draw(12, 'cave', random.Random(2)) for _ in range(10)]
+            == [table.draw(12, 'cave', random.Random(2)) for _ in range(10)])
+
+@pytest.mark.parametrize('items, weights', [([], []), (['a', 'b'], [0, 0])])
+def test_alias_table_rejects_empty_and_zero_weight_tables(items, weights):
+    with pytest.raises(ValueError):
+        AliasTable(items, weights)
+
+def test_zero_weight_outcomes_are_never_drawn():
+    table = AliasTable(['never', 'always'], [0, 1])
+    rng = random.Random(3)
+    assert {table.sample(rng) for _ in range(1000)} == {'always'}
+
+def test_regions_and_levels_without_formations():
+    table = EncounterTable([formation(('Goblin',), 1, levels=(1, 5))])
+    with pytest.raises(KeyError):
+        table.draw(6)
+    with pytest.raises(KeyError):
+        table.draw(1, region='coast')
+    with pytest.raises(ValueError):
+        EncounterTable([formation(('Goblin',), 0)])
+    with pytest.raises(KeyError):
+        table.draw_single(1, exclude=['Goblin'], rng=random.Random(1))
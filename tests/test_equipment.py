@@ -0,0 +1,60 @@
+"""Equipment: equip, unequip and swap keep the cached bonuses current."""
+
+import pytest
+
+from game_logic.character import Character
+from game_logic.items import equipment_bonus
+from game_logic.session_state import decode_player, encode_player
+
+def warrior():
+    character = Character.from_template('warrior')
+    assert character.equipment == {'weapon': 'Bronze Sword', 'armor': 'Leather Armor'}
+    return character
+
+def test_swapping_a_weapon_returns_the_old_one_and_updates_stats():
+    character = warrior()
+    attack, agility = character.stat('attack'), character.stat('agility')
+    character.add_item('Dagger')
+    assert character.equip('Dagger')
+    assert character.equipment['weapon'] == 'Dagger'
+    assert character.inventory['Bronze Sword'] == 1 and 'Dagger' not in character.inventory
+    assert character.stat('attack') == attack - 4 + 3
+    assert character.stat('agility') == agility + 2
+    assert character.equip('Bronze Sword')
+    assert (character.stat('attack'), character.stat('agility')) == (attack, agility)
+
+def test_unequip_drops_the_bonus():
+    character = warrior()
+    defense = character.stat('defense')
+    assert character.unequip('armor')
+    assert character.stat('defense') == defense - 3
+    assert character.inventory['Leather Armor'] == 1
+    assert not character.unequip('armor')
+    assert not character.unequip('accessory')
+
+@pytest.mark.parametrize('item_name', ['Dagger', 'Potion', 'Excalibur'])
+def test_equip_rejects_missing_and_unequippable_items(item_name):
+    character = warrior()
+    bonus = character.equipment_bonus
+    if item_name == 'Potion':
+        assert character.inventory['Potion'] == 3
+    assert not character.equip(item_name)
+    assert character.equipment_bonus is bonus
+
+def test_equal_gear_shares_one_cached_bonus():
+    first, second = warrior(), warrior()
+    assert first.equipment_bonus is second.equipment_bonus
+    second.unequip('armor')
+    assert first.equipment_bonus == {'attack': 4, 'defense': 3}
+    assert second.equipment_bonus == {'attack': 4}
+    assert second.equipment_bonus is equipment_bonus(('Bronze Sword',))
+    with pytest.raises(TypeError):
+        first.equipment_bonus['attack'] = 99
+
+def test_decoded_players_recompute_their_bonus():
+    character = warrior()
+    character.add_item('Dagger')
+    character.equip('Dagger')
+    restored = decode_player(encode_player(character))
+    assert restored.equipment == character.equipment
+    assert restored.equipment_bonus == {'attack': 3, 'agility': 2, 'defense': 3}
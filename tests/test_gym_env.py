@@ -0,0 +1,40 @@
+"""Vector battle environments: in-process and subprocess variants return the same steps."""
+
+import random
+
+from game_logic.gym_env import OBS_SIZE, SubprocVecBattleEnv, VecBattleEnv
+
+NUM_ENVS = 4
+STEPS = 150
+
+def play(env, seed):
+    """Step an environment with random valid actions and collect everything it returns."""
+    rng = random.Random(seed)
+    observations, infos = env.reset(seed)
+    history = [(observations, infos)]
+    for _ in range(STEPS):
+        actions = [rng.choice([index for index, valid in enumerate(info['action_mask']) if valid])
+                   for info in infos]
+        step = env.step(actions)
+        observations, infos = step[0], step[4]
+        history.append(step)
+    return history
+
+def test_subprocess_env_matches_in_process_env():
+    expected = play(VecBattleEnv(NUM_ENVS, 'mage', seed=7), seed=11)
+    env = SubprocVecBattleEnv(NUM_ENVS, num_workers=2, character_type='mage', seed=7)
+    try:
+        assert play(env, seed=11) == expected
+    finally:
+        env.close()
+
+def test_finished_episodes_report_final_observation():
+    env = VecBattleEnv(NUM_ENVS, 'warrior', max_turns=3, seed=1)
+    env.reset()
+    for _ in range(3):
+        observations, rewards, terminated, truncated, infos = env.step([0] * NUM_ENVS)
+    for done, cut, info in zip(terminated, truncated, infos):
+        assert done or cut
+        assert len(info['final_observation']) == OBS_SIZE
+    # The next observation belongs to a fresh episode
+    assert all(observation != info['final_observation'] for observation, info in zip(observations, infos))
@@ -0,0 +1,47 @@
+"""Battle journals: recorded draws and replay from snapshots and events."""
+
+import pytest
+
+from game_logic.battle import Battle
+from game_logic.character import Character
+from game_logic.journal import BattleJournal, JournalStore, RecordingRandom
+
+ACTIONS = {
+    'warrior': ({'type': 'basic', 'name': 'attack'}, {'type': 'abilities', 'name': 'Cheer'},
+                {'type': 'skills', 'name': 'Power Break'}),
+    'mage': ({'type': 'black_magic', 'name': 'Thunder'}, {'type': 'black_magic', 'name': 'Blizzard'},
+             {'type': 'white_magic', 'name': 'Cure'}),
+    'rogue': ({'type': 'basic', 'name': 'attack'}, {'type': 'abilities', 'name': 'Steal'},
+              {'type': 'skills', 'name': 'Dark Attack'}),
+}
+
+def test_integer_helpers_are_recorded():
+    journal = BattleJournal()
+    rng = RecordingRandom(journal, lambda: 1, seed=3)
+    rng.randint(1, 6)
+    rng.choice('abc')
+    rng.randrange(10)
+    assert [event['type'] for event in journal.events] == ['rng'] * 3
+
+def state(battle):
+    return (battle.player.to_dict(), battle.enemy.to_dict(),
+            [(effect.status, effect.duration) for effect in battle.enemy.status_effects],
+            battle.turn, battle.battle_over, battle.victory)
+
+@pytest.mark.parametrize('character_type', sorted(ACTIONS))
+def test_restore_replays_to_the_live_state(tmp_path, character_type):
+    store = JournalStore(str(tmp_path))
+    for seed in range(5):
+        battle_id = f'{character_type}-{seed}'
+        player = Character.from_template(character_type)
+        player.current_mp = player.max_mp = 999
+        battle = Battle(player, journal=BattleJournal(battle_id, store, snapshot_interval=4), seed=seed)
+        battle.start_battle()
+        actions = ACTIONS[character_type]
+        for turn in range(60):
+            if battle.battle_over:
+                break
+            battle.process_turn(actions[turn % len(actions)])
+            restored = Battle.restore(battle_id, store)
+            assert state(restored) == state(battle)
+            assert restored.can_act(restored.enemy) == battle.can_act(battle.enemy)
@@ -0,0 +1,61 @@
+"""JSON provider: orjson and standard library encoding give the same JSON."""
+
+import dataclasses
+import enum
+import json
+from types import MappingProxyType
+
+import pytest
+from flask import Flask
+
+import json_provider
+from json_provider import FastJSONProvider
+
+class Color(enum.Enum):
+    RED = 'red'
+
+@dataclasses.dataclass
+class Point:
+    x: int
+    tags: frozenset
+
+PAYLOAD = {
+    'point': Point(1, frozenset({'a'})),
+    'color': Color.RED,
+    'catalog': MappingProxyType({'name': 'Potion', 'stats': MappingProxyType({'hp': 50})}),
+    'text': 'Épée',
+}
+EXPECTED = {'point': {'x': 1, 'tags': ['a']}, 'color': 'red',
+            'catalog': {'name': 'Potion', 'stats': {'hp': 50}}, 'text': 'Épée'}
+
+@pytest.fixture(params=['orjson', 'stdlib'])
+def provider(request, monkeypatch):
+    if request.param == 'orjson':
+        if json_provider.orjson is None:
+            pytest.skip('orjson is not installed')
+    else:
+        monkeypatch.setattr(json_provider, 'orjson', None)
+    return FastJSONProvider(Flask(__name__))
+
+def test_dataclasses_enums_sets_and_mappings_are_encoded(provider):
+    assert json.loads(provider.dumps(PAYLOAD)) == EXPECTED
+    assert json.loads(provider.dumps_bytes(PAYLOAD).decode()) == EXPECTED
+    # Compact UTF-8 output either way
+    assert provider.dumps_bytes({'a': [1, 'é']}) == '{"a":[1,"é"]}'.encode()
+
+def test_unknown_types_are_rejected(provider):
+    with pytest.raises(TypeError):
+        provider.dumps({'value': object()})
+
+def test_formatting_options_use_the_standard_library(provider):
+    assert provider.dumps({'b': 1, 'a': Color.RED}, sort_keys=True, indent=1) == '{\n "a":"red",\n "b":1\n}'
+
+def test_loads_and_responses(provider):
+    assert provider.loads('{"a": [1, 2]}') == {'a': [1, 2]}
+    assert provider.loads(b'{"a": 1}', parse_float=str) == {'a': 1}
+    app = Flask(__name__)
+    app.json = FastJSONProvider(app)
+    with app.app_context():
+        response = app.json.response(point=Point(2, frozenset()))
+    assert response.mimetype == 'application/json'
+    assert response.get_data() == b'{"point":{"x":2,"tags":[]}}'
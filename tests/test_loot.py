@@ -0,0 +1,48 @@
+"""Loot: alias-table drop distributions and enemies without drops."""
+
+import random
+from collections import Counter
+
+from game_logic import loot
+from game_logic.loot import compile_loot_tables, roll_drop, roll_steal, tally_drops
+
+DRAWS = 30000
+
+def test_drops_follow_rarity_scaled_weights_and_drop_rate():
+    rng = random.Random(7)
+    counts = Counter(roll_drop('Goblin', rng) for _ in range(DRAWS))
+    # Potion 10 x common, Small Gem 10 x uncommon (0.5), and a 50% chance of nothing
+    expected = {'Potion': 1 / 3, 'Small Gem': 1 / 6, None: 1 / 2}
+    assert set(counts) == set(expected)
+    for item, share in expected.items():
+        assert abs(counts[item] / DRAWS - share) < 0.015
+
+def test_tally_drops_matches_the_per_roll_distribution():
+    totals = tally_drops({'Ogre': DRAWS}, random.Random(7))
+    # Potion 10, Ogre Bone 5, Large Gem 1.5 out of 16.5, at a 60% drop rate
+    for item, weight in (('Potion', 10), ('Ogre Bone', 5), ('Large Gem', 1.5)):
+        assert abs(totals[item] / DRAWS - 0.6 * weight / 16.5) < 0.015
+    assert None not in totals
+
+def test_seeded_rolls_are_reproducible():
+    assert ([roll_drop('Wolf', random.Random(3)) for _ in range(5)]
+            == [roll_drop('Wolf', random.Random(3)) for _ in range(5)])
+
+def test_enemies_without_drops_never_drop(monkeypatch):
+    compiled = compile_loot_tables({
+        'Goblin': {'drop_rate': 0.5, 'drops': []},
+        'Wolf': {'drop_rate': 0.0, 'drops': [('Wolf Pelt', 10, 'common')]},
+    })
+    assert compiled['Goblin'] == (None, None) and compiled['Wolf'] == (None, None)
+    monkeypatch.setattr(loot, 'COMPILED_LOOT', compiled)
+    rng = random.Random(1)
+    assert {roll_drop('Goblin', rng) for _ in range(100)} == {None}
+    assert tally_drops({'Goblin': 100, 'Wolf': 100}, rng) == Counter()
+    assert roll_steal('Wolf', rng) is None
+
+def test_guaranteed_drops_have_no_empty_outcome():
+    compiled = compile_loot_tables({'Goblin': {'drop_rate': 1.0, 'drops': [('Potion', 1, 'common')]}})
+    assert compiled['Goblin'][0].items == ('Potion',)
+
+def test_characters_without_a_steal_table_have_nothing_to_steal():
+    assert roll_steal('Warrior', random.Random(1)) is None
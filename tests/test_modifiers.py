@@ -0,0 +1,50 @@
+"""Modifier stacks: ordering of adds and multiplies, expiry and removal by source."""
+
+from game_logic.character import Character
+from game_logic.modifiers import ADD, MULTIPLY, NEUTRAL, ModifierStack, StatModifier
+
+def test_flat_bonuses_apply_before_scaling_whatever_the_order_added():
+    for modifiers in ([StatModifier('strength', ADD, 10), StatModifier('strength', MULTIPLY, 1.5)],
+                      [StatModifier('strength', MULTIPLY, 1.5), StatModifier('strength', ADD, 10)]):
+        character = Character.from_template('warrior')
+        base = character.strength
+        for modifier in modifiers:
+            character.modifiers.add(modifier)
+        assert character.stat('strength') == int((base + 10) * 1.5)
+
+def test_stacked_modifiers_combine_per_stat():
+    stack = ModifierStack([
+        StatModifier('defense', ADD, 3), StatModifier('defense', ADD, -1),
+        StatModifier('defense', MULTIPLY, 2.0), StatModifier('defense', MULTIPLY, 0.5),
+        StatModifier('agility', MULTIPLY, 1.5),
+    ])
+    assert stack.totals == {'defense': (2, 1.0), 'agility': (0, 1.5)}
+    assert stack.totals.get('magic', NEUTRAL) == NEUTRAL
+
+def test_timed_modifiers_expire_after_their_rounds():
+    short = StatModifier('agility', MULTIPLY, 1.5, duration=1)
+    longer = StatModifier('strength', ADD, 5, duration=2)
+    permanent = StatModifier('defense', ADD, 2)
+    stack = ModifierStack([short, longer, permanent])
+    assert stack.tick() == [short]
+    assert stack.totals == {'strength': (5, 1.0), 'defense': (2, 1.0)}
+    assert stack.tick() == [longer]
+    assert stack.tick() == []
+    assert list(stack) == [permanent] and permanent.duration is None
+
+def test_remove_source_drops_only_that_sources_modifiers():
+    stack = ModifierStack([
+        StatModifier('strength', ADD, 5, source='Cheer'), StatModifier('defense', ADD, 5, source='Cheer'),
+        StatModifier('strength', MULTIPLY, 0.5, source='Power Break'),
+    ])
+    assert stack.remove_source('Cheer') == 2
+    assert stack.totals == {'strength': (0, 0.5)}
+    assert stack.remove_source('Cheer') == 0
+    stack.clear()
+    assert len(stack) == 0 and stack.totals == {}
+
+def test_encoding_round_trips():
+    stack = ModifierStack([StatModifier('magic', MULTIPLY, 1.25, 3, 'Focus'), StatModifier('luck', ADD, 2)])
+    restored = ModifierStack.decode(stack.encode())
+    assert list(restored) == list(stack)
+    assert restored.totals == stack.totals
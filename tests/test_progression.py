@@ -0,0 +1,54 @@
+"""Progression tables: level boundaries on the cumulative experience table."""
+
+import pytest
+
+from game_logic.character import Character
+from game_logic.progression import EXP_CURVES, MAX_LEVEL, ProgressionTable, get_progression
+
+STANDARD = ProgressionTable(EXP_CURVES['standard'], {'strength': 1.5})
+
+@pytest.mark.parametrize('experience, expected', [
+    (0, (1, 0)),
+    (99, (1, 99)),     # One below the first threshold
+    (100, (2, 0)),     # Exactly at it
+    (101, (2, 1)),
+    (381, (2, 281)),   # One below level 3 (100 + 282)
+    (382, (3, 0)),
+])
+def test_resolve_at_threshold_boundaries(experience, expected):
+    assert STANDARD.resolve(1, experience) == expected
+
+def test_resolve_spans_several_levels_at_once():
+    cumulative = STANDARD.cumulative_exp
+    assert STANDARD.resolve(1, cumulative[9] + 5) == (10, 5)
+    # Resolving from a later level counts experience from that level's threshold
+    assert STANDARD.resolve(4, cumulative[9] - cumulative[3]) == (10, 0)
+
+def test_resolve_stops_at_the_maximum_level():
+    level, _ = STANDARD.resolve(1, STANDARD.cumulative_exp[-1] * 2)
+    assert level == MAX_LEVEL
+    assert STANDARD.resolve(MAX_LEVEL - 1, STANDARD.exp_to_next(MAX_LEVEL - 1))[0] == MAX_LEVEL
+    assert STANDARD.exp_to_next(MAX_LEVEL) == 0
+
+def test_fractional_growth_accumulates():
+    assert [STANDARD.stat_gain('strength', 1, level) for level in (2, 3, 4, 5)] == [1, 3, 4, 6]
+    assert STANDARD.stat_gain('magic', 1, 10) == 0
+
+def test_multi_level_gain_matches_levelling_one_at_a_time():
+    at_once = Character.from_template('warrior')
+    at_once.gain_experience(450)
+    stepwise = Character.from_template('warrior')
+    for _ in range(9):
+        stepwise.gain_experience(50)
+    assert (at_once.level, at_once.experience) == (stepwise.level, stepwise.experience) == (5, 50)
+    assert at_once.to_dict() == stepwise.to_dict()
+    assert at_once.strength == Character.from_template('warrior').strength + get_progression('warrior').stat_gain('strength', 1, 5)
+
+def test_gaining_a_level_restores_hp_and_mp():
+    character = Character.from_template('mage')
+    character.current_hp = character.current_mp = 1
+    character.gain_experience(99)
+    assert character.current_hp == 1
+    character.gain_experience(1)
+    assert (character.level, character.experience) == (2, 0)
+    assert (character.current_hp, character.current_mp) == (character.max_hp, character.max_mp)
@@ -0,0 +1,135 @@
+"""PvP rounds: crowd control ordering, action validation and the match flow."""
+
+import time
+
+import pytest
+
+from game_logic import pvp
+
+from game_logic.battle import Battle
+from game_logic.battle_state import CharacterState
+from game_logic.character import Character
+from game_logic.pvp import MAX_IDLE_ROUNDS, PvPBattle, PvPServer, validate_action
+from game_logic.spells.base import Status, StatusEffect
+
+ATTACK = {'type': 'basic', 'name': 'attack'}
+STUN = {'type': 'stun'}
+
+class StunBattle(PvPBattle):
+    """PvP battle with a test-only action that always paralyzes for one round."""
+
+    def _process_action(self, actor, target, action):
+        if action['type'] == 'stun':
+            self._record('action', actor=self._side(actor), action_type='stun', name=None)
+            self.add_status(target, StatusEffect(Status.PARALYZE, 1))
+            return True
+        return super()._process_action(actor, target, action)
+
+def start_battle():
+    """Start a battle in which the host always acts first."""
+    host = Character.from_template('rogue')
+    challenger = Character.from_template('warrior')
+    host.agility, challenger.agility = 50, 10
+    battle = StunBattle(host, challenger, seed=1)
+    battle.start_battle()
+    assert battle.turn_order() == ('player', 'enemy')
+    return battle
+
+def skipped_turns(battle):
+    return [args[0] for code, args in battle.battle_log.entries() if code == 'cannot_act']
+
+@pytest.mark.parametrize('stunner', ['player', 'enemy'])
+def test_one_round_stun_costs_exactly_one_action(stunner):
+    battle = start_battle()
+    target = battle._character('enemy' if stunner == 'player' else 'player')
+    battle.resolve_round({stunner: STUN, 'enemy' if stunner == 'player' else 'player': ATTACK})
+    if stunner == 'player':
+        # Landed before the challenger acted: they lose this round's action
+        assert skipped_turns(battle) == [target.name]
+    else:
+        # Landed after the host acted: they lose next round's action instead
+        assert skipped_turns(battle) == []
+        assert not battle.can_act(target)
+        battle.resolve_round({'player': ATTACK, 'enemy': ATTACK})
+        assert skipped_turns(battle) == [target.name]
+    assert battle.can_act(target)
+    assert not target.status_effects
+
+def test_idle_rounds_abandon_the_match_as_a_draw():
+    battle = start_battle()
+    for _ in range(MAX_IDLE_ROUNDS - 1):
+        battle.resolve_round({})
+    # A committed action resets the count
+    battle.resolve_round({'player': {'type': 'basic', 'name': 'defend'}})
+    for _ in range(MAX_IDLE_ROUNDS - 1):
+        battle.resolve_round({})
+    assert not battle.battle_over
+    battle.resolve_round({})
+    assert battle.battle_over and battle.winner is None
+
+def test_abandoned_matches_are_dropped(monkeypatch):
+    monkeypatch.setattr(pvp, 'FINISHED_TTL', 0.0)
+    server = PvPServer(num_shards=1, round_timeout=0.001)
+    try:
+        match = server.create_match('host', Character.from_template('rogue'), 'en')
+        server.join(match, 'challenger', Character.from_template('warrior'), 'en')
+        deadline = time.monotonic() + 10
+        while server.get_match(match.match_id) is not None and time.monotonic() < deadline:
+            match.wait(match.version, 0.1)
+        assert server.get_match(match.match_id) is None
+        assert match.latest('player').battle_over
+        assert not match.latest('player').victory and not match.latest('enemy').victory
+    finally:
+        server.close()
+
+def test_validate_action_checks_the_committing_character():
+    mage = Character.from_template('mage')
+    mage.add_item('Potion')
+    state = CharacterState.from_character(mage)
+    assert validate_action({'type': 'black_magic', 'name': 'Fire'}, state) is None
+    assert validate_action({'type': 'items', 'name': 'Potion'}, state) is None
+    assert validate_action({'type': 'abilities', 'name': 'Steal'}, state) == 'Black Mage does not know Steal'
+    assert validate_action({'type': 'items', 'name': 'Ether'}, state) == 'No Ether in inventory'
+    assert validate_action({'type': 'skills', 'name': 'Flee'}, state) == 'Flee cannot be used in PvP'
+    mage.current_mp = 0
+    state = CharacterState.from_character(mage)
+    assert validate_action({'type': 'black_magic', 'name': 'Fire'}, state) == 'Not enough MP for Fire'
+
+def test_unknown_skill_loses_the_turn():
+    battle = Battle(Character.from_template('warrior'), seed=1)
+    battle.start_battle()
+    assert not battle.take_turn({'type': 'abilities', 'name': 'Steal'})
+    assert battle.battle_log.entries()[-1] == ('unknown_skill', ('Steal',))
+
+def new_client(app_module, character_type):
+    client = app_module.app.test_client()
+    assert client.post('/select_character', data={'character_type': character_type}).status_code == 200
+    return client
+
+def test_match_flow(start_app):
+    app_module = start_app()
+    host = new_client(app_module, 'mage')
+    challenger = new_client(app_module, 'warrior')
+    match_id = host.post('/api/pvp').get_json()['match_id']
+    # Nothing to act on until a challenger joins
+    assert host.post(f'/api/pvp/{match_id}/action', json=ATTACK).status_code == 409
+    joined = challenger.post(f'/api/pvp/{match_id}/join').get_json()
+    assert (joined['side'], joined['started']) == ('enemy', True)
+    outsider = new_client(app_module, 'rogue')
+    assert outsider.post(f'/api/pvp/{match_id}/join').status_code == 409
+    assert outsider.get(f'/api/pvp/{match_id}').status_code == 403
+    # The warrior cannot cast the mage's spells
+    assert challenger.post(f'/api/pvp/{match_id}/action', json={'type': 'black_magic', 'name': 'Fire'}).status_code == 400
+
+    version = joined['version']
+    for _ in range(200):
+        assert host.post(f'/api/pvp/{match_id}/action', json=ATTACK).status_code == 200
+        assert challenger.post(f'/api/pvp/{match_id}/action', json=ATTACK).status_code == 200
+        host_view = host.get(f'/api/pvp/{match_id}?since={version}').get_json()
+        assert host_view['version'] == version + 1
+        version = host_view['version']
+        if host_view['battle_over']:
+            break
+    challenger_view = challenger.get(f'/api/pvp/{match_id}?since={version - 1}').get_json()
+    assert challenger_view['battle_over']
+    assert host_view['state']['victory'] != challenger_view['state']['victory']
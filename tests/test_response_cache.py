@@ -0,0 +1,59 @@
+"""Precomputed responses: ETags, 304s and the encoding picked from Accept-Encoding."""
+
+import gzip
+
+import pytest
+from flask import Flask, request
+
+import response_cache
+from response_cache import PrecomputedResponse
+
+BODY = b'{"items":[' + b','.join(b'"Potion"' for _ in range(200)) + b']}'
+
+@pytest.fixture
+def app():
+    return Flask(__name__)
+
+def respond(app, cached, headers):
+    with app.test_request_context(headers=headers):
+        return cached.respond(request, app.response_class)
+
+def test_matching_etag_gets_a_304(app):
+    cached = PrecomputedResponse(BODY, 'application/json')
+    response = respond(app, cached, {'If-None-Match': f'"{cached.etag}"'})
+    assert response.status_code == 304
+    assert response.get_data() == b''
+    assert response.headers['ETag'] == f'"{cached.etag}"'
+    assert respond(app, cached, {'If-None-Match': '"stale"'}).status_code == 200
+
+def test_encoding_follows_accept_encoding(app, monkeypatch):
+    monkeypatch.setattr(response_cache, 'brotli', None)
+    cached = PrecomputedResponse(BODY, 'application/json', cache_control='no-cache')
+    plain = respond(app, cached, {})
+    assert plain.get_data() == BODY and 'Content-Encoding' not in plain.headers
+    compressed = respond(app, cached, {'Accept-Encoding': 'br, gzip'})
+    assert compressed.headers['Content-Encoding'] == 'gzip'
+    assert gzip.decompress(compressed.get_data()) == BODY
+    assert compressed.headers['Cache-Control'] == 'no-cache'
+    assert 'Accept-Encoding' in compressed.headers['Vary']
+    refused = respond(app, cached, {'Accept-Encoding': 'gzip;q=0'})
+    assert 'Content-Encoding' not in refused.headers
+
+def test_brotli_is_preferred_when_installed(app):
+    if response_cache.brotli is None:
+        pytest.skip('brotli is not installed')
+    response = respond(app, PrecomputedResponse(BODY, 'application/json'), {'Accept-Encoding': 'gzip, br'})
+    assert response.headers['Content-Encoding'] == 'br'
+
+def test_bodies_that_do_not_shrink_are_served_uncompressed(app):
+    cached = PrecomputedResponse(b'{}', 'application/json')
+    assert cached.bodies == {}
+    assert 'Content-Encoding' not in respond(app, cached, {'Accept-Encoding': 'gzip'}).headers
+
+def test_catalog_endpoint_revalidates(start_app):
+    client = start_app().app.test_client()
+    response = client.get('/api/catalog/items', headers={'Accept-Encoding': 'gzip'})
+    assert response.status_code == 200 and response.headers['Content-Encoding'] == 'gzip'
+    etag = response.headers['ETag']
+    assert client.get('/api/catalog/items', headers={'If-None-Match': etag}).status_code == 304
+    assert client.get('/api/catalog/nothing').status_code == 404
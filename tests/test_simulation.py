@@ -0,0 +1,44 @@
+"""Batch simulation: round counts, shared-memory merging and worker failures."""
+
+import pytest
+
+from game_logic import simulation
+from game_logic.battle import Battle
+from game_logic.character import Character
+from game_logic.policies import auto_battle
+from game_logic.simulation import COUNTER_FIELDS, SharedResultCollector, run_simulations
+
+@pytest.mark.parametrize('seed', range(6))
+def test_turns_count_rounds_played(seed):
+    battle = Battle(Character.from_template('warrior'), seed=seed)
+    summary = auto_battle(battle)
+    player_actions = sum(1 for event in battle.journal.events
+                         if event['type'] == 'action' and event['actor'] == 'player')
+    assert summary['turns'] == player_actions
+
+def test_merge_sums_worker_rows():
+    collector = SharedResultCollector(3)
+    try:
+        outcomes = [
+            (0, {'enemy': 'Goblin', 'victory': True, 'turns': 4, 'damage_dealt': 50, 'damage_taken': 7, 'crits': 1}),
+            (1, {'enemy': 'Goblin', 'victory': False, 'turns': 12, 'damage_dealt': 30, 'damage_taken': 90, 'crits': 0}),
+            (2, {'enemy': 'Wolf', 'victory': True, 'turns': 6, 'damage_dealt': 60, 'damage_taken': 5, 'crits': 2}),
+            (2, {'enemy': 'Goblin', 'victory': True, 'turns': 5, 'damage_dealt': 55, 'damage_taken': 9, 'crits': 0}),
+        ]
+        for worker, result in outcomes:
+            collector.record(worker, 'warrior', result)
+        merged = collector.merge()
+    finally:
+        collector.close()
+    goblin = merged[('warrior', 'Goblin')]
+    assert [goblin[field] for field in COUNTER_FIELDS] == [3, 2, 21, 135, 106, 1]
+    assert goblin['turn_histogram'][:3] == [1, 1, 1]
+    assert merged[('warrior', 'Wolf')]['battles'] == 1
+    assert len(merged) == 2
+
+def test_crashed_worker_raises(monkeypatch):
+    def crash(*args, **kwargs):
+        raise RuntimeError('boom')
+    monkeypatch.setattr(simulation, 'simulate_battle', crash)
+    with pytest.raises(RuntimeError, match='exited with code 1'):
+        run_simulations(1, character_types=('warrior',), num_workers=2, seed=1)
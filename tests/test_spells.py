@@ -0,0 +1,40 @@
+"""Buff and guard white magic on the modifier and status pipelines."""
+
+from game_logic.battle import Battle
+from game_logic.character import Character
+from game_logic.spells.base import Status
+
+def start_battle():
+    player = Character.from_template('mage')
+    player.white_magic = ['Haste', 'Slow', 'Protect', 'Shell']
+    player.current_mp = player.max_mp = 999
+    battle = Battle(player, seed=1)
+    battle.start_battle()
+    return battle
+
+def cast(battle, spell_name):
+    assert battle.take_turn({'type': 'white_magic', 'name': spell_name})
+
+def test_haste_scales_agility_for_three_rounds_without_stacking():
+    battle = start_battle()
+    agility = battle.player.stat('agility')
+    cast(battle, 'Haste')
+    assert battle.player.stat('agility') == int(agility * 1.5)
+    cast(battle, 'Haste')  # Recasting refreshes nothing and does not stack
+    assert battle.player.stat('agility') == int(agility * 1.5)
+    cast(battle, 'Protect')
+    assert battle.player.stat('agility') == agility
+
+def test_slow_targets_the_enemy():
+    battle = start_battle()
+    agility = battle.enemy.stat('agility')
+    cast(battle, 'Slow')
+    assert battle.enemy.stat('agility') == int(agility * 0.5)
+
+def test_protect_and_shell_are_timed_guards():
+    battle = start_battle()
+    cast(battle, 'Protect')
+    cast(battle, 'Shell')
+    statuses = {effect.status: effect.duration for effect in battle.player.status_effects}
+    assert statuses == {Status.PROTECT: 1, Status.SHELL: 2}
+    assert ('mitigated', (battle.player.name, 'protect')) in battle.battle_log.entries()
@@ -0,0 +1,33 @@
+"""Concurrent seeded battles end exactly as they do on a single thread."""
+
+import sys
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from game_logic.character_templates import CHARACTER_TEMPLATES
+from game_logic.policies import make_policy
+from game_logic.simulation import simulate_battle
+
+BATTLES = 400
+CLASS_NAMES = tuple(CHARACTER_TEMPLATES)
+POLICY = make_policy('strongest_spell')
+
+def run_battle(seed):
+    character_type = CLASS_NAMES[seed % len(CLASS_NAMES)]
+    return simulate_battle(character_type, level=1 + seed % 20, seed=seed, policy=POLICY)
+
+@pytest.fixture
+def frequent_switches():
+    """Switch threads far more often than the default, so battles interleave mid-turn."""
+    interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    yield
+    sys.setswitchinterval(interval)
+
+@pytest.mark.parametrize('threads', [2, 8])
+def test_concurrent_battles_match_single_threaded_results(frequent_switches, threads):
+    expected = [run_battle(seed) for seed in range(BATTLES)]
+    with ThreadPoolExecutor(threads) as pool:
+        outcomes = list(pool.map(run_battle, range(BATTLES)))
+    assert outcomes == expected